@@ -1,28 +1,41 @@
 import csv
 import logging
 import warnings
-from io import BytesIO, StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
-from typing import Set, Union
+from typing import Iterable, Optional, Set, TextIO, Union
 
 from docling_core.types.doc import DoclingDocument, DocumentOrigin, TableCell, TableData
 
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
+from docling.datamodel.backend_options import CsvBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
 
 _log = logging.getLogger(__name__)
 
+# Maximum number of characters read to detect the CSV dialect in streaming mode
+_SNIFF_SIZE = 64 * 1024
+
 
 class CsvDocumentBackend(DeclarativeDocumentBackend):
     content: StringIO
 
-    def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
-        super().__init__(in_doc, path_or_stream)
+    def __init__(
+        self,
+        in_doc: "InputDocument",
+        path_or_stream: Union[BytesIO, Path],
+        options: CsvBackendOptions = CsvBackendOptions(),
+    ):
+        super().__init__(in_doc, path_or_stream, options)
+        self.options: CsvBackendOptions
 
         # Load content
         try:
-            if isinstance(self.path_or_stream, BytesIO):
+            if self.options.streaming:
+                # the rows are read from the source in convert()
+                pass
+            elif isinstance(self.path_or_stream, BytesIO):
                 self.content = StringIO(self.path_or_stream.getvalue().decode("utf-8"))
             elif isinstance(self.path_or_stream, Path):
                 self.content = StringIO(self.path_or_stream.read_text("utf-8"))
@@ -54,8 +67,56 @@ class CsvDocumentBackend(DeclarativeDocumentBackend):
         Parses the CSV data into a structured document model.
         """
 
+        # Parse the CSV into a structured document model
+        origin = DocumentOrigin(
+            filename=self.file.name or "file.csv",
+            mimetype="text/csv",
+            binary_hash=self.document_hash,
+        )
+
+        doc = DoclingDocument(name=self.file.stem or "file.csv", origin=origin)
+
+        if not self.is_valid():
+            raise RuntimeError(
+                f"Cannot convert doc with {self.document_hash} because the backend failed to init."
+            )
+
+        if not self.options.streaming:
+            dialect = self._detect_dialect(self.content.readline())
+
+            # Parce CSV
+            self.content.seek(0)
+            result = csv.reader(self.content, dialect=dialect, strict=True)
+            self.csv_data = list(result)
+            _log.info(f"Detected {len(self.csv_data)} lines")
+            self._add_tables(doc, self.csv_data)
+
+            return doc
+
+        text: TextIO
+        if isinstance(self.path_or_stream, BytesIO):
+            self.path_or_stream.seek(0)
+            text = TextIOWrapper(self.path_or_stream, encoding="utf-8", newline="")
+        elif isinstance(self.path_or_stream, Path):
+            text = self.path_or_stream.open(encoding="utf-8", newline="")
+        try:
+            dialect = self._detect_dialect(text.readline(_SNIFF_SIZE))
+            text.seek(0)
+            self._add_tables(doc, csv.reader(text, dialect=dialect, strict=True))
+        finally:
+            if isinstance(text, TextIOWrapper) and isinstance(
+                self.path_or_stream, BytesIO
+            ):
+                # keep the underlying stream open
+                text.detach()
+            else:
+                text.close()
+
+        return doc
+
+    @staticmethod
+    def _detect_dialect(head: str) -> type[csv.Dialect]:
         # Detect CSV dialect
-        head = self.content.readline()
         dialect = csv.Sniffer().sniff(head, ",;\t|:")
         _log.info(f'Parsing CSV with delimiter: "{dialect.delimiter}"')
         if dialect.delimiter not in {",", ";", "\t", "|", ":"}:
@@ -63,63 +124,79 @@ class CsvDocumentBackend(DeclarativeDocumentBackend):
                 f"Cannot convert csv with unknown delimiter {dialect.delimiter}."
             )
 
-        # Parce CSV
-        self.content.seek(0)
-        result = csv.reader(self.content, dialect=dialect, strict=True)
-        self.csv_data = list(result)
-        _log.info(f"Detected {len(self.csv_data)} lines")
+        return dialect
+
+    def _add_tables(self, doc: DoclingDocument, rows: Iterable[list[str]]) -> None:
+        """Add the CSV rows to the document as tables.
+
+        The rows are consumed one at a time. Unless the number of cells per table is
+        limited in the backend options, all the rows are added to a single table.
+        """
+        max_cells: Optional[int] = self.options.max_cells_per_table
+        header: list[str] = []
+        table_cells: list[TableCell] = []
+        num_rows: int = 0
+        num_cols: int = 0
+        num_lines: int = 0
+        is_uniform: bool = True
+
+        for row in rows:
+            if num_lines == 0:
+                header = row
+            elif len(row) != len(header):
+                is_uniform = False
+            num_lines += 1
+
+            if (
+                max_cells is not None
+                and num_rows > 1
+                and len(table_cells) + len(row) > max_cells
+            ):
+                self._add_table(doc, table_cells, num_rows, num_cols)
+                # each table starts with the header row
+                table_cells = self._get_row_cells(header, 0)
+                num_rows, num_cols = 1, len(header)
+            table_cells.extend(self._get_row_cells(row, num_rows))
+            num_rows += 1
+            num_cols = max(num_cols, len(row))
+
+        if num_rows > 0:
+            self._add_table(doc, table_cells, num_rows, num_cols)
+
+        if self.options.streaming:
+            _log.info(f"Detected {num_lines} lines")
 
         # Ensure uniform column length
-        expected_length = len(self.csv_data[0])
-        is_uniform = all(len(row) == expected_length for row in self.csv_data)
         if not is_uniform:
             warnings.warn(
                 f"Inconsistent column lengths detected in CSV data. "
-                f"Expected {expected_length} columns, but found rows with varying lengths. "
+                f"Expected {len(header)} columns, but found rows with varying lengths. "
                 f"Ensure all rows have the same number of columns."
             )
 
-        # Parse the CSV into a structured document model
-        origin = DocumentOrigin(
-            filename=self.file.name or "file.csv",
-            mimetype="text/csv",
-            binary_hash=self.document_hash,
-        )
-
-        doc = DoclingDocument(name=self.file.stem or "file.csv", origin=origin)
-
-        if self.is_valid():
-            # Convert CSV data to table
-            if self.csv_data:
-                num_rows = len(self.csv_data)
-                num_cols = max(len(row) for row in self.csv_data)
-
-                table_data = TableData(
-                    num_rows=num_rows,
-                    num_cols=num_cols,
-                    table_cells=[],
-                )
-
-                # Convert each cell to TableCell
-                for row_idx, row in enumerate(self.csv_data):
-                    for col_idx, cell_value in enumerate(row):
-                        cell = TableCell(
-                            text=str(cell_value),
-                            row_span=1,  # CSV doesn't support merged cells
-                            col_span=1,
-                            start_row_offset_idx=row_idx,
-                            end_row_offset_idx=row_idx + 1,
-                            start_col_offset_idx=col_idx,
-                            end_col_offset_idx=col_idx + 1,
-                            column_header=row_idx == 0,  # First row as header
-                            row_header=False,
-                        )
-                        table_data.table_cells.append(cell)
-
-                doc.add_table(data=table_data)
-        else:
-            raise RuntimeError(
-                f"Cannot convert doc with {self.document_hash} because the backend failed to init."
+    @staticmethod
+    def _get_row_cells(row: list[str], row_idx: int) -> list[TableCell]:
+        # Convert each cell to TableCell
+        return [
+            TableCell(
+                text=str(cell_value),
+                row_span=1,  # CSV doesn't support merged cells
+                col_span=1,
+                start_row_offset_idx=row_idx,
+                end_row_offset_idx=row_idx + 1,
+                start_col_offset_idx=col_idx,
+                end_col_offset_idx=col_idx + 1,
+                column_header=row_idx == 0,  # First row as header
+                row_header=False,
             )
-
-        return doc
+            for col_idx, cell_value in enumerate(row)
+        ]
+
+    @staticmethod
+    def _add_table(
+        doc: DoclingDocument, table_cells: list[TableCell], num_rows: int, num_cols: int
+    ) -> None:
+        table_data = TableData(
+            num_rows=num_rows, num_cols=num_cols, table_cells=table_cells
+        )
+        doc.add_table(data=table_data)
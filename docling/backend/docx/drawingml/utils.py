@@ -103,29 +103,55 @@ def crop_whitespace(image: Image.Image, bg_color=None, padding=0) -> Image.Image
         return image
 
 
-def get_pil_from_dml_docx(
-    docx: Document, converter: Optional[Callable]
-) -> Optional[Image.Image]:
+def get_pils_from_dml_docx(
+    docx: Document, converter: Optional[Callable], max_pages: Optional[int] = None
+) -> list[Image.Image]:
+    """Render the pages of a DOCX document holding DrawingML elements.
+
+    The whole document is exported to PDF with a single converter invocation, and
+    each PDF page is rendered to an image cropped to its content.
+
+    Args:
+        docx: The DOCX document to render.
+        converter: A DOCX to PDF conversion function.
+        max_pages: The maximum number of pages to render. All pages are rendered if
+            not set.
+
+    Returns:
+        The rendered page images, in page order.
+    """
     if converter is None:
-        return None
+        return []
 
     temp_dir = Path(mkdtemp())
     temp_docx = Path(temp_dir / "drawing_only.docx")
     temp_pdf = Path(temp_dir / "drawing_only.pdf")
 
-    # 1) Save docx temporarily
-    docx.save(str(temp_docx))
+    images: list[Image.Image] = []
+    try:
+        # 1) Save docx temporarily
+        docx.save(str(temp_docx))
+
+        # 2) Export to PDF
+        converter(temp_docx, temp_pdf)
 
-    # 2) Export to PDF
-    converter(temp_docx, temp_pdf)
+        # 3) Load PDF pages as PNG
+        pdf = pypdfium2.PdfDocument(temp_pdf)
+        num_pages = len(pdf) if max_pages is None else min(len(pdf), max_pages)
+        for page_idx in range(num_pages):
+            page = pdf[page_idx]
+            images.append(crop_whitespace(page.render(scale=2).to_pil()))
+            page.close()
+        pdf.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
-    # 3) Load PDF as PNG
-    pdf = pypdfium2.PdfDocument(temp_pdf)
-    page = pdf[0]
-    image = crop_whitespace(page.render(scale=2).to_pil())
-    page.close()
-    pdf.close()
+    return images
 
-    shutil.rmtree(temp_dir, ignore_errors=True)
 
-    return image
+def get_pil_from_dml_docx(
+    docx: Document, converter: Optional[Callable]
+) -> Optional[Image.Image]:
+    images = get_pils_from_dml_docx(docx, converter, max_pages=1)
+
+    return images[0] if images else None
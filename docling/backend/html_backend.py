@@ -40,6 +40,7 @@ from docling.datamodel.backend_options import HTMLBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
 from docling.exceptions import OperationNotAllowed
+from docling.utils.remote_fetcher import RemoteFetcher
 
 _log = logging.getLogger(__name__)
 
@@ -106,6 +107,31 @@ _PARA_BREAKERS = {
 
 _CODE_TAG_SET: Final = {"code", "kbd", "samp"}
 
+# Typical Unicode characters in HTML worth replacing for text processing
+_UNICODE_CLEANUP_TABLE: Final = str.maketrans(
+    {
+        "\u00a0": " ",  # non-breaking space
+        "\u200b": "",  # zero-width space
+        "\u200c": "",  # zero-width non-joiner
+        "\u200d": "",  # zero-width joiner
+        "\u2010": "-",  # hyphen
+        "\u2011": "-",  # non-breaking hyphen
+        "\u2012": "-",  # dash
+        "\u2013": "-",  # dash
+        "\u2014": "-",  # dash
+        "\u2015": "-",  # horizontal bar
+        "\u2018": "'",  # left single quotation mark
+        "\u2019": "'",  # right single quotation mark
+        "\u201c": '"',  # left double quotation mark
+        "\u201d": '"',  # right double quotation mark
+        "\u2026": "...",  # ellipsis
+        "\u00ad": "",  # soft hyphen
+        "\ufeff": "",  # zero width non-break space
+        "\u202f": " ",  # narrow non-break space
+        "\u2060": "",  # word joiner
+    }
+)
+
 _FORMAT_TAG_MAP: Final = {
     "b": {"bold": True},
     "strong": {"bold": True},
@@ -250,6 +276,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             self.parents[i] = None
         self.hyperlink: Union[AnyUrl, Path, None] = None
         self.format_tags: list[str] = []
+        self.fetcher: Optional[RemoteFetcher] = None
 
         try:
             raw = (
@@ -257,7 +284,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                 if isinstance(path_or_stream, BytesIO)
                 else Path(path_or_stream).read_bytes()
             )
-            self.soup = BeautifulSoup(raw, "html.parser")
+            self.soup = BeautifulSoup(raw, self.options.parser)
         except Exception as e:
             raise RuntimeError(
                 "Could not initialize HTML backend for file with "
@@ -308,12 +335,12 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                 orig=title_text,
                 content_layer=ContentLayer.FURNITURE,
             )
-        # remove script and style tags
-        for tag in self.soup(["script", "noscript", "style"]):
-            tag.decompose()
-        # remove any hidden tag
-        for tag in self.soup(hidden=True):
-            tag.decompose()
+        # remove script and style tags, and any hidden tag
+        for tag in self.soup.find_all(
+            lambda t: t.name in {"script", "noscript", "style"} or t.has_attr("hidden")
+        ):
+            if not tag.decomposed:
+                tag.decompose()
         # fix flow content that is not permitted inside <p>
         HTMLDocumentBackend._fix_invalid_paragraph_structure(self.soup)
 
@@ -340,9 +367,51 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         )
         # reset context
         self.ctx = _Context()
-        self._walk(content, doc)
+        self.fetcher = self._create_fetcher()
+        try:
+            if self.fetcher is not None and self.options.fetch_workers > 1:
+                self.fetcher.prefetch(self._get_remote_image_locations(content))
+            self._walk(content, doc)
+        finally:
+            if self.fetcher is not None:
+                self.fetcher.close()
+                self.fetcher = None
         return doc
 
+    def _create_fetcher(self) -> Optional[RemoteFetcher]:
+        """Create a fetcher for the remote images, if any fetch option is set."""
+        if not (
+            self.options.fetch_images
+            and self.options.enable_remote_fetch
+            and (
+                self.options.fetch_workers > 1
+                or self.options.fetch_timeout is not None
+                or self.options.fetch_cache_dir is not None
+            )
+        ):
+            return None
+
+        return RemoteFetcher(
+            max_workers=self.options.fetch_workers,
+            timeout=self.options.fetch_timeout,
+            cache_dir=self.options.fetch_cache_dir,
+        )
+
+    def _get_remote_image_locations(self, content: Tag) -> list[str]:
+        """Collect the resolved locations of the remote images in the content."""
+        locations: list[str] = []
+        for img_tag in content.find_all("img"):
+            src_loc = self._get_attr_as_string(img_tag, "src")
+            if not src_loc:
+                continue
+            src_loc = self._resolve_relative_path(src_loc)
+            if HTMLDocumentBackend._is_remote_url(
+                src_loc
+            ) and not src_loc.lower().endswith(".svg"):
+                locations.append(src_loc)
+
+        return locations
+
     @staticmethod
     def _fix_invalid_paragraph_structure(soup: BeautifulSoup) -> None:
         """Rewrite <p> elements that contain block-level breakers.
@@ -371,7 +440,9 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                     new_nodes.remove(current_p)
             current_p = None
 
-        paragraphs = soup.select(f"p:has({','.join(tag for tag in _PARA_BREAKERS)})")
+        paragraphs = [
+            p for p in soup.find_all("p") if p.find(_PARA_BREAKERS) is not None
+        ]
 
         for p in paragraphs:
             parent = p.parent
@@ -1351,7 +1422,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                 img = Image.open(BytesIO(img_data))
                 return ImageRef.from_pil(img, dpi=int(img.info.get("dpi", (72,))[0]))
         except (
-            requests.HTTPError,
+            requests.RequestException,
             ValidationError,
             UnidentifiedImageError,
             OperationNotAllowed,
@@ -1373,6 +1444,8 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                     "Fetching remote resources is only allowed when set explicitly. "
                     "Set options.enable_remote_fetch=True."
                 )
+            if self.fetcher is not None:
+                return self.fetcher.fetch(src_loc)
             response = requests.get(src_loc, stream=True)
             response.raise_for_status()
             return response.content
@@ -1439,31 +1512,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         Returns:
             The sanitized text without typical Unicode characters.
         """
-        replacements = {
-            "\u00a0": " ",  # non-breaking space
-            "\u200b": "",  # zero-width space
-            "\u200c": "",  # zero-width non-joiner
-            "\u200d": "",  # zero-width joiner
-            "\u2010": "-",  # hyphen
-            "\u2011": "-",  # non-breaking hyphen
-            "\u2012": "-",  # dash
-            "\u2013": "-",  # dash
-            "\u2014": "-",  # dash
-            "\u2015": "-",  # horizontal bar
-            "\u2018": "'",  # left single quotation mark
-            "\u2019": "'",  # right single quotation mark
-            "\u201c": '"',  # left double quotation mark
-            "\u201d": '"',  # right double quotation mark
-            "\u2026": "...",  # ellipsis
-            "\u00ad": "",  # soft hyphen
-            "\ufeff": "",  # zero width non-break space
-            "\u202f": " ",  # narrow non-break space
-            "\u2060": "",  # word joiner
-        }
-        for raw, clean in replacements.items():
-            text = text.replace(raw, clean)
-
-        return text
+        return text.translate(_UNICODE_CLEANUP_TABLE)
 
     @staticmethod
     def _get_cell_spans(cell: Tag) -> tuple[int, int]:
@@ -1,3 +1,4 @@
+import inspect
 import logging
 from io import BytesIO
 from pathlib import Path
@@ -22,6 +23,9 @@ from openpyxl import load_workbook
 from openpyxl.chartsheet.chartsheet import Chartsheet
 from openpyxl.drawing.image import Image
 from openpyxl.drawing.spreadsheet_drawing import TwoCellAnchor
+from openpyxl.workbook.workbook import Workbook
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.worksheet import Worksheet
 from PIL import Image as PILImage
 from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
@@ -38,6 +42,31 @@ from docling.datamodel.document import InputDocument
 
 _log = logging.getLogger(__name__)
 
+# The rows of the read-only worksheets are streamed with the worksheet parser of
+# openpyxl, which is not part of its public API. The read-only mode falls back to
+# the default mode if it changes.
+try:
+    from openpyxl.worksheet._reader import WorkSheetParser
+except ImportError:  # pragma: no cover
+    WorkSheetParser = None  # type: ignore[assignment,misc]
+
+
+def _can_stream_sheets(workbook: Workbook) -> bool:
+    """Whether the openpyxl internals used to stream the worksheets are available."""
+    if WorkSheetParser is None:
+        return False
+    parser_params = inspect.signature(WorkSheetParser).parameters
+    return (
+        {"date_formats", "timedelta_formats"} <= parser_params.keys()
+        and hasattr(workbook, "_date_formats")
+        and hasattr(workbook, "_timedelta_formats")
+        and all(
+            hasattr(sheet, "_get_source") and hasattr(sheet, "_shared_strings")
+            for sheet in workbook.worksheets
+            if isinstance(sheet, ReadOnlyWorksheet)
+        )
+    )
+
 
 @dataclass
 class DataRegion:
@@ -100,6 +129,74 @@ class ExcelTable(BaseModel):
     data: list[ExcelCell]
 
 
+class _MergedCellIndex:
+    """Index of the merged cell ranges of a worksheet by their row intervals.
+
+    Each range is stored once, in a centered interval tree over its rows, so the
+    memory grows with the number of ranges and not with the number of cells they
+    cover. The ranges covering the last looked up row are cached, since the table
+    scans look up consecutive cells of the same row.
+    """
+
+    def __init__(self, merged_ranges: list[CellRange]) -> None:
+        self._root = self._build(list(enumerate(merged_ranges)))
+        self._row: Optional[int] = None
+        self._row_ranges: list[tuple[int, CellRange]] = []
+
+    @classmethod
+    def _build(cls, ranges: list[tuple[int, CellRange]]) -> Optional[tuple]:
+        if not ranges:
+            return None
+        bounds = sorted(r.min_row for _, r in ranges)
+        center = bounds[len(ranges) // 2]
+        left = [item for item in ranges if item[1].max_row < center]
+        right = [item for item in ranges if item[1].min_row > center]
+        overlapping = [
+            item for item in ranges if item[1].min_row <= center <= item[1].max_row
+        ]
+        return (
+            center,
+            sorted(overlapping, key=lambda item: item[1].min_row),
+            sorted(overlapping, key=lambda item: -item[1].max_row),
+            cls._build(left),
+            cls._build(right),
+        )
+
+    def _ranges_at_row(self, row: int) -> list[tuple[int, CellRange]]:
+        """Return the ranges covering a row, in the order they were given."""
+        found: list[tuple[int, CellRange]] = []
+        node = self._root
+        while node is not None:
+            center, by_min_row, by_max_row, left, right = node
+            if row < center:
+                for item in by_min_row:
+                    if item[1].min_row > row:
+                        break
+                    found.append(item)
+                node = left
+            elif row > center:
+                for item in by_max_row:
+                    if item[1].max_row < row:
+                        break
+                    found.append(item)
+                node = right
+            else:
+                found.extend(by_min_row)
+                break
+        found.sort(key=lambda item: item[0])
+        return found
+
+    def get(self, row: int, col: int) -> Optional[CellRange]:
+        """Return the merged range covering a cell (1-based index), if any."""
+        if row != self._row:
+            self._row = row
+            self._row_ranges = self._ranges_at_row(row)
+        for _, merged_range in self._row_ranges:
+            if merged_range.min_col <= col <= merged_range.max_col:
+                return merged_range
+        return None
+
+
 class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBackend):
     """Backend for parsing Excel workbooks.
 
@@ -110,6 +207,10 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
     between each other, they will be parsed as two different tables.
     - Images, parsed as PictureItem objects.
 
+    If the `read_only` option is enabled, the workbook is opened in openpyxl read-only
+    mode and the worksheet rows are streamed lazily, keeping only the non-empty cell
+    values in memory. Images are not available in this mode.
+
     The DoclingDocument tables and pictures have their provenance information, including
     the position in their original Excel worksheet. The position is represented by a
     bounding box object with the cell indices as units (0-based index). The size of this
@@ -142,17 +243,21 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         for i in range(-1, self.max_levels):
             self.parents[i] = None
 
+        self.read_only = (
+            isinstance(self.options, MsExcelBackendOptions) and self.options.read_only
+        )
+
         self.workbook = None
         try:
-            if isinstance(self.path_or_stream, BytesIO):
-                self.workbook = load_workbook(
-                    filename=self.path_or_stream, data_only=True
-                )
-
-            elif isinstance(self.path_or_stream, Path):
-                self.workbook = load_workbook(
-                    filename=str(self.path_or_stream), data_only=True
+            self.workbook = self._load_workbook(read_only=self.read_only)
+            if self.read_only and not _can_stream_sheets(self.workbook):
+                _log.warning(
+                    "The read-only mode is not supported with this openpyxl version, "
+                    "loading the workbook in the default mode."
                 )
+                self.workbook.close()
+                self.read_only = False
+                self.workbook = self._load_workbook(read_only=False)
 
             self.valid = self.workbook is not None
         except Exception as e:
@@ -162,11 +267,29 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
                 f"MsExcelDocumentBackend could not load document with hash {self.document_hash}"
             ) from e
 
+    def _load_workbook(self, read_only: bool) -> Workbook:
+        if isinstance(self.path_or_stream, BytesIO):
+            self.path_or_stream.seek(0)
+            return load_workbook(
+                filename=self.path_or_stream, data_only=True, read_only=read_only
+            )
+        return load_workbook(
+            filename=str(self.path_or_stream), data_only=True, read_only=read_only
+        )
+
     @override
     def is_valid(self) -> bool:
         _log.debug(f"valid: {self.valid}")
         return self.valid
 
+    @override
+    def unload(self):
+        # read-only workbooks keep the underlying archive open
+        if self.read_only and self.workbook is not None:
+            self.workbook.close()
+        self.workbook = None
+        super().unload()
+
     @classmethod
     @override
     def supports_pagination(cls) -> bool:
@@ -247,7 +370,9 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         return doc
 
     def _convert_sheet(
-        self, doc: DoclingDocument, sheet: Union[Worksheet, Chartsheet]
+        self,
+        doc: DoclingDocument,
+        sheet: Union[Worksheet, ReadOnlyWorksheet, Chartsheet],
     ) -> DoclingDocument:
         """Parse an Excel worksheet and attach its structure to a DoclingDocument
 
@@ -261,13 +386,16 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         if isinstance(sheet, Worksheet):
             doc = self._find_tables_in_sheet(doc, sheet)
             doc = self._find_images_in_sheet(doc, sheet)
+        elif isinstance(sheet, ReadOnlyWorksheet):
+            doc = self._find_tables_in_sheet(doc, sheet)
+            _log.debug(f"Images are not parsed in read-only mode: {sheet.title}")
 
         # TODO: parse charts in sheet
 
         return doc
 
     def _find_tables_in_sheet(
-        self, doc: DoclingDocument, sheet: Worksheet
+        self, doc: DoclingDocument, sheet: Union[Worksheet, ReadOnlyWorksheet]
     ) -> DoclingDocument:
         """Find all tables in an Excel sheet and attach them to a DoclingDocument.
 
@@ -363,7 +491,76 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
 
         return doc
 
-    def _find_true_data_bounds(self, sheet: Worksheet) -> DataRegion:
+    def _load_sheet_cells(
+        self, sheet: Union[Worksheet, ReadOnlyWorksheet]
+    ) -> tuple[dict[tuple[int, int], Any], list[CellRange]]:
+        """Collect the non-empty cell values and the merged cell ranges of a worksheet.
+
+        In read-only mode, the worksheet XML is streamed row by row and only the
+        non-empty values are kept, so no cell object is materialized.
+
+        Args:
+            sheet: The worksheet to load.
+
+        Returns:
+            A tuple with the non-empty cell values, keyed by their (row, column)
+            coordinates (1-based index), and the merged cell ranges of the worksheet.
+        """
+        if isinstance(sheet, ReadOnlyWorksheet):
+            return self._stream_sheet_cells(sheet)
+
+        cells: dict[tuple[int, int], Any] = {
+            coord: cell.value
+            for coord, cell in sheet._cells.items()
+            if cell.value is not None
+        }
+
+        return cells, list(sheet.merged_cells.ranges)
+
+    @staticmethod
+    def _stream_sheet_cells(
+        sheet: ReadOnlyWorksheet,
+    ) -> tuple[dict[tuple[int, int], Any], list[CellRange]]:
+        """Stream the rows of a read-only worksheet.
+
+        Contrary to `ReadOnlyWorksheet.iter_rows`, rows are not padded up to the
+        dimensions declared in the worksheet, which may be inflated.
+
+        Args:
+            sheet: The read-only worksheet to stream.
+
+        Returns:
+            A tuple with the non-empty cell values, keyed by their (row, column)
+            coordinates (1-based index), and the merged cell ranges of the worksheet.
+        """
+        cells: dict[tuple[int, int], Any] = {}
+        workbook = sheet.parent
+        assert WorkSheetParser is not None
+        with sheet._get_source() as src:  # type: ignore[attr-defined]
+            parser = WorkSheetParser(
+                src,
+                sheet._shared_strings,  # type: ignore[attr-defined]
+                data_only=workbook.data_only,
+                epoch=workbook.epoch,
+                date_formats=workbook._date_formats,  # type: ignore[attr-defined]
+                timedelta_formats=workbook._timedelta_formats,  # type: ignore[attr-defined]
+            )
+            for _, row in parser.parse():
+                for cell in row:
+                    if cell["value"] is not None:
+                        cells[(cell["row"], cell["column"])] = cell["value"]
+
+        merged_ranges: list[CellRange] = []
+        if parser.merged_cells is not None:
+            merged_ranges = [
+                CellRange(merged.ref) for merged in parser.merged_cells.mergeCell
+            ]
+
+        return cells, merged_ranges
+
+    def _find_true_data_bounds(
+        self, cells: dict[tuple[int, int], Any], merged_ranges: list[CellRange]
+    ) -> DataRegion:
         """Find the true data boundaries (min/max rows and columns) in a worksheet.
 
         This function scans all cells to find the smallest rectangular region that contains
@@ -371,7 +568,8 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         row/column indices that bound the actual data region.
 
         Args:
-            sheet: The worksheet to analyze.
+            cells: The non-empty cell values of the worksheet.
+            merged_ranges: The merged cell ranges of the worksheet.
 
         Returns:
             A data region representing the smallest rectangle that covers all data and merged cells.
@@ -380,16 +578,14 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         min_row, min_col = None, None
         max_row, max_col = 0, 0
 
-        for cell in sheet._cells.values():
-            if cell.value is not None:
-                r, c = cell.row, cell.column
-                min_row = r if min_row is None else min(min_row, r)
-                min_col = c if min_col is None else min(min_col, c)
-                max_row = max(max_row, r)
-                max_col = max(max_col, c)
+        for r, c in cells:
+            min_row = r if min_row is None else min(min_row, r)
+            min_col = c if min_col is None else min(min_col, c)
+            max_row = max(max_row, r)
+            max_col = max(max_col, c)
 
         # Expand bounds to include merged cells
-        for merged in sheet.merged_cells.ranges:
+        for merged in merged_ranges:
             min_row = (
                 merged.min_row if min_row is None else min(min_row, merged.min_row)
             )
@@ -405,7 +601,27 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
 
         return DataRegion(min_row, max_row, min_col, max_col)
 
-    def _find_data_tables(self, sheet: Worksheet) -> list[ExcelTable]:
+    @staticmethod
+    def _index_merged_cells(merged_ranges: list[CellRange]) -> _MergedCellIndex:
+        """Index the merged cell ranges of a worksheet by the rows they cover.
+
+        The index is built once per worksheet, so that finding the merged range of a
+        cell does not require scanning all the merged ranges. It stores each range
+        once, so large merges such as whole-row banners do not cost memory
+        proportional to their area.
+
+        Args:
+            merged_ranges: The merged cell ranges of the worksheet.
+
+        Returns:
+            An index returning the merged cell range of a (row, column) coordinate
+            (1-based index).
+        """
+        return _MergedCellIndex(merged_ranges)
+
+    def _find_data_tables(
+        self, sheet: Union[Worksheet, ReadOnlyWorksheet]
+    ) -> list[ExcelTable]:
         """Find all compact rectangular data tables in an Excel worksheet.
 
         Args:
@@ -414,40 +630,34 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         Returns:
             A list of ExcelTable objects representing the data tables.
         """
+        cells, merged_ranges = self._load_sheet_cells(sheet)
         bounds: DataRegion = self._find_true_data_bounds(
-            sheet
+            cells, merged_ranges
         )  # The true data boundaries
+        merged_cells = self._index_merged_cells(merged_ranges)
         tables: list[ExcelTable] = []  # List to store found tables
         visited: set[tuple[int, int]] = set()  # Track already visited cells
 
-        # Limit scan to actual data bounds
-        for ri, row in enumerate(
-            sheet.iter_rows(
-                min_row=bounds.min_row,
-                max_row=bounds.max_row,
-                min_col=bounds.min_col,
-                max_col=bounds.max_col,
-                values_only=False,
-            ),
-            start=bounds.min_row - 1,
-        ):
-            for rj, cell in enumerate(row, start=bounds.min_col - 1):
-                if cell.value is None or (ri, rj) in visited:
-                    continue
-
-                # If the cell starts a new table, find its bounds
-                table_bounds, visited_cells = self._find_table_bounds(
-                    sheet, ri, rj, bounds.max_row, bounds.max_col
-                )
+        # Scan the non-empty cells in row-major order
+        for row, col in sorted(cells):
+            ri, rj = row - 1, col - 1
+            if (ri, rj) in visited:
+                continue
+
+            # If the cell starts a new table, find its bounds
+            table_bounds, visited_cells = self._find_table_bounds(
+                cells, merged_cells, ri, rj, bounds.max_row, bounds.max_col
+            )
 
-                visited.update(visited_cells)  # Mark these cells as visited
-                tables.append(table_bounds)
+            visited.update(visited_cells)  # Mark these cells as visited
+            tables.append(table_bounds)
 
         return tables
 
     def _find_table_bounds(
         self,
-        sheet: Worksheet,
+        cells: dict[tuple[int, int], Any],
+        merged_cells: _MergedCellIndex,
         start_row: int,
         start_col: int,
         max_row: int,
@@ -456,7 +666,8 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         """Determine the bounds of a compact rectangular table.
 
         Args:
-            sheet: The Excel worksheet to be parsed.
+            cells: The non-empty cell values of the worksheet.
+            merged_cells: The merged cell ranges, indexed by the rows they cover.
             start_row: The row number of the starting cell.
             start_col: The column number of the starting cell.
             max_row: Maximum row boundary from true data bounds.
@@ -467,44 +678,33 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         """
         _log.debug("find_table_bounds")
 
-        table_max_row = self._find_table_bottom(sheet, start_row, start_col, max_row)
-        table_max_col = self._find_table_right(sheet, start_row, start_col, max_col)
+        table_max_row = self._find_table_bottom(
+            cells, merged_cells, start_row, start_col, max_row
+        )
+        table_max_col = self._find_table_right(
+            cells, merged_cells, start_row, start_col, max_col
+        )
 
         # Collect the data within the bounds
         data = []
         visited_cells: set[tuple[int, int]] = set()
-        for ri, row in enumerate(
-            sheet.iter_rows(
-                min_row=start_row + 1,  # start_row is 0-based but iter_rows is 1-based
-                max_row=table_max_row + 1,
-                min_col=start_col + 1,
-                max_col=table_max_col + 1,
-                values_only=False,
-            ),
-            start_row,
-        ):
-            for rj, cell in enumerate(row, start_col):
+        for ri in range(start_row, table_max_row + 1):
+            for rj in range(start_col, table_max_col + 1):
                 # Check if the cell belongs to a merged range
                 row_span = 1
                 col_span = 1
 
-                for merged_range in sheet.merged_cells.ranges:
-                    if (
-                        merged_range.min_row <= ri + 1
-                        and ri + 1 <= merged_range.max_row
-                        and merged_range.min_col <= rj + 1
-                        and rj + 1 <= merged_range.max_col
-                    ):
-                        row_span = merged_range.max_row - merged_range.min_row + 1
-                        col_span = merged_range.max_col - merged_range.min_col + 1
-                        break
+                merged_range = merged_cells.get(ri + 1, rj + 1)
+                if merged_range is not None:
+                    row_span = merged_range.max_row - merged_range.min_row + 1
+                    col_span = merged_range.max_col - merged_range.min_col + 1
 
                 if (ri, rj) not in visited_cells:
                     data.append(
                         ExcelCell(
                             row=ri - start_row,
                             col=rj - start_col,
-                            text=str(cell.value),
+                            text=str(cells.get((ri + 1, rj + 1))),
                             row_span=row_span,
                             col_span=col_span,
                         )
@@ -526,12 +726,18 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         )
 
     def _find_table_bottom(
-        self, sheet: Worksheet, start_row: int, start_col: int, max_row: int
+        self,
+        cells: dict[tuple[int, int], Any],
+        merged_cells: _MergedCellIndex,
+        start_row: int,
+        start_col: int,
+        max_row: int,
     ) -> int:
         """Find the bottom boundary of a table.
 
         Args:
-            sheet: The Excel worksheet to be parsed.
+            cells: The non-empty cell values of the worksheet.
+            merged_cells: The merged cell ranges, indexed by the rows they cover.
             start_row: The starting row of the table.
             start_col: The starting column of the table.
             max_row: Maximum row boundary from true data bounds.
@@ -541,23 +747,11 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         """
         table_max_row: int = start_row
 
-        for ri, (cell,) in enumerate(
-            sheet.iter_rows(
-                min_row=start_row + 2,
-                max_row=max_row,
-                min_col=start_col + 1,
-                max_col=start_col + 1,
-                values_only=False,
-            ),
-            start_row + 1,
-        ):
+        for ri in range(start_row + 1, max_row):
             # Check if the cell is part of a merged range
-            merged_range = next(
-                (mr for mr in sheet.merged_cells.ranges if cell.coordinate in mr),
-                None,
-            )
+            merged_range = merged_cells.get(ri + 1, start_col + 1)
 
-            if cell.value is None and not merged_range:
+            if (ri + 1, start_col + 1) not in cells and not merged_range:
                 break  # Stop if the cell is empty and not merged
 
             # Expand table_max_row to include the merged range if applicable
@@ -569,12 +763,18 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         return table_max_row
 
     def _find_table_right(
-        self, sheet: Worksheet, start_row: int, start_col: int, max_col: int
+        self,
+        cells: dict[tuple[int, int], Any],
+        merged_cells: _MergedCellIndex,
+        start_row: int,
+        start_col: int,
+        max_col: int,
     ) -> int:
         """Find the right boundary of a table.
 
         Args:
-            sheet: The Excel worksheet to be parsed.
+            cells: The non-empty cell values of the worksheet.
+            merged_cells: The merged cell ranges, indexed by the rows they cover.
             start_row: The starting row of the table.
             start_col: The starting column of the table.
             max_col: The actual max column of the table.
@@ -584,23 +784,11 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         """
         table_max_col: int = start_col
 
-        for rj, (cell,) in enumerate(
-            sheet.iter_cols(
-                min_row=start_row + 1,
-                max_row=start_row + 1,
-                min_col=start_col + 2,
-                max_col=max_col,
-                values_only=False,
-            ),
-            start_col + 1,
-        ):
+        for rj in range(start_col + 1, max_col):
             # Check if the cell is part of a merged range
-            merged_range = next(
-                (mr for mr in sheet.merged_cells.ranges if cell.coordinate in mr),
-                None,
-            )
+            merged_range = merged_cells.get(start_row + 1, rj + 1)
 
-            if cell.value is None and not merged_range:
+            if (start_row + 1, rj + 1) not in cells and not merged_range:
                 break  # Stop if the cell is empty and not merged
 
             # Expand table_max_col to include the merged range if applicable
@@ -678,7 +866,9 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBacken
         return (right - left, bottom - top)
 
     @staticmethod
-    def _get_sheet_content_layer(sheet: Worksheet) -> Optional[ContentLayer]:
+    def _get_sheet_content_layer(
+        sheet: Union[Worksheet, ReadOnlyWorksheet, Chartsheet],
+    ) -> Optional[ContentLayer]:
         return (
             None
             if sheet.sheet_state == Worksheet.SHEETSTATE_VISIBLE
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
 from typing import Union
@@ -26,6 +27,7 @@ from docling.backend.abstract_backend import (
     DeclarativeDocumentBackend,
     PaginatedDocumentBackend,
 )
+from docling.datamodel.backend_options import MsPowerpointBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
 
@@ -33,8 +35,14 @@ _log = logging.getLogger(__name__)
 
 
 class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentBackend):
-    def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
-        super().__init__(in_doc, path_or_stream)
+    def __init__(
+        self,
+        in_doc: "InputDocument",
+        path_or_stream: Union[BytesIO, Path],
+        options: MsPowerpointBackendOptions = MsPowerpointBackendOptions(),
+    ):
+        super().__init__(in_doc, path_or_stream, options)
+        self.options: MsPowerpointBackendOptions
         self.namespaces = {
             "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
             "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
@@ -44,6 +52,8 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
         self.path_or_stream = path_or_stream
 
         self.pptx_obj = None
+        # Pictures decoded in the background, by SHA1 of the image blob
+        self.picture_refs: dict[str, Future[ImageRef]] = {}
         self.valid = False
         try:
             if isinstance(self.path_or_stream, BytesIO):
@@ -232,20 +242,42 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
                 )
         return
 
-    def handle_pictures(self, shape, parent_slide, slide_ind, doc, slide_size):
+    @staticmethod
+    def _create_image_ref(image_bytes: bytes, dpi: int) -> ImageRef:
         # Open it with PIL
+        pil_image = Image.open(BytesIO(image_bytes))
+
+        return ImageRef.from_pil(image=pil_image, dpi=dpi)
+
+    def _prefetch_pictures(self, shapes, executor: ThreadPoolExecutor) -> None:
+        for shape in shapes:
+            if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+                self._prefetch_pictures(shape.shapes, executor)
+            elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE and hasattr(shape, "image"):
+                image = shape.image
+                if image.sha1 not in self.picture_refs:
+                    im_dpi, _ = image.dpi
+                    self.picture_refs[image.sha1] = executor.submit(
+                        self._create_image_ref, image.blob, im_dpi
+                    )
+
+    def handle_pictures(self, shape, parent_slide, slide_ind, doc, slide_size):
         try:
             # Get the image bytes
             image = shape.image
-            image_bytes = image.blob
-            im_dpi, _ = image.dpi
-            pil_image = Image.open(BytesIO(image_bytes))
+            future = self.picture_refs.get(image.sha1)
+            if future is not None:
+                # pictures repeated across slides share the decoded image
+                image_ref = future.result().model_copy()
+            else:
+                im_dpi, _ = image.dpi
+                image_ref = self._create_image_ref(image.blob, im_dpi)
 
             # shape has picture
             prov = self.generate_prov(shape, slide_ind, "", slide_size)
             doc.add_picture(
                 parent=parent_slide,
-                image=ImageRef.from_pil(image=pil_image, dpi=im_dpi),
+                image=image_ref,
                 caption=None,
                 prov=prov,
             )
@@ -318,6 +350,21 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
         return
 
     def walk_linear(self, pptx_obj, doc) -> DoclingDocument:
+        if self.options.picture_workers == 1:
+            return self._walk_slides(pptx_obj, doc)
+
+        with ThreadPoolExecutor(
+            max_workers=self.options.picture_workers,
+            thread_name_prefix="docling-pptx",
+        ) as executor:
+            for slide in pptx_obj.slides:
+                self._prefetch_pictures(slide.shapes, executor)
+            try:
+                return self._walk_slides(pptx_obj, doc)
+            finally:
+                self.picture_refs.clear()
+
+    def _walk_slides(self, pptx_obj, doc) -> DoclingDocument:
         # Units of size in PPTX by default are EMU units (English Metric Units)
         slide_width = pptx_obj.slide_width
         slide_height = pptx_obj.slide_height
@@ -328,8 +375,7 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
             parents[i] = None
 
         # Loop through each slide
-        for slide_num, slide in enumerate(pptx_obj.slides):
-            slide_ind = pptx_obj.slides.index(slide)
+        for slide_ind, slide in enumerate(pptx_obj.slides):
             parent_slide = doc.add_group(
                 name=f"slide-{slide_ind}", label=GroupLabel.CHAPTER, parent=parents[0]
             )
@@ -14,6 +14,7 @@ from docling_core.types.doc import (
     ImageRef,
     ListGroup,
     NodeItem,
+    PictureItem,
     RefItem,
     RichTableCell,
     TableCell,
@@ -39,8 +40,10 @@ from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.backend.docx.drawingml.utils import (
     get_docx_to_pdf_converter,
     get_pil_from_dml_docx,
+    get_pils_from_dml_docx,
 )
 from docling.backend.docx.latex.omml import oMath2Latex
+from docling.datamodel.backend_options import MsWordBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
 
@@ -59,21 +62,42 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         "w10": "urn:schemas-microsoft-com:office:word",
         "a14": "http://schemas.microsoft.com/office/drawing/2010/main",
     }
+    _BLIP_XPATH: Final = etree.XPath(".//a:blip", namespaces=_BLIP_NAMESPACES)
+    _TXBX_XPATH: Final = etree.XPath(
+        ".//w:txbxContent|.//v:textbox//w:p", namespaces=_BLIP_NAMESPACES
+    )
+    _ALT_TXBX_XPATH: Final = etree.XPath(
+        ".//wps:txbx//w:p|.//w10:wrap//w:p|.//a:p//a:t", namespaces=_BLIP_NAMESPACES
+    )
+    _SHAPE_TEXT_XPATH: Final = etree.XPath(
+        ".//a:bodyPr/ancestor::*//a:t|.//a:txBody//a:t", namespaces=_BLIP_NAMESPACES
+    )
+    # Numbered formats include: decimal, lowerRoman, upperRoman, lowerLetter,
+    # upperLetter. Bullet formats include: bullet
+    _NUMBERED_FORMATS: Final = {
+        "decimal",
+        "lowerRoman",
+        "upperRoman",
+        "lowerLetter",
+        "upperLetter",
+        "decimalZero",
+    }
 
     @override
     def __init__(
-        self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]
+        self,
+        in_doc: "InputDocument",
+        path_or_stream: Union[BytesIO, Path],
+        options: MsWordBackendOptions = MsWordBackendOptions(),
     ) -> None:
-        super().__init__(in_doc, path_or_stream)
+        super().__init__(in_doc, path_or_stream, options)
         self.XML_KEY = (
             "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val"
         )
         self.xml_namespaces = {
             "w": "http://schemas.microsoft.com/office/word/2003/wordml"
         }
-        self.blip_xpath_expr = etree.XPath(
-            ".//a:blip", namespaces=MsWordDocumentBackend._BLIP_NAMESPACES
-        )
+        self.blip_xpath_expr = MsWordDocumentBackend._BLIP_XPATH
         # self.initialise(path_or_stream)
         # Word file:
         self.path_or_stream: Union[BytesIO, Path] = path_or_stream
@@ -89,6 +113,8 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         self.docx_to_pdf_converter: Optional[Callable] = None
         self.docx_to_pdf_converter_init = False
         self.display_drawingml_warning = True
+        # DrawingML elements pending a batched rendering, with their picture items
+        self.pending_drawingml: list[tuple[PictureItem, Any]] = []
 
         for i in range(-1, self.max_levels):
             self.parents[i] = None
@@ -112,6 +138,10 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         )
         if self.docx_obj:
             self.valid = True
+        # Level formats of the list numbering definitions, keyed by (numId, ilvl)
+        self.numbering_formats: dict[tuple[int, int], str] = (
+            self._get_numbering_formats() if self.valid else {}
+        )
 
     @override
     def is_valid(self) -> bool:
@@ -153,6 +183,8 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             assert self.docx_obj is not None
             doc, _ = self._walk_linear(self.docx_obj.element.body, doc)
             self._add_header_footer(self.docx_obj, doc)
+            if self.pending_drawingml:
+                self._render_pending_drawingml()
 
             return doc
         else:
@@ -228,28 +260,18 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             element_id = id(element)
             if element_id not in self.processed_textbox_elements:
                 # Modern Word textboxes
-                txbx_xpath = etree.XPath(
-                    ".//w:txbxContent|.//v:textbox//w:p",
-                    namespaces=MsWordDocumentBackend._BLIP_NAMESPACES,
-                )
-                textbox_elements = txbx_xpath(element)
+                textbox_elements = MsWordDocumentBackend._TXBX_XPATH(element)
 
                 # No modern textboxes found, check for alternate/legacy textbox formats
                 if not textbox_elements and tag_name in ["drawing", "pict"]:
                     # Additional checks for textboxes in DrawingML and VML formats
-                    alt_txbx_xpath = etree.XPath(
-                        ".//wps:txbx//w:p|.//w10:wrap//w:p|.//a:p//a:t",
-                        namespaces=MsWordDocumentBackend._BLIP_NAMESPACES,
-                    )
-                    textbox_elements = alt_txbx_xpath(element)
+                    textbox_elements = MsWordDocumentBackend._ALT_TXBX_XPATH(element)
 
                     # Check for shape text that's not in a standard textbox
                     if not textbox_elements:
-                        shape_text_xpath = etree.XPath(
-                            ".//a:bodyPr/ancestor::*//a:t|.//a:txBody//a:t",
-                            namespaces=MsWordDocumentBackend._BLIP_NAMESPACES,
+                        shape_text_elements = MsWordDocumentBackend._SHAPE_TEXT_XPATH(
+                            element
                         )
-                        shape_text_elements = shape_text_xpath(element)
                         if shape_text_elements:
                             # Create custom text elements from shape text
                             text_content = " ".join(
@@ -402,14 +424,22 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         for key in keys_to_reset:
             self.list_counters[key] = 0
 
-    def _is_numbered_list(self, numId: int, ilvl: int) -> bool:
-        """Check if a list is numbered based on its numFmt value."""
+    def _get_numbering_formats(self) -> dict[tuple[int, int], str]:
+        """Index the level formats of the numbering definitions in the document.
+
+        The numbering part is parsed once, instead of querying it for every list
+        paragraph.
+
+        Returns:
+            A mapping from each (numId, ilvl) pair to its numFmt value.
+        """
+        formats: dict[tuple[int, int], str] = {}
         try:
             # Access the numbering part of the document
             if not hasattr(self.docx_obj, "part") or not hasattr(
                 self.docx_obj.part, "package"
             ):
-                return False
+                return formats
 
             numbering_part = None
             # Find the numbering part
@@ -419,77 +449,54 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
                     break
 
             if numbering_part is None:
-                return False
+                return formats
 
             # Parse the numbering XML
             numbering_root = numbering_part.element
-            namespaces = {
-                "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-            }
-
-            # Find the numbering definition with the given numId
-            num_xpath = f".//w:num[@w:numId='{numId}']"
-            num_element = numbering_root.find(num_xpath, namespaces=namespaces)
-
-            if num_element is None:
-                return False
-
-            # Get the abstractNumId from the num element
-            abstract_num_id_elem = num_element.find(
-                ".//w:abstractNumId", namespaces=namespaces
-            )
-            if abstract_num_id_elem is None:
-                return False
+            w_ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+            namespaces = {"w": w_ns}
 
-            abstract_num_id = abstract_num_id_elem.get(
-                "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val"
-            )
-            if abstract_num_id is None:
-                return False
-
-            # Find the abstract numbering definition
-            abstract_num_xpath = (
-                f".//w:abstractNum[@w:abstractNumId='{abstract_num_id}']"
-            )
-            abstract_num_element = numbering_root.find(
-                abstract_num_xpath, namespaces=namespaces
-            )
-
-            if abstract_num_element is None:
-                return False
-
-            # Find the level definition for the given ilvl
-            lvl_xpath = f".//w:lvl[@w:ilvl='{ilvl}']"
-            lvl_element = abstract_num_element.find(lvl_xpath, namespaces=namespaces)
-
-            if lvl_element is None:
-                return False
-
-            # Get the numFmt element
-            num_fmt_element = lvl_element.find(".//w:numFmt", namespaces=namespaces)
-            if num_fmt_element is None:
-                return False
+            # Level formats of the abstract numbering definitions
+            abstract_formats: dict[str, dict[int, str]] = {}
+            for abstract_num in numbering_root.iterfind(
+                ".//w:abstractNum", namespaces=namespaces
+            ):
+                abstract_num_id = abstract_num.get(f"{{{w_ns}}}abstractNumId")
+                if abstract_num_id is None or abstract_num_id in abstract_formats:
+                    continue
+                levels: dict[int, str] = {}
+                for lvl in abstract_num.iterfind(".//w:lvl", namespaces=namespaces):
+                    ilvl = self._str_to_int(lvl.get(f"{{{w_ns}}}ilvl"), None)
+                    num_fmt_element = lvl.find(".//w:numFmt", namespaces=namespaces)
+                    if ilvl is None or ilvl in levels or num_fmt_element is None:
+                        continue
+                    num_fmt = num_fmt_element.get(f"{{{w_ns}}}val")
+                    if num_fmt is not None:
+                        levels[ilvl] = num_fmt
+                abstract_formats[abstract_num_id] = levels
+
+            # Map the numbering definitions to their abstract definition
+            for num in numbering_root.iterfind(".//w:num", namespaces=namespaces):
+                num_id = self._str_to_int(num.get(f"{{{w_ns}}}numId"), None)
+                abstract_num_id_elem = num.find(
+                    ".//w:abstractNumId", namespaces=namespaces
+                )
+                if num_id is None or abstract_num_id_elem is None:
+                    continue
+                abstract_num_id = abstract_num_id_elem.get(f"{{{w_ns}}}val")
+                for ilvl, num_fmt in abstract_formats.get(abstract_num_id, {}).items():
+                    formats.setdefault((num_id, ilvl), num_fmt)
 
-            num_fmt = num_fmt_element.get(
-                "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val"
-            )
+        except Exception as e:
+            _log.debug(f"Error indexing the numbering definitions: {e}")
 
-            # Numbered formats include: decimal, lowerRoman, upperRoman, lowerLetter, upperLetter
-            # Bullet formats include: bullet
-            numbered_formats = {
-                "decimal",
-                "lowerRoman",
-                "upperRoman",
-                "lowerLetter",
-                "upperLetter",
-                "decimalZero",
-            }
+        return formats
 
-            return num_fmt in numbered_formats
+    def _is_numbered_list(self, numId: int, ilvl: int) -> bool:
+        """Check if a list is numbered based on its numFmt value."""
+        num_fmt = self.numbering_formats.get((numId, ilvl))
 
-        except Exception as e:
-            _log.debug(f"Error determining if list is numbered: {e}")
-            return False
+        return num_fmt in MsWordDocumentBackend._NUMBERED_FORMATS
 
     def _get_heading_and_level(self, style_label: str) -> tuple[str, Optional[int]]:
         parts = self._split_text_and_number(style_label)
@@ -1570,13 +1577,33 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
                         elem_ref.append(p3.get_ref())
         return elem_ref
 
-    def _handle_drawingml(self, doc: DoclingDocument, drawingml_els: Any):
-        # 1) Make an empty copy of the original document
+    def _get_empty_dml_docx(self) -> DocxDocument:
+        """Make an empty copy of the original document, keeping its parts."""
         dml_doc = self.load_msword_file(self.path_or_stream, self.document_hash)
         body = dml_doc._element.body
         for child in list(body):
             body.remove(child)
 
+        return dml_doc
+
+    def _handle_drawingml(self, doc: DoclingDocument, drawingml_els: Any):
+        level = self._get_level()
+        if (
+            isinstance(self.options, MsWordBackendOptions)
+            and self.options.batch_drawingml
+        ):
+            # Add a placeholder picture, rendered with all the other drawings
+            picture = doc.add_picture(
+                parent=self.parents[level - 1],
+                caption=None,
+                content_layer=self.content_layer,
+            )
+            self.pending_drawingml.append((picture, drawingml_els))
+            return
+
+        # 1) Make an empty copy of the original document
+        dml_doc = self._get_empty_dml_docx()
+
         # 2) Add DrawingML to empty document
         new_para = dml_doc.add_paragraph()
         new_r = new_para.add_run()
@@ -1584,7 +1611,6 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             new_r._r.append(deepcopy(dml))
 
         # 3) Export DOCX->PDF->PNG and save it in DoclingDocument
-        level = self._get_level()
         try:
             pil_image = get_pil_from_dml_docx(
                 dml_doc, converter=self.docx_to_pdf_converter
@@ -1608,6 +1634,64 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
 
         return
 
+    def _render_pending_drawingml(self) -> None:
+        """Render all the pending DrawingML elements with a single conversion.
+
+        Each group of DrawingML elements is placed on its own page of an empty copy of
+        the original document, so that the rendered PDF pages can be mapped back to
+        their picture items. If the page count does not match, for instance because a
+        drawing overflows a page, the drawings are rendered one by one instead.
+        """
+        pending = self.pending_drawingml
+        self.pending_drawingml = []
+
+        # 1) Make an empty copy of the original document
+        dml_doc = self._get_empty_dml_docx()
+
+        # 2) Add each group of DrawingML elements on a new page
+        for idx, (_, drawingml_els) in enumerate(pending):
+            new_para = dml_doc.add_paragraph()
+            if idx > 0:
+                new_para.paragraph_format.page_break_before = True
+            new_r = new_para.add_run()
+            for dml in drawingml_els:
+                new_r._r.append(deepcopy(dml))
+
+        # 3) Export DOCX->PDF->PNG and attach the images to the pictures
+        pil_images: list[Optional[Image.Image]] = []
+        try:
+            pil_images.extend(
+                get_pils_from_dml_docx(dml_doc, converter=self.docx_to_pdf_converter)
+            )
+        except (UnidentifiedImageError, OSError):
+            pass
+
+        if len(pil_images) != len(pending):
+            _log.debug(
+                f"Batched DrawingML rendering returned {len(pil_images)} pages for "
+                f"{len(pending)} drawings, rendering them one by one."
+            )
+            pil_images = []
+            for _, drawingml_els in pending:
+                dml_doc = self._get_empty_dml_docx()
+                new_r = dml_doc.add_paragraph().add_run()
+                for dml in drawingml_els:
+                    new_r._r.append(deepcopy(dml))
+                try:
+                    pil_images.append(
+                        get_pil_from_dml_docx(
+                            dml_doc, converter=self.docx_to_pdf_converter
+                        )
+                    )
+                except (UnidentifiedImageError, OSError):
+                    pil_images.append(None)
+
+        for (picture, _), pil_image in zip(pending, pil_images):
+            if pil_image is None:
+                _log.warning("Warning: DrawingML image cannot be loaded by Pillow")
+                continue
+            picture.image = ImageRef.from_pil(image=pil_image, dpi=72)
+
     def _add_header_footer(self, docx_obj: DocxDocument, doc: DoclingDocument) -> None:
         """Add section headers and footers.
 
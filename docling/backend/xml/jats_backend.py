@@ -2,7 +2,7 @@ import logging
 import traceback
 from io import BytesIO
 from pathlib import Path
-from typing import Final, Optional, Union, cast
+from typing import Final, Iterable, Iterator, Optional, Union, cast
 
 from bs4 import BeautifulSoup, NavigableString, Tag
 from docling_core.types.doc import (
@@ -21,6 +21,7 @@ from typing_extensions import TypedDict, override
 
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.backend.html_backend import HTMLDocumentBackend
+from docling.datamodel.backend_options import JatsBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
 
@@ -84,13 +85,21 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
       Dataset XML Dataset.
     Journal of Open Source Software, 5(46), 1979,
     https://doi.org/10.21105/joss.01979
+
+    With the `iterparse` option, the article is parsed incrementally: the metadata
+    is extracted from the front matter once the body starts, and the children of the
+    body and back matter are released as soon as they have been converted.
     """
 
     @override
     def __init__(
-        self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]
+        self,
+        in_doc: "InputDocument",
+        path_or_stream: Union[BytesIO, Path],
+        options: JatsBackendOptions = JatsBackendOptions(),
     ) -> None:
-        super().__init__(in_doc, path_or_stream)
+        super().__init__(in_doc, path_or_stream, options)
+        self.options: JatsBackendOptions
         self.path_or_stream = path_or_stream
 
         # Initialize the root of the document hierarchy
@@ -100,9 +109,14 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
         try:
             if isinstance(self.path_or_stream, BytesIO):
                 self.path_or_stream.seek(0)
-            self.tree: etree._ElementTree = etree.parse(self.path_or_stream)
-
-            doc_info: etree.DocInfo = self.tree.docinfo
+            doc_info: etree.DocInfo
+            if self.options.iterparse:
+                # the document type is known as soon as the root element starts
+                _, root = next(etree.iterparse(self.path_or_stream, events=("start",)))
+                doc_info = root.getroottree().docinfo
+            else:
+                self.tree: etree._ElementTree = etree.parse(self.path_or_stream)
+                doc_info = self.tree.docinfo
             if doc_info.system_url and any(
                 kwd in doc_info.system_url for kwd in JATS_DTD_URL
             ):
@@ -151,6 +165,10 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
             doc = DoclingDocument(name=self.file.stem or "file", origin=origin)
             self.hlevel = 0
 
+            if self.options.iterparse:
+                self._convert_incremental(doc)
+                return doc
+
             # Get metadata XML components
             xml_components: XMLComponents = self._parse_metadata()
 
@@ -171,6 +189,67 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
 
         return doc
 
+    def _convert_incremental(self, doc: DoclingDocument) -> None:
+        if isinstance(self.path_or_stream, BytesIO):
+            self.path_or_stream.seek(0)
+        context = etree.iterparse(self.path_or_stream, events=("start", "end"))
+
+        has_metadata: bool = False
+        walked: set[str] = set()
+        for event, elem in context:
+            if event == "start" and elem.tag in ("body", "back"):
+                if elem.tag in walked:
+                    continue
+                walked.add(elem.tag)
+                if not has_metadata:
+                    # the front matter precedes the body and the back matter
+                    self.tree = elem.getroottree()
+                    self._add_metadata(doc, self._parse_metadata())
+                    has_metadata = True
+                children = JatsDocumentBackend._iter_children(context, elem)
+                if self.root:
+                    self._walk_linear(doc, self.root, elem, children)
+                else:
+                    for _ in children:
+                        pass
+                JatsDocumentBackend._release(elem)
+            elif event == "end" and has_metadata:
+                JatsDocumentBackend._release(elem)
+
+        if not has_metadata:
+            self.tree = context.root.getroottree()
+            self._add_metadata(doc, self._parse_metadata())
+
+    @staticmethod
+    def _iter_children(
+        context: Iterable[tuple[str, etree._Element]], node: etree._Element
+    ) -> Iterator[etree._Element]:
+        """Yield the children of a node as soon as they are completely parsed.
+
+        Each child is released after it has been consumed. The context must have
+        just started the node.
+        """
+        depth: int = 0
+        for event, elem in context:
+            if event == "start":
+                depth += 1
+            elif elem is node:
+                return
+            else:
+                depth -= 1
+                if depth == 0:
+                    yield elem
+                    JatsDocumentBackend._release(elem)
+
+    @staticmethod
+    def _release(node: etree._Element) -> None:
+        """Free the content of a consumed node and of its preceding siblings."""
+        node.clear(keep_tail=True)
+        parent = node.getparent()
+        if parent is not None:
+            while node.getprevious() is not None:
+                del parent[0]
+
     @staticmethod
     def _get_text(node: etree._Element, sep: Optional[str] = None) -> str:
         skip_tags = ["term", "disp-formula", "inline-formula"]
@@ -714,7 +793,11 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
         return
 
     def _walk_linear(
-        self, doc: DoclingDocument, parent: NodeItem, node: etree._Element
+        self,
+        doc: DoclingDocument,
+        parent: NodeItem,
+        node: etree._Element,
+        children: Optional[Iterable[etree._Element]] = None,
     ) -> str:
         skip_tags = ["term"]
         flush_tags = ["ack", "sec", "list", "boxed-text", "disp-formula", "fig"]
@@ -725,7 +808,7 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
             else ""
         )
 
-        for child in list(node):
+        for child in list(node) if children is None else children:
             stop_walk: bool = False
 
             # flush text into TextItem for some tags in paragraph nodes
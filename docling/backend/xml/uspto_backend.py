@@ -14,7 +14,7 @@ from abc import ABC, abstractmethod
 from enum import Enum, unique
 from io import BytesIO
 from pathlib import Path
-from typing import Final, Optional, Union
+from typing import Final, Iterable, Iterator, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 from docling_core.types.doc import (
@@ -27,6 +27,7 @@ from docling_core.types.doc import (
     TextItem,
 )
 from docling_core.types.doc.document import LevelNumber
+from docling_core.types.io import DocumentStream
 from pydantic import NonNegativeInt
 from typing_extensions import Self, TypedDict, override
 
@@ -68,22 +69,83 @@ class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
         self.parser: Optional[PatentUspto] = None
 
         try:
+            lines: list[str] = []
             if isinstance(self.path_or_stream, BytesIO):
+                self.path_or_stream.seek(0)
                 while line := self.path_or_stream.readline().decode("utf-8"):
                     if line.startswith("<!DOCTYPE") or line == "PATN\n":
                         self._set_parser(line)
-                    self.patent_content += line
+                    lines.append(line)
             elif isinstance(self.path_or_stream, Path):
                 with open(self.path_or_stream, encoding="utf-8") as file_obj:
                     while line := file_obj.readline():
                         if line.startswith("<!DOCTYPE") or line == "PATN\n":
                             self._set_parser(line)
-                        self.patent_content += line
+                        lines.append(line)
+            self.patent_content = "".join(lines)
         except Exception as exc:
             raise RuntimeError(
                 f"Could not initialize USPTO backend for file with hash {self.document_hash}."
             ) from exc
 
+    @staticmethod
+    def split_bulk(
+        path_or_stream: Union[BytesIO, Path], name: Optional[str] = None
+    ) -> Iterator[DocumentStream]:
+        """Split a USPTO bulk file into individual patents.
+
+        The weekly bulk files of the USPTO concatenate thousands of patents, either as
+        XML documents, each starting with an XML declaration, or as APS records, each
+        starting with a `PATN` line. The file is read line by line and each patent is
+        yielded as soon as it is complete, so that the whole file is never loaded in
+        memory. The streams can be passed to `DocumentConverter.convert_all` to get
+        one conversion result per patent.
+
+        Args:
+            path_or_stream: The path or stream of the bulk file.
+            name: The base name of the yielded streams. If not set, the file name
+                is used for paths, and `file.xml` for streams.
+
+        Returns:
+            An iterator over the individual patents, named after the base name and
+            their (1-based) position in the bulk file.
+        """
+        if name is None:
+            name = (
+                path_or_stream.name if isinstance(path_or_stream, Path) else "file.xml"
+            )
+        stem, suffix = Path(name).stem, Path(name).suffix
+
+        def _is_patent_start(line: bytes) -> bool:
+            return line.startswith(b"<?xml") or line.rstrip(b"\r\n") == b"PATN"
+
+        def _iter_patents(lines: Iterable[bytes]) -> Iterator[DocumentStream]:
+            patent_lines: list[bytes] = []
+            count = 0
+            for line in lines:
+                if _is_patent_start(line) and patent_lines:
+                    count += 1
+                    yield DocumentStream(
+                        name=f"{stem}_{count}{suffix}",
+                        stream=BytesIO(b"".join(patent_lines)),
+                    )
+                    patent_lines = []
+                # skip any file header before the first patent
+                if patent_lines or _is_patent_start(line):
+                    patent_lines.append(line)
+            if patent_lines:
+                count += 1
+                yield DocumentStream(
+                    name=f"{stem}_{count}{suffix}",
+                    stream=BytesIO(b"".join(patent_lines)),
+                )
+
+        if isinstance(path_or_stream, BytesIO):
+            yield from _iter_patents(path_or_stream)
+        else:
+            with open(path_or_stream, "rb") as file_obj:
+                yield from _iter_patents(file_obj)
+
     def _set_parser(self, doctype: str) -> None:
         doctype_line = doctype.lower()
         if doctype == "PATN\n":
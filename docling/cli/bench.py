@@ -0,0 +1,132 @@
+import logging
+import warnings
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+
+warnings.filterwarnings(action="ignore", category=UserWarning, module="pydantic|torch")
+warnings.filterwarnings(action="ignore", category=FutureWarning, module="easyocr")
+
+console = Console()
+err_console = Console(stderr=True)
+
+
+def bench(
+    inputs: Annotated[
+        Optional[list[Path]],
+        typer.Argument(
+            help="Additional documents to convert in the benchmark.",
+            exists=True,
+        ),
+    ] = None,
+    fixtures_dir: Annotated[
+        Optional[Path],
+        typer.Option(
+            ...,
+            help="The tests/data directory of a docling checkout, providing the bundled fixtures. Default: tests/data, if it exists in the working directory.",
+        ),
+    ] = None,
+    synthetic: Annotated[
+        bool,
+        typer.Option(..., help="Include the synthetic documents in the benchmark."),
+    ] = True,
+    synthetic_size: Annotated[
+        int,
+        typer.Option(..., help="Size of the synthetic documents.", min=1),
+    ] = 50,
+    repeat: Annotated[
+        int,
+        typer.Option(..., help="Number of times each document is converted.", min=1),
+    ] = 1,
+    ocr: Annotated[
+        bool,
+        typer.Option(
+            ..., help="If enabled, the bitmap content will be processed using OCR."
+        ),
+    ] = True,
+    tables: Annotated[
+        bool,
+        typer.Option(..., help="If enabled, the table structure model will be used."),
+    ] = True,
+    device: Annotated[
+        AcceleratorDevice, typer.Option(..., help="Accelerator device")
+    ] = AcceleratorDevice.AUTO,
+    num_threads: Annotated[int, typer.Option(..., help="Number of threads")] = 4,
+    artifacts_path: Annotated[
+        Optional[Path],
+        typer.Option(..., help="If provided, the location of the model artifacts."),
+    ] = None,
+    output: Annotated[
+        Optional[Path],
+        typer.Option(
+            ...,
+            "-o",
+            "--output",
+            help="The JSON file where to write the report. Default: standard output.",
+        ),
+    ] = None,
+    verbose: Annotated[
+        int,
+        typer.Option(
+            "--verbose",
+            "-v",
+            count=True,
+            help="Set the verbosity level. -v for info logging, -vv for debug logging.",
+        ),
+    ] = 0,
+):
+    """Benchmark the conversion pipelines on synthetic and bundled documents."""
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
+    from docling.document_converter import PdfFormatOption
+    from docling.utils.benchmark import (
+        bundled_fixtures,
+        run_benchmark,
+        synthetic_fixtures,
+    )
+
+    if verbose == 1:
+        logging.basicConfig(level=logging.INFO)
+    elif verbose >= 2:
+        logging.basicConfig(level=logging.DEBUG)
+
+    if fixtures_dir is None and Path("tests/data").is_dir():
+        fixtures_dir = Path("tests/data")
+
+    sources: list = list(inputs or [])
+    if fixtures_dir is not None:
+        sources.extend(bundled_fixtures(fixtures_dir))
+    if synthetic:
+        sources.extend(synthetic_fixtures(size=synthetic_size))
+    if not sources:
+        err_console.print("[red]Error: No documents to benchmark.[/red]")
+        raise typer.Abort()
+
+    pipeline_options = ThreadedPdfPipelineOptions(
+        do_ocr=ocr,
+        do_table_structure=tables,
+        artifacts_path=artifacts_path,
+        accelerator_options=AcceleratorOptions(num_threads=num_threads, device=device),
+    )
+    report = run_benchmark(
+        sources,
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        },
+        repeat=repeat,
+    )
+
+    report_json = report.model_dump_json(indent=2)
+    if output is None:
+        typer.echo(report_json)
+    else:
+        output.write_text(report_json, encoding="utf-8")
+        console.print(
+            f"Converted {len(report.documents)} documents, {report.num_pages} pages "
+            f"in {report.total_time:.2f} sec: {report.pages_per_second:.2f} pages/sec. "
+            f"Report written to {output}."
+        )
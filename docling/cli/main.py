@@ -1,59 +1,35 @@
 import datetime
+import fnmatch
 import importlib
+import json
 import logging
+import os
 import platform
 import re
 import sys
 import tempfile
 import time
 import warnings
+from collections import deque
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Annotated, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Annotated, Dict, List, Optional, Type
 
 import rich.table
 import typer
-from docling_core.transforms.serializer.html import (
-    HTMLDocSerializer,
-    HTMLOutputStyle,
-    HTMLParams,
-)
-from docling_core.transforms.visualizer.layout_visualizer import LayoutVisualizer
 from docling_core.types.doc import ImageRefMode
 from docling_core.utils.file import resolve_source_to_path
 from pydantic import TypeAdapter
 from rich.console import Console
 
-from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
-from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
-from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
-from docling.backend.image_backend import ImageDocumentBackend
-from docling.backend.mets_gbs_backend import MetsGbsDocumentBackend
-from docling.backend.pdf_backend import PdfDocumentBackend
-from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-from docling.datamodel import vlm_model_specs
+# Only the modules needed to declare the CLI are imported here. The backends,
+# pipelines and models are imported when a conversion needs them, to keep the
+# startup time short.
+from docling.datamodel import asr_model_specs
 from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from docling.datamodel.asr_model_specs import (
-    WHISPER_BASE,
-    WHISPER_BASE_MLX,
-    WHISPER_BASE_NATIVE,
-    WHISPER_LARGE,
-    WHISPER_LARGE_MLX,
-    WHISPER_LARGE_NATIVE,
-    WHISPER_MEDIUM,
-    WHISPER_MEDIUM_MLX,
-    WHISPER_MEDIUM_NATIVE,
-    WHISPER_SMALL,
-    WHISPER_SMALL_MLX,
-    WHISPER_SMALL_NATIVE,
-    WHISPER_TINY,
-    WHISPER_TINY_MLX,
-    WHISPER_TINY_NATIVE,
-    WHISPER_TURBO,
-    WHISPER_TURBO_MLX,
-    WHISPER_TURBO_NATIVE,
-    AsrModelType,
-)
+from docling.datamodel.asr_model_specs import AsrModelType
 from docling.datamodel.backend_options import PdfBackendOptions
 from docling.datamodel.base_models import (
     ConversionStatus,
@@ -61,7 +37,6 @@ from docling.datamodel.base_models import (
     InputFormat,
     OutputFormat,
 )
-from docling.datamodel.document import ConversionResult, DoclingVersion
 from docling.datamodel.pipeline_options import (
     AsrPipelineOptions,
     ConvertPipelineOptions,
@@ -80,32 +55,28 @@ from docling.datamodel.pipeline_options import (
 )
 from docling.datamodel.settings import settings
 from docling.datamodel.vlm_model_specs import VlmModelType
-from docling.document_converter import (
-    AudioFormatOption,
-    DocumentConverter,
-    ExcelFormatOption,
-    FormatOption,
-    HTMLFormatOption,
-    MarkdownFormatOption,
-    PdfFormatOption,
-    PowerpointFormatOption,
-    WordFormatOption,
+from docling.models.factories import get_ocr_factory
+from docling.utils.manifest import ConversionManifest
+from docling.utils.profiling import (
+    ProfilingFormat,
+    ProfilingItem,
+    to_chrome_trace,
+    to_prometheus,
 )
-from docling.models.factories import (
-    get_layout_factory,
-    get_ocr_factory,
-    get_table_structure_factory,
-)
-from docling.models.factories.base_factory import BaseFactory
-from docling.pipeline.asr_pipeline import AsrPipeline
-from docling.pipeline.vlm_pipeline import VlmPipeline
-from docling.utils.profiling import ProfilingItem
+
+if TYPE_CHECKING:
+    from docling.backend.pdf_backend import PdfDocumentBackend
+    from docling.datamodel.document import ConversionResult
+    from docling.document_converter import FormatOption
+    from docling.models.factories.base_factory import BaseFactory
 
 warnings.filterwarnings(action="ignore", category=UserWarning, module="pydantic|torch")
 warnings.filterwarnings(action="ignore", category=FutureWarning, module="easyocr")
 
 _log = logging.getLogger(__name__)
 
+MANIFEST_FILENAME = "docling_manifest.jsonl"
+
 console = Console()
 err_console = Console(stderr=True)
 
@@ -166,6 +137,8 @@ def logo_callback(value: bool):
 
 def version_callback(value: bool):
     if value:
+        from docling.datamodel.document import DoclingVersion
+
         v = DoclingVersion()
         print(f"Docling version: {v.docling_version}")
         print(f"Docling Core version: {v.docling_core_version}")
@@ -178,11 +151,16 @@ def version_callback(value: bool):
 
 def show_external_plugins_callback(value: bool):
     if value:
+        from docling.models.factories import (
+            get_layout_factory,
+            get_table_structure_factory,
+        )
+
         ocr_factory_all = get_ocr_factory(allow_external_plugins=True)
         layout_factory_all = get_layout_factory(allow_external_plugins=True)
         table_factory_all = get_table_structure_factory(allow_external_plugins=True)
 
-        def print_external_plugins(factory: BaseFactory, factory_name: str):
+        def print_external_plugins(factory: "BaseFactory", factory_name: str):
             table = rich.table.Table(title=f"Available {factory_name} engines")
             table.add_column("Name", justify="right")
             table.add_column("Plugin")
@@ -203,8 +181,8 @@ def show_external_plugins_callback(value: bool):
         raise typer.Exit()
 
 
-def export_documents(
-    conv_results: Iterable[ConversionResult],
+def _export_document(
+    conv_res: "ConversionResult",
     output_dir: Path,
     export_json: bool,
     export_yaml: bool,
@@ -217,142 +195,272 @@ def export_documents(
     print_timings: bool,
     export_timings: bool,
     image_export_mode: ImageRefMode,
+    timings_formats: Optional[List[ProfilingFormat]] = None,
 ):
-    success_count = 0
-    failure_count = 0
-
-    for conv_res in conv_results:
-        if conv_res.status == ConversionStatus.SUCCESS:
-            success_count += 1
-            doc_filename = conv_res.input.file.stem
-
-            # Export JSON format:
-            if export_json:
-                fname = output_dir / f"{doc_filename}.json"
-                _log.info(f"writing JSON output to {fname}")
-                conv_res.document.save_as_json(
-                    filename=fname, image_mode=image_export_mode
-                )
+    doc_filename = conv_res.input.file.stem
+
+    # Export JSON format:
+    if export_json:
+        fname = output_dir / f"{doc_filename}.json"
+        _log.info(f"writing JSON output to {fname}")
+        conv_res.document.save_as_json(filename=fname, image_mode=image_export_mode)
+
+    # Export YAML format:
+    if export_yaml:
+        fname = output_dir / f"{doc_filename}.yaml"
+        _log.info(f"writing YAML output to {fname}")
+        conv_res.document.save_as_yaml(filename=fname, image_mode=image_export_mode)
+
+    # Export HTML format:
+    if export_html:
+        fname = output_dir / f"{doc_filename}.html"
+        _log.info(f"writing HTML output to {fname}")
+        conv_res.document.save_as_html(
+            filename=fname, image_mode=image_export_mode, split_page_view=False
+        )
 
-            # Export YAML format:
-            if export_yaml:
-                fname = output_dir / f"{doc_filename}.yaml"
-                _log.info(f"writing YAML output to {fname}")
-                conv_res.document.save_as_yaml(
-                    filename=fname, image_mode=image_export_mode
-                )
+    # Export HTML format:
+    if export_html_split_page:
+        fname = output_dir / f"{doc_filename}.html"
+        _log.info(f"writing HTML output to {fname}")
+        if show_layout:
+            from docling_core.transforms.serializer.html import (
+                HTMLDocSerializer,
+                HTMLOutputStyle,
+                HTMLParams,
+            )
+            from docling_core.transforms.visualizer.layout_visualizer import (
+                LayoutVisualizer,
+            )
 
-            # Export HTML format:
-            if export_html:
-                fname = output_dir / f"{doc_filename}.html"
-                _log.info(f"writing HTML output to {fname}")
-                conv_res.document.save_as_html(
-                    filename=fname, image_mode=image_export_mode, split_page_view=False
-                )
+            ser = HTMLDocSerializer(
+                doc=conv_res.document,
+                params=HTMLParams(
+                    image_mode=image_export_mode,
+                    output_style=HTMLOutputStyle.SPLIT_PAGE,
+                ),
+            )
+            visualizer = LayoutVisualizer()
+            visualizer.params.show_label = False
+            ser_res = ser.serialize(
+                visualizer=visualizer,
+            )
+            with open(fname, "w") as fw:
+                fw.write(ser_res.text)
+        else:
+            conv_res.document.save_as_html(
+                filename=fname,
+                image_mode=image_export_mode,
+                split_page_view=True,
+            )
 
-            # Export HTML format:
-            if export_html_split_page:
-                fname = output_dir / f"{doc_filename}.html"
-                _log.info(f"writing HTML output to {fname}")
-                if show_layout:
-                    ser = HTMLDocSerializer(
-                        doc=conv_res.document,
-                        params=HTMLParams(
-                            image_mode=image_export_mode,
-                            output_style=HTMLOutputStyle.SPLIT_PAGE,
-                        ),
-                    )
-                    visualizer = LayoutVisualizer()
-                    visualizer.params.show_label = False
-                    ser_res = ser.serialize(
-                        visualizer=visualizer,
-                    )
-                    with open(fname, "w") as fw:
-                        fw.write(ser_res.text)
-                else:
-                    conv_res.document.save_as_html(
-                        filename=fname,
-                        image_mode=image_export_mode,
-                        split_page_view=True,
-                    )
+    # Export Text format:
+    if export_txt:
+        fname = output_dir / f"{doc_filename}.txt"
+        _log.info(f"writing TXT output to {fname}")
+        conv_res.document.save_as_markdown(
+            filename=fname,
+            strict_text=True,
+            image_mode=ImageRefMode.PLACEHOLDER,
+        )
 
-            # Export Text format:
-            if export_txt:
-                fname = output_dir / f"{doc_filename}.txt"
-                _log.info(f"writing TXT output to {fname}")
-                conv_res.document.save_as_markdown(
-                    filename=fname,
-                    strict_text=True,
-                    image_mode=ImageRefMode.PLACEHOLDER,
+    # Export Markdown format:
+    if export_md:
+        fname = output_dir / f"{doc_filename}.md"
+        _log.info(f"writing Markdown output to {fname}")
+        conv_res.document.save_as_markdown(filename=fname, image_mode=image_export_mode)
+
+    # Export Document Tags format:
+    if export_doctags:
+        fname = output_dir / f"{doc_filename}.doctags"
+        _log.info(f"writing Doc Tags output to {fname}")
+        conv_res.document.save_as_doctags(filename=fname)
+
+    # Print profiling timings
+    if print_timings:
+        table = rich.table.Table(title=f"Profiling Summary, {doc_filename}")
+        metric_columns = [
+            "Stage",
+            "count",
+            "total",
+            "mean",
+            "median",
+            "min",
+            "max",
+            "0.1 percentile",
+            "0.9 percentile",
+        ]
+        for col in metric_columns:
+            table.add_column(col, style="bold")
+        for stage_key, item in conv_res.timings.items():
+            col_dict = {
+                "Stage": stage_key,
+                "count": item.count,
+                "total": item.total(),
+                "mean": item.avg(),
+                "median": item.percentile(0.5),
+                "min": item.percentile(0.0),
+                "max": item.percentile(1.0),
+                "0.1 percentile": item.percentile(0.1),
+                "0.9 percentile": item.percentile(0.9),
+            }
+            row_values = [str(col_dict[col]) for col in metric_columns]
+            table.add_row(*row_values)
+
+        console.print(table)
+
+        if conv_res.stage_metrics:
+            table = rich.table.Table(title=f"Pipeline Stages, {doc_filename}")
+            stage_columns = [
+                "Stage",
+                "batches",
+                "mean batch size",
+                "process time",
+                "idle time",
+                "blocked time",
+                "throttled time",
+                "utilization",
+                "max queue depth",
+                "mean queue depth",
+                "memory high water [MB]",
+            ]
+            for col in stage_columns:
+                table.add_column(col, style="bold")
+            for stage_name, stage in conv_res.stage_metrics.items():
+                queue = stage.input_queue
+                table.add_row(
+                    stage_name,
+                    str(stage.batches),
+                    f"{stage.mean_batch_size:.2f} / {stage.batch_size}",
+                    f"{stage.process_time:.3f}",
+                    f"{stage.idle_time:.3f}",
+                    f"{stage.blocked_time:.3f}",
+                    f"{stage.throttled_time:.3f}",
+                    f"{stage.utilization:.1%}",
+                    f"{queue.max_depth} / {queue.max_size}" if queue else "",
+                    f"{queue.mean_depth:.2f}" if queue else "",
+                    f"{stage.memory_high_water / 1024**2:.1f}"
+                    if stage.memory_high_water is not None
+                    else "",
                 )
 
-            # Export Markdown format:
-            if export_md:
-                fname = output_dir / f"{doc_filename}.md"
-                _log.info(f"writing Markdown output to {fname}")
-                conv_res.document.save_as_markdown(
-                    filename=fname, image_mode=image_export_mode
-                )
+            console.print(table)
 
-            # Export Document Tags format:
-            if export_doctags:
-                fname = output_dir / f"{doc_filename}.doctags"
-                _log.info(f"writing Doc Tags output to {fname}")
-                conv_res.document.save_as_doctags(filename=fname)
-
-            # Print profiling timings
-            if print_timings:
-                table = rich.table.Table(title=f"Profiling Summary, {doc_filename}")
-                metric_columns = [
-                    "Stage",
-                    "count",
-                    "total",
-                    "mean",
-                    "median",
-                    "min",
-                    "max",
-                    "0.1 percentile",
-                    "0.9 percentile",
-                ]
-                for col in metric_columns:
-                    table.add_column(col, style="bold")
-                for stage_key, item in conv_res.timings.items():
-                    col_dict = {
-                        "Stage": stage_key,
-                        "count": item.count,
-                        "total": item.total(),
-                        "mean": item.avg(),
-                        "median": item.percentile(0.5),
-                        "min": item.percentile(0.0),
-                        "max": item.percentile(1.0),
-                        "0.1 percentile": item.percentile(0.1),
-                        "0.9 percentile": item.percentile(0.9),
-                    }
-                    row_values = [str(col_dict[col]) for col in metric_columns]
-                    table.add_row(*row_values)
-
-                console.print(table)
-
-            # Export profiling timings
-            if export_timings:
+    # Export profiling timings
+    if export_timings:
+        now = datetime.datetime.now()
+        for timings_format in timings_formats or [ProfilingFormat.JSON]:
+            if timings_format == ProfilingFormat.JSON:
                 TimingsT = TypeAdapter(dict[str, ProfilingItem])
-                now = datetime.datetime.now()
                 timings_file = Path(
                     output_dir / f"{doc_filename}-timings-{now:%Y-%m-%d_%H-%M-%S}.json"
                 )
                 with timings_file.open("wb") as fp:
                     r = TimingsT.dump_json(conv_res.timings, indent=2)
                     fp.write(r)
+            elif timings_format == ProfilingFormat.CHROME_TRACE:
+                trace_file = Path(
+                    output_dir / f"{doc_filename}-trace-{now:%Y-%m-%d_%H-%M-%S}.json"
+                )
+                trace = to_chrome_trace(
+                    conv_res.timings, process_name=conv_res.input.file.name
+                )
+                with trace_file.open("w", encoding="utf-8") as fw:
+                    json.dump(trace, fw)
+            elif timings_format == ProfilingFormat.PROMETHEUS:
+                metrics_file = Path(
+                    output_dir / f"{doc_filename}-timings-{now:%Y-%m-%d_%H-%M-%S}.prom"
+                )
+                metrics = to_prometheus(
+                    conv_res.timings, labels={"document": conv_res.input.file.name}
+                )
+                metrics_file.write_text(metrics, encoding="utf-8")
 
-        else:
-            _log.warning(f"Document {conv_res.input.file} failed to convert.")
-            if _log.isEnabledFor(logging.INFO):
-                for err in conv_res.errors:
-                    _log.info(
-                        f"  [Failure Detail] Component: {err.component_type}, "
-                        f"Module: {err.module_name}, Message: {err.error_message}"
-                    )
-            failure_count += 1
+
+def export_documents(
+    conv_results: Iterable["ConversionResult"],
+    output_dir: Path,
+    export_json: bool,
+    export_yaml: bool,
+    export_html: bool,
+    export_html_split_page: bool,
+    show_layout: bool,
+    export_md: bool,
+    export_txt: bool,
+    export_doctags: bool,
+    print_timings: bool,
+    export_timings: bool,
+    image_export_mode: ImageRefMode,
+    timings_formats: Optional[List[ProfilingFormat]] = None,
+    export_workers: int = 0,
+    manifest: Optional[ConversionManifest] = None,
+):
+    success_count = 0
+    failure_count = 0
+
+    export_document = partial(
+        _export_document,
+        output_dir=output_dir,
+        export_json=export_json,
+        export_yaml=export_yaml,
+        export_html=export_html,
+        export_html_split_page=export_html_split_page,
+        show_layout=show_layout,
+        export_md=export_md,
+        export_txt=export_txt,
+        export_doctags=export_doctags,
+        print_timings=print_timings,
+        export_timings=export_timings,
+        image_export_mode=image_export_mode,
+        timings_formats=timings_formats,
+    )
+
+    def export(conv_res: "ConversionResult") -> None:
+        export_document(conv_res)
+        # a document is recorded once its outputs are written
+        if manifest is not None:
+            manifest.record(conv_res)
+
+    # With export workers, the documents are exported in the background while the
+    # next ones are converted. The number of pending exports is bounded, so that
+    # the converted documents do not pile up in memory.
+    executor: Optional[ThreadPoolExecutor] = None
+    pending: deque[Future] = deque()
+    max_pending = 2 * export_workers
+    if export_workers > 0:
+        executor = ThreadPoolExecutor(
+            max_workers=export_workers, thread_name_prefix="docling-export"
+        )
+
+    try:
+        for conv_res in conv_results:
+            if conv_res.status == ConversionStatus.SUCCESS:
+                success_count += 1
+                if executor is None:
+                    export(conv_res)
+                    continue
+
+                while len(pending) >= max_pending or (pending and pending[0].done()):
+                    # also raises the errors of the exports
+                    pending.popleft().result()
+                pending.append(executor.submit(export, conv_res))
+            else:
+                _log.warning(f"Document {conv_res.input.file} failed to convert.")
+                if _log.isEnabledFor(logging.INFO):
+                    for err in conv_res.errors:
+                        _log.info(
+                            f"  [Failure Detail] Component: {err.component_type}, "
+                            f"Module: {err.module_name}, Message: {err.error_message}"
+                        )
+                failure_count += 1
+                if manifest is not None:
+                    manifest.record(conv_res)
+
+        while pending:
+            pending.popleft().result()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     _log.info(
         f"Processed {success_count + failure_count} docs, of which {failure_count} failed"
@@ -365,6 +473,75 @@ def _split_list(raw: Optional[str]) -> Optional[List[str]]:
     return re.split(r"[;,]", raw)
 
 
+def _matches_any(path: str, patterns: List[str]) -> bool:
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+
+def _find_input_files(
+    directory: Path,
+    formats: Iterable[InputFormat],
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+) -> List[Path]:
+    """Find the files of the given formats in a directory tree.
+
+    The tree is walked once with `os.scandir` and the files are classified by their
+    extension, regardless of its case. Symbolic links to directories are not
+    followed.
+
+    Args:
+        directory: The root of the directory tree.
+        formats: The input formats of the files to find.
+        include: If set, only the files whose path relative to the directory matches
+            one of these case-sensitive glob patterns are returned.
+        exclude: The files and directories whose path relative to the directory
+            matches one of these case-sensitive glob patterns are skipped.
+
+    Returns:
+        The paths of the files found, in a deterministic order.
+    """
+    extensions = {ext.lower() for fmt in formats for ext in FormatToExtensions[fmt]}
+
+    found: List[Path] = []
+    # directories to walk, with their path relative to the root
+    stack: List[tuple[str, str]] = [(str(directory), "")]
+    while stack:
+        current, prefix = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as err:
+            _log.warning(f"Cannot read the directory {current}: {err}")
+            continue
+
+        subdirs: List[tuple[str, str]] = []
+        for entry in entries:
+            rel_path = prefix + entry.name
+            if exclude and _matches_any(rel_path, exclude):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append((entry.path, rel_path + "/"))
+                continue
+
+            parts = entry.name.lower().split(".")
+            if len(parts) < 2 or (
+                parts[-1] not in extensions and ".".join(parts[-2:]) not in extensions
+            ):
+                continue
+            if not entry.is_file():
+                continue
+            if entry.name.startswith("~$") and parts[-1] == "docx":
+                _log.info(f"Ignoring temporary Word file: {entry.path}")
+                continue
+            if include and not _matches_any(rel_path, include):
+                continue
+            found.append(Path(entry.path))
+
+        stack.extend(reversed(subdirs))
+
+    return found
+
+
 @app.command(no_args_is_help=True)
 def convert(  # noqa: C901
     input_sources: Annotated[
@@ -383,6 +560,16 @@ def convert(  # noqa: C901
     to_formats: List[OutputFormat] = typer.Option(
         None, "--to", help="Specify output formats. Defaults to Markdown."
     ),
+    include_patterns: List[str] = typer.Option(
+        None,
+        "--include",
+        help="When a source is a directory, only convert the files whose path relative to the directory matches this glob pattern. Can be repeated.",
+    ),
+    exclude_patterns: List[str] = typer.Option(
+        None,
+        "--exclude",
+        help="When a source is a directory, skip the files and subdirectories whose path relative to the directory matches this glob pattern. Can be repeated.",
+    ),
     show_layout: Annotated[
         bool,
         typer.Option(
@@ -568,6 +755,21 @@ def convert(  # noqa: C901
         ),
     ] = None,
     num_threads: Annotated[int, typer.Option(..., help="Number of threads")] = 4,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            ...,
+            help=f"Record the conversions in the manifest file {MANIFEST_FILENAME} of the output directory, and skip the inputs which were already converted successfully and did not change since.",
+        ),
+    ] = False,
+    export_workers: Annotated[
+        int,
+        typer.Option(
+            ...,
+            min=0,
+            help="Number of background threads writing the output files, while the next documents are converted. With 0, the output files are written before converting the next document.",
+        ),
+    ] = 0,
     device: Annotated[
         AcceleratorDevice, typer.Option(..., help="Accelerator device")
     ] = AcceleratorDevice.AUTO,
@@ -598,6 +800,13 @@ def convert(  # noqa: C901
             help="If enabled, it saves the profiling summaries to json.",
         ),
     ] = False,
+    profiling_formats: Annotated[
+        Optional[List[ProfilingFormat]],
+        typer.Option(
+            "--profiling-format",
+            help="Formats of the profiling files saved with --save-profiling: the json summary, a Chrome trace-event file with the spans of each stage and page, or a Prometheus text-format snapshot. Can be repeated. Default: json.",
+        ),
+    ] = None,
 ):
     log_format = "%(asctime)s\t%(levelname)s\t%(name)s: %(message)s"
 
@@ -628,6 +837,11 @@ def convert(  # noqa: C901
     with tempfile.TemporaryDirectory() as tempdir:
         input_doc_paths: List[Path] = []
         for src in input_sources:
+            if resume and Path(src).is_file():
+                # the manifest identifies the inputs by their path, so the local
+                # files are converted in place instead of from a temporary copy
+                input_doc_paths.append(Path(src))
+                continue
             try:
                 # check if we can fetch some remote url
                 source = resolve_source_to_path(
@@ -644,26 +858,20 @@ def convert(  # noqa: C901
                 try:
                     local_path = TypeAdapter(Path).validate_python(src)
                     if local_path.exists() and local_path.is_dir():
-                        for fmt in from_formats:
-                            for ext in FormatToExtensions[fmt]:
-                                for path in local_path.glob(f"**/*.{ext}"):
-                                    if path.name.startswith("~$") and ext == "docx":
-                                        _log.info(
-                                            f"Ignoring temporary Word file: {path}"
-                                        )
-                                        continue
-                                    input_doc_paths.append(path)
-
-                                for path in local_path.glob(f"**/*.{ext.upper()}"):
-                                    if path.name.startswith("~$") and ext == "docx":
-                                        _log.info(
-                                            f"Ignoring temporary Word file: {path}"
-                                        )
-                                        continue
-                                    input_doc_paths.append(path)
+                        input_doc_paths.extend(
+                            _find_input_files(
+                                local_path,
+                                from_formats,
+                                include=include_patterns,
+                                exclude=exclude_patterns,
+                            )
+                        )
                     elif local_path.exists():
-                        if not local_path.name.startswith("~$") and ext == "docx":
-                            _log.info(f"Ignoring temporary Word file: {path}")
+                        if (
+                            local_path.name.startswith("~$")
+                            and local_path.suffix.lower() == ".docx"
+                        ):
+                            _log.info(f"Ignoring temporary Word file: {local_path}")
                             continue
                         input_doc_paths.append(local_path)
                     else:
@@ -687,6 +895,17 @@ def convert(  # noqa: C901
         export_txt = OutputFormat.TEXT in to_formats
         export_doctags = OutputFormat.DOCTAGS in to_formats
 
+        from docling.document_converter import (
+            AudioFormatOption,
+            DocumentConverter,
+            ExcelFormatOption,
+            HTMLFormatOption,
+            MarkdownFormatOption,
+            PdfFormatOption,
+            PowerpointFormatOption,
+            WordFormatOption,
+        )
+
         ocr_factory = get_ocr_factory(allow_external_plugins=allow_external_plugins)
         ocr_options: OcrOptions = ocr_factory.create_options(  # type: ignore
             kind=ocr_engine,
@@ -742,14 +961,28 @@ def convert(  # noqa: C901
 
             backend: Type[PdfDocumentBackend]
             if pdf_backend == PdfBackend.DLPARSE_V1:
+                from docling.backend.docling_parse_backend import (
+                    DoclingParseDocumentBackend,
+                )
+
                 backend = DoclingParseDocumentBackend
                 pdf_backend_options = None
             elif pdf_backend == PdfBackend.DLPARSE_V2:
+                from docling.backend.docling_parse_v2_backend import (
+                    DoclingParseV2DocumentBackend,
+                )
+
                 backend = DoclingParseV2DocumentBackend
                 pdf_backend_options = None
             elif pdf_backend == PdfBackend.DLPARSE_V4:
+                from docling.backend.docling_parse_v4_backend import (
+                    DoclingParseV4DocumentBackend,
+                )
+
                 backend = DoclingParseV4DocumentBackend  # type: ignore
             elif pdf_backend == PdfBackend.PYPDFIUM2:
+                from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+
                 backend = PyPdfiumDocumentBackend  # type: ignore
             else:
                 raise RuntimeError(f"Unexpected PDF backend type {pdf_backend}")
@@ -760,6 +993,9 @@ def convert(  # noqa: C901
                 backend_options=pdf_backend_options,
             )
 
+            from docling.backend.image_backend import ImageDocumentBackend
+            from docling.backend.mets_gbs_backend import MetsGbsDocumentBackend
+
             # METS GBS options
             mets_gbs_options = pipeline_options.model_copy()
             mets_gbs_options.do_ocr = False
@@ -805,6 +1041,9 @@ def convert(  # noqa: C901
             }
 
         elif pipeline == ProcessingPipeline.VLM:
+            from docling.datamodel import vlm_model_specs
+            from docling.pipeline.vlm_pipeline import VlmPipeline
+
             pipeline_options = VlmPipelineOptions(
                 enable_remote_services=enable_remote_services,
             )
@@ -877,45 +1116,45 @@ def convert(  # noqa: C901
 
         # Auto-selecting models (choose best implementation for hardware)
         if asr_model == AsrModelType.WHISPER_TINY:
-            asr_pipeline_options.asr_options = WHISPER_TINY
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_TINY
         elif asr_model == AsrModelType.WHISPER_SMALL:
-            asr_pipeline_options.asr_options = WHISPER_SMALL
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_SMALL
         elif asr_model == AsrModelType.WHISPER_MEDIUM:
-            asr_pipeline_options.asr_options = WHISPER_MEDIUM
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_MEDIUM
         elif asr_model == AsrModelType.WHISPER_BASE:
-            asr_pipeline_options.asr_options = WHISPER_BASE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_BASE
         elif asr_model == AsrModelType.WHISPER_LARGE:
-            asr_pipeline_options.asr_options = WHISPER_LARGE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_LARGE
         elif asr_model == AsrModelType.WHISPER_TURBO:
-            asr_pipeline_options.asr_options = WHISPER_TURBO
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_TURBO
 
         # Explicit MLX models (force MLX implementation)
         elif asr_model == AsrModelType.WHISPER_TINY_MLX:
-            asr_pipeline_options.asr_options = WHISPER_TINY_MLX
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_TINY_MLX
         elif asr_model == AsrModelType.WHISPER_SMALL_MLX:
-            asr_pipeline_options.asr_options = WHISPER_SMALL_MLX
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_SMALL_MLX
         elif asr_model == AsrModelType.WHISPER_MEDIUM_MLX:
-            asr_pipeline_options.asr_options = WHISPER_MEDIUM_MLX
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_MEDIUM_MLX
         elif asr_model == AsrModelType.WHISPER_BASE_MLX:
-            asr_pipeline_options.asr_options = WHISPER_BASE_MLX
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_BASE_MLX
         elif asr_model == AsrModelType.WHISPER_LARGE_MLX:
-            asr_pipeline_options.asr_options = WHISPER_LARGE_MLX
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_LARGE_MLX
         elif asr_model == AsrModelType.WHISPER_TURBO_MLX:
-            asr_pipeline_options.asr_options = WHISPER_TURBO_MLX
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_TURBO_MLX
 
         # Explicit Native models (force native implementation)
         elif asr_model == AsrModelType.WHISPER_TINY_NATIVE:
-            asr_pipeline_options.asr_options = WHISPER_TINY_NATIVE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_TINY_NATIVE
         elif asr_model == AsrModelType.WHISPER_SMALL_NATIVE:
-            asr_pipeline_options.asr_options = WHISPER_SMALL_NATIVE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_SMALL_NATIVE
         elif asr_model == AsrModelType.WHISPER_MEDIUM_NATIVE:
-            asr_pipeline_options.asr_options = WHISPER_MEDIUM_NATIVE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_MEDIUM_NATIVE
         elif asr_model == AsrModelType.WHISPER_BASE_NATIVE:
-            asr_pipeline_options.asr_options = WHISPER_BASE_NATIVE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_BASE_NATIVE
         elif asr_model == AsrModelType.WHISPER_LARGE_NATIVE:
-            asr_pipeline_options.asr_options = WHISPER_LARGE_NATIVE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_LARGE_NATIVE
         elif asr_model == AsrModelType.WHISPER_TURBO_NATIVE:
-            asr_pipeline_options.asr_options = WHISPER_TURBO_NATIVE
+            asr_pipeline_options.asr_options = asr_model_specs.WHISPER_TURBO_NATIVE
 
         else:
             _log.error(f"{asr_model} is not known")
@@ -923,6 +1162,8 @@ def convert(  # noqa: C901
 
         _log.debug(f"ASR pipeline_options: {asr_pipeline_options}")
 
+        from docling.pipeline.asr_pipeline import AsrPipeline
+
         audio_format_option = AudioFormatOption(
             pipeline_cls=AsrPipeline,
             pipeline_options=asr_pipeline_options,
@@ -941,6 +1182,19 @@ def convert(  # noqa: C901
 
         start_time = time.time()
 
+        manifest: Optional[ConversionManifest] = None
+        if resume:
+            output.mkdir(parents=True, exist_ok=True)
+            manifest = ConversionManifest(output / MANIFEST_FILENAME)
+            num_inputs = len(input_doc_paths)
+            input_doc_paths = [
+                path for path in input_doc_paths if not manifest.is_converted(path)
+            ]
+            _log.info(
+                f"Skipping {num_inputs - len(input_doc_paths)} inputs already "
+                f"converted according to {manifest.path}"
+            )
+
         _log.info(f"paths: {input_doc_paths}")
         conv_results = doc_converter.convert_all(
             input_doc_paths, headers=parsed_headers, raises_on_error=abort_on_error
@@ -960,7 +1214,10 @@ def convert(  # noqa: C901
             export_doctags=export_doctags,
             print_timings=profiling,
             export_timings=save_profiling,
+            timings_formats=profiling_formats,
             image_export_mode=image_export_mode,
+            export_workers=export_workers,
+            manifest=manifest,
         )
 
         end_time = time.time() - start_time
@@ -1,5 +1,6 @@
 import typer
 
+from docling.cli.bench import bench
 from docling.cli.models import app as models_app
 
 app = typer.Typer(
@@ -10,6 +11,7 @@ app = typer.Typer(
 )
 
 app.add_typer(models_app, name="models")
+app.command("bench")(bench)
 
 click_app = typer.main.get_command(app)
 
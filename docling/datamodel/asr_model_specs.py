@@ -18,31 +18,36 @@ from docling.datamodel.pipeline_options_asr_model import (
 _log = logging.getLogger(__name__)
 
 
-def _get_whisper_tiny_model():
-    """
-    Get the best Whisper Tiny model for the current hardware.
+def _use_mlx_whisper() -> bool:
+    """Check if both mlx-whisper and MPS (Apple Silicon) are available.
 
-    Automatically selects MLX Whisper Tiny for Apple Silicon (MPS) if available,
-    otherwise falls back to native Whisper Tiny.
+    The presence of mlx-whisper is checked first, to avoid importing torch on the
+    platforms where MLX is not available.
     """
+    # Check if mlx-whisper is available
+    try:
+        import mlx_whisper  # type: ignore
+    except ImportError:
+        return False
+
     # Check if MPS is available (Apple Silicon)
     try:
         import torch
 
-        has_mps = torch.backends.mps.is_built() and torch.backends.mps.is_available()
+        return torch.backends.mps.is_built() and torch.backends.mps.is_available()
     except ImportError:
-        has_mps = False
+        return False
 
-    # Check if mlx-whisper is available
-    try:
-        import mlx_whisper  # type: ignore
 
-        has_mlx_whisper = True
-    except ImportError:
-        has_mlx_whisper = False
+def _get_whisper_tiny_model():
+    """
+    Get the best Whisper Tiny model for the current hardware.
 
+    Automatically selects MLX Whisper Tiny for Apple Silicon (MPS) if available,
+    otherwise falls back to native Whisper Tiny.
+    """
     # Use MLX Whisper if both MPS and mlx-whisper are available
-    if has_mps and has_mlx_whisper:
+    if _use_mlx_whisper():
         return InlineAsrMlxWhisperOptions(
             repo_id="mlx-community/whisper-tiny-mlx",
             inference_framework=InferenceAsrFramework.MLX,
@@ -77,24 +82,8 @@ def _get_whisper_small_model():
     Automatically selects MLX Whisper Small for Apple Silicon (MPS) if available,
     otherwise falls back to native Whisper Small.
     """
-    # Check if MPS is available (Apple Silicon)
-    try:
-        import torch
-
-        has_mps = torch.backends.mps.is_built() and torch.backends.mps.is_available()
-    except ImportError:
-        has_mps = False
-
-    # Check if mlx-whisper is available
-    try:
-        import mlx_whisper  # type: ignore
-
-        has_mlx_whisper = True
-    except ImportError:
-        has_mlx_whisper = False
-
     # Use MLX Whisper if both MPS and mlx-whisper are available
-    if has_mps and has_mlx_whisper:
+    if _use_mlx_whisper():
         return InlineAsrMlxWhisperOptions(
             repo_id="mlx-community/whisper-small-mlx",
             inference_framework=InferenceAsrFramework.MLX,
@@ -129,24 +118,8 @@ def _get_whisper_medium_model():
     Automatically selects MLX Whisper Medium for Apple Silicon (MPS) if available,
     otherwise falls back to native Whisper Medium.
     """
-    # Check if MPS is available (Apple Silicon)
-    try:
-        import torch
-
-        has_mps = torch.backends.mps.is_built() and torch.backends.mps.is_available()
-    except ImportError:
-        has_mps = False
-
-    # Check if mlx-whisper is available
-    try:
-        import mlx_whisper  # type: ignore
-
-        has_mlx_whisper = True
-    except ImportError:
-        has_mlx_whisper = False
-
     # Use MLX Whisper if both MPS and mlx-whisper are available
-    if has_mps and has_mlx_whisper:
+    if _use_mlx_whisper():
         return InlineAsrMlxWhisperOptions(
             repo_id="mlx-community/whisper-medium-mlx-8bit",
             inference_framework=InferenceAsrFramework.MLX,
@@ -181,24 +154,8 @@ def _get_whisper_base_model():
     Automatically selects MLX Whisper Base for Apple Silicon (MPS) if available,
     otherwise falls back to native Whisper Base.
     """
-    # Check if MPS is available (Apple Silicon)
-    try:
-        import torch
-
-        has_mps = torch.backends.mps.is_built() and torch.backends.mps.is_available()
-    except ImportError:
-        has_mps = False
-
-    # Check if mlx-whisper is available
-    try:
-        import mlx_whisper  # type: ignore
-
-        has_mlx_whisper = True
-    except ImportError:
-        has_mlx_whisper = False
-
     # Use MLX Whisper if both MPS and mlx-whisper are available
-    if has_mps and has_mlx_whisper:
+    if _use_mlx_whisper():
         return InlineAsrMlxWhisperOptions(
             repo_id="mlx-community/whisper-base-mlx",
             inference_framework=InferenceAsrFramework.MLX,
@@ -233,24 +190,8 @@ def _get_whisper_large_model():
     Automatically selects MLX Whisper Large for Apple Silicon (MPS) if available,
     otherwise falls back to native Whisper Large.
     """
-    # Check if MPS is available (Apple Silicon)
-    try:
-        import torch
-
-        has_mps = torch.backends.mps.is_built() and torch.backends.mps.is_available()
-    except ImportError:
-        has_mps = False
-
-    # Check if mlx-whisper is available
-    try:
-        import mlx_whisper  # type: ignore
-
-        has_mlx_whisper = True
-    except ImportError:
-        has_mlx_whisper = False
-
     # Use MLX Whisper if both MPS and mlx-whisper are available
-    if has_mps and has_mlx_whisper:
+    if _use_mlx_whisper():
         return InlineAsrMlxWhisperOptions(
             repo_id="mlx-community/whisper-large-mlx-8bit",
             inference_framework=InferenceAsrFramework.MLX,
@@ -285,24 +226,8 @@ def _get_whisper_turbo_model():
     Automatically selects MLX Whisper Turbo for Apple Silicon (MPS) if available,
     otherwise falls back to native Whisper Turbo.
     """
-    # Check if MPS is available (Apple Silicon)
-    try:
-        import torch
-
-        has_mps = torch.backends.mps.is_built() and torch.backends.mps.is_available()
-    except ImportError:
-        has_mps = False
-
-    # Check if mlx-whisper is available
-    try:
-        import mlx_whisper  # type: ignore
-
-        has_mlx_whisper = True
-    except ImportError:
-        has_mlx_whisper = False
-
     # Use MLX Whisper if both MPS and mlx-whisper are available
-    if has_mps and has_mlx_whisper:
+    if _use_mlx_whisper():
         return InlineAsrMlxWhisperOptions(
             repo_id="mlx-community/whisper-turbo",
             inference_framework=InferenceAsrFramework.MLX,
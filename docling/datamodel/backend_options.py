@@ -1,7 +1,7 @@
-from pathlib import PurePath
+from pathlib import Path, PurePath
 from typing import Annotated, Literal, Optional, Union
 
-from pydantic import AnyUrl, BaseModel, Field, SecretStr
+from pydantic import AnyUrl, BaseModel, Field, PositiveInt, SecretStr
 
 
 class BaseBackendOptions(BaseModel):
@@ -48,6 +48,32 @@ class HTMLBackendOptions(BaseBackendOptions):
     infer_furniture: bool = Field(
         True, description="Infer all the content before the first header as furniture."
     )
+    parser: Literal["html.parser", "lxml"] = Field(
+        "html.parser",
+        description=(
+            "The parser used by BeautifulSoup to build the HTML tree. The `lxml` "
+            "parser is several times faster on large documents."
+        ),
+    )
+    fetch_workers: PositiveInt = Field(
+        1,
+        description=(
+            "Maximum number of concurrent workers to fetch remote images. With more "
+            "than one worker, all the remote images of a document are prefetched "
+            "concurrently before the conversion."
+        ),
+    )
+    fetch_timeout: Optional[float] = Field(
+        None, description="Timeout in seconds for fetching a remote image."
+    )
+    fetch_cache_dir: Optional[Path] = Field(
+        None,
+        description=(
+            "Directory of a content-addressed cache for the remote images, which can "
+            "be shared across documents and conversions. The cache has no size limit "
+            "and is never evicted, delete the directory to clear it."
+        ),
+    )
 
 
 class MarkdownBackendOptions(BaseBackendOptions):
@@ -88,6 +114,81 @@ class MsExcelBackendOptions(BaseBackendOptions):
             "cells) as TextItem instead of TableItem."
         ),
     )
+    read_only: bool = Field(
+        False,
+        description=(
+            "Whether to load the workbook in read-only mode. The worksheet rows are "
+            "streamed lazily and only non-empty cell values are kept in memory, which "
+            "is faster on very large workbooks. Images are not parsed in this mode. "
+            "The default mode is used if the installed openpyxl version does not "
+            "support it."
+        ),
+    )
+
+
+class MsWordBackendOptions(BaseBackendOptions):
+    """Options specific to the MS Word backend."""
+
+    kind: Literal["docx"] = Field("docx", exclude=True, repr=False)
+    batch_drawingml: bool = Field(
+        False,
+        description=(
+            "Whether to render all the DrawingML elements of a document with a single "
+            "DOCX to PDF converter invocation, instead of one invocation per element."
+        ),
+    )
+
+
+class MsPowerpointBackendOptions(BaseBackendOptions):
+    """Options specific to the MS PowerPoint backend."""
+
+    kind: Literal["pptx"] = Field("pptx", exclude=True, repr=False)
+    picture_workers: PositiveInt = Field(
+        1,
+        description=(
+            "Maximum number of concurrent workers to decode the pictures. With more "
+            "than one worker, the pictures of all the slides are decoded in the "
+            "background while the slides are walked. Identical pictures are decoded "
+            "only once."
+        ),
+    )
+
+
+class JatsBackendOptions(BaseBackendOptions):
+    """Options specific to the JATS backend."""
+
+    kind: Literal["jats"] = Field("jats", exclude=True, repr=False)
+    iterparse: bool = Field(
+        False,
+        description=(
+            "Whether to parse the article incrementally. The front matter, body and "
+            "back matter are processed as they are read, and their elements are "
+            "released once consumed, instead of building the whole XML tree in "
+            "memory."
+        ),
+    )
+
+
+class CsvBackendOptions(BaseBackendOptions):
+    """Options specific to the CSV backend."""
+
+    kind: Literal["csv"] = Field("csv", exclude=True, repr=False)
+    streaming: bool = Field(
+        False,
+        description=(
+            "Whether to read the CSV rows incrementally from the file, instead of "
+            "loading the whole content in memory. The dialect is detected from a "
+            "bounded prefix of the file."
+        ),
+    )
+    max_cells_per_table: Optional[PositiveInt] = Field(
+        None,
+        description=(
+            "Maximum number of cells in a table. If set, the rows are split into "
+            "consecutive tables with at most this number of cells, each starting with "
+            "the header row. A table has at least one row after the header."
+        ),
+    )
 
 
 BackendOptions = Annotated[
@@ -97,6 +198,10 @@ BackendOptions = Annotated[
         MarkdownBackendOptions,
         PdfBackendOptions,
         MsExcelBackendOptions,
+        MsWordBackendOptions,
+        MsPowerpointBackendOptions,
+        JatsBackendOptions,
+        CsvBackendOptions,
     ],
     Field(discriminator="kind"),
 ]
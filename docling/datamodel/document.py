@@ -53,7 +53,7 @@ from docling_core.types.legacy_doc.document import (
 )
 from docling_core.utils.file import resolve_source_to_stream
 from docling_core.utils.legacy import docling_document_to_legacy
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing_extensions import deprecated
 
 from docling.backend.abstract_backend import (
@@ -75,7 +75,8 @@ from docling.datamodel.base_models import (
     Page,
 )
 from docling.datamodel.settings import DocumentLimits
-from docling.utils.profiling import ProfilingItem
+from docling.utils.cancellation import CancellationToken
+from docling.utils.profiling import ProfilingItem, StageMetrics
 from docling.utils.utils import create_file_hash
 
 if TYPE_CHECKING:
@@ -417,6 +418,13 @@ class ConversionAssets(BaseModel):
 class ConversionResult(ConversionAssets):
     input: InputDocument
     assembled: AssembledUnit = AssembledUnit()
+    # utilization of the stages of the threaded pipelines, keyed by stage name
+    stage_metrics: dict[str, StageMetrics] = {}
+    # wall-clock time of the conversion of the document, in seconds
+    conversion_time: Optional[float] = None
+
+    # checked by the pipelines to stop the conversion early
+    _cancel_token: CancellationToken = PrivateAttr(default_factory=CancellationToken)
 
 
 class _DummyBackend(AbstractDocumentBackend):
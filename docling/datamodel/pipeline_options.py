@@ -75,6 +75,14 @@ class TableStructureOptions(BaseTableStructureOptions):
         # False: Let table structure model define the text cells, ignore PDF cells.
     )
     mode: TableFormerMode = TableFormerMode.ACCURATE
+    # Inference engine of the image encoder on CPU. With "onnxruntime", the encoder
+    # is exported to ONNX once, cached under settings.cache_dir and run with ONNX
+    # Runtime. Requires the onnxruntime and onnx packages.
+    inference_engine: Literal["torch", "onnxruntime"] = "torch"
+    # Run the linear layers with dynamic int8 quantization on CPU, i.e. the decoder
+    # of the table structure. Experimental: its accuracy against the float model is
+    # not measured yet, see docs/examples/quantized_layout_accuracy.py.
+    dynamic_quantization: bool = False
 
 
 class OcrOptions(BaseOptions):
@@ -390,6 +398,36 @@ class LayoutOptions(BaseLayoutOptions):
     kind: ClassVar[str] = "docling_layout_default"
     create_orphan_clusters: bool = True  # Whether to create clusters for orphaned cells
     model_spec: LayoutModelConfig = DOCLING_LAYOUT_HERON
+    # Inference engine of the layout model on CPU. With "onnxruntime", the model is
+    # exported to ONNX once, cached under settings.cache_dir and run with ONNX
+    # Runtime. Requires the onnxruntime and onnx packages.
+    inference_engine: Literal["torch", "onnxruntime"] = "torch"
+    # Run the linear layers of the transformer with dynamic int8 quantization on
+    # CPU, in PyTorch or in the exported graph. Experimental: its accuracy against
+    # the float model is not measured yet, see
+    # docs/examples/quantized_layout_accuracy.py.
+    dynamic_quantization: bool = False
+
+
+class PageClassifierOptions(BaseModel):
+    """Options of the page classifier, routing the simple pages to a fast path.
+
+    A page is simple when it is born-digital and has a single column of text: no
+    bitmaps, few vector lines, a good text quality and no text line split by a wide
+    horizontal gap, as in multi-column layouts and tables. Its layout is derived
+    from the text lines, without running OCR and the layout model.
+    """
+
+    # Minimum number of non-blank text cells of a simple page
+    min_cells: int = 1
+    # Maximum number of vector lines of a simple page, e.g. rulings of tables
+    max_vector_lines: int = 2
+    # Minimum parse score of a simple page, i.e. the 10% quantile of the text
+    # quality of its cells, from 0 to 1
+    min_parse_score: float = 0.9
+    # Horizontal gap between the cells of a text line, relative to the line height,
+    # above which the page is considered to have columns or tables
+    max_line_gap_ratio: float = 1.0
 
 
 class AsrPipelineOptions(PipelineOptions):
@@ -434,6 +472,11 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
 
     ### Arguments for threaded PDF pipeline with batching and backpressure control
 
+    # Classify the pages, so that the simple born-digital pages skip OCR and the
+    # layout model, and get a heuristic layout from their text lines instead
+    do_page_classification: bool = False
+    page_classifier_options: PageClassifierOptions = PageClassifierOptions()
+
     # Batch sizes for different stages
     ocr_batch_size: int = 4
     layout_batch_size: int = 4
@@ -441,9 +484,25 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
 
     # Timing control
     batch_polling_interval_seconds: float = 0.5
+    # Maximum processing time in seconds of a page in the threaded stages. A page
+    # exceeding it is marked as failed at the next stage, instead of holding the
+    # rest of the pipeline. If None, no per-page timeout is enforced.
+    page_timeout: Optional[float] = None
 
     # Backpressure and queue control
     queue_max_size: int = 100
+    # Memory budget in MB for the pages in flight, estimated from their rendered
+    # images and parsed cells. If set, no new page is admitted while the budget is
+    # exceeded. The budget is shared by the documents converted concurrently with
+    # the same pipeline. At least one page is always in flight.
+    memory_budget_mb: Optional[float] = None
+
+    # Directory where the completed pages are checkpointed. A conversion of the same
+    # document with the same options reuses the pages completed by a previous run,
+    # e.g. one interrupted by a crash or a timeout, and only processes the others.
+    # The checkpoints of a document are deleted once all its pages are converted,
+    # and kept after a timeout, a cancellation or a page failure.
+    checkpoint_dir: Optional[Path] = None
 
 
 class ProcessingPipeline(str, Enum):
@@ -1,9 +1,9 @@
+import sys
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
 
 from docling_core.types.doc.page import SegmentedPage
-from pydantic import AnyUrl, BaseModel, ConfigDict
-from transformers import StoppingCriteria
+from pydantic import AnyUrl, BaseModel, ConfigDict, field_validator
 from typing_extensions import deprecated
 
 from docling.datamodel.accelerator_options import AcceleratorDevice
@@ -98,7 +98,9 @@ class InlineVlmOptions(BaseVlmOptions):
     ]
 
     stop_strings: List[str] = []
-    custom_stopping_criteria: List[Union[StoppingCriteria, GenerationStopper]] = []
+    # instances of GenerationStopper or of transformers.StoppingCriteria, checked in
+    # the validator to avoid importing transformers with the options
+    custom_stopping_criteria: List[Any] = []
     extra_generation_config: Dict[str, Any] = {}
     extra_processor_kwargs: Dict[str, Any] = {}
 
@@ -107,6 +109,25 @@ class InlineVlmOptions(BaseVlmOptions):
     track_generated_tokens: bool = False
     track_input_prompt: bool = False
 
+    @field_validator("custom_stopping_criteria")
+    @classmethod
+    def _validate_stopping_criteria(cls, value: List[Any]) -> List[Any]:
+        # a StoppingCriteria can only be given once transformers is imported
+        transformers = sys.modules.get("transformers")
+        for criteria in value:
+            criteria_cls = criteria if isinstance(criteria, type) else type(criteria)
+            if issubclass(criteria_cls, GenerationStopper):
+                continue
+            if transformers is not None and issubclass(
+                criteria_cls, transformers.StoppingCriteria
+            ):
+                continue
+            raise ValueError(
+                "custom_stopping_criteria items must be GenerationStopper or "
+                f"transformers.StoppingCriteria instances or classes, got {criteria!r}"
+            )
+        return value
+
     @property
     def repo_cache_folder(self) -> str:
         return self.repo_id.replace("/", "--")
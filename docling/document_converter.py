@@ -1,3 +1,4 @@
+import gc
 import hashlib
 import logging
 import sys
@@ -12,7 +13,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import Optional, Type, Union
 
-from pydantic import ConfigDict, model_validator, validate_call
+from pydantic import BaseModel, ConfigDict, model_validator, validate_call
 from typing_extensions import Self
 
 from docling.backend.abstract_backend import (
@@ -35,8 +36,12 @@ from docling.backend.xml.jats_backend import JatsDocumentBackend
 from docling.backend.xml.uspto_backend import PatentUsptoDocumentBackend
 from docling.datamodel.backend_options import (
     BackendOptions,
+    CsvBackendOptions,
     HTMLBackendOptions,
+    JatsBackendOptions,
     MarkdownBackendOptions,
+    MsPowerpointBackendOptions,
+    MsWordBackendOptions,
     PdfBackendOptions,
 )
 from docling.datamodel.base_models import (
@@ -64,6 +69,8 @@ from docling.pipeline.asr_pipeline import AsrPipeline
 from docling.pipeline.base_pipeline import BasePipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.cancellation import CancellationToken
+from docling.utils.synthetic import synthetic_document
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
@@ -85,6 +92,7 @@ class FormatOption(BaseFormatOption):
 class CsvFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
     backend: Type[AbstractDocumentBackend] = CsvDocumentBackend
+    backend_options: Optional[CsvBackendOptions] = None
 
 
 class ExcelFormatOption(FormatOption):
@@ -95,11 +103,13 @@ class ExcelFormatOption(FormatOption):
 class WordFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
     backend: Type[AbstractDocumentBackend] = MsWordDocumentBackend
+    backend_options: Optional[MsWordBackendOptions] = None
 
 
 class PowerpointFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
     backend: Type[AbstractDocumentBackend] = MsPowerpointDocumentBackend
+    backend_options: Optional[MsPowerpointBackendOptions] = None
 
 
 class MarkdownFormatOption(FormatOption):
@@ -127,6 +137,7 @@ class PatentUsptoFormatOption(FormatOption):
 class XMLJatsFormatOption(FormatOption):
     pipeline_cls: Type = SimplePipeline
     backend: Type[AbstractDocumentBackend] = JatsDocumentBackend
+    backend_options: Optional[JatsBackendOptions] = None
 
 
 class ImageFormatOption(FormatOption):
@@ -175,6 +186,17 @@ def _get_default_option(format: InputFormat) -> FormatOption:
         raise RuntimeError(f"No default options configured for {format}")
 
 
+class WarmUpReport(BaseModel):
+    """Timings of the warm-up of the conversion pipelines, in seconds."""
+
+    # time to initialize the pipeline, including the model loading, per format
+    load_time: dict[InputFormat, float] = {}
+    # time of the synthetic conversion per format
+    conversion_time: dict[InputFormat, float] = {}
+    # total time of each model and stage during the synthetic conversion, per format
+    stage_times: dict[InputFormat, dict[str, float]] = {}
+
+
 class DocumentConverter:
     """Convert documents of various input formats to Docling documents.
 
@@ -247,6 +269,9 @@ class DocumentConverter:
         self.initialized_pipelines: dict[
             tuple[Type[BasePipeline], str], BasePipeline
         ] = {}
+        # tokens of the conversions in progress, cancelled by cancel()
+        self._active_tokens: set[CancellationToken] = set()
+        self._active_tokens_lock = threading.Lock()
 
     def _get_initialized_pipelines(
         self,
@@ -280,7 +305,118 @@ class DocumentConverter:
                 f"No pipeline could be initialized for format {format}"
             )
 
-    @validate_call(config=ConfigDict(strict=True))
+    def preload_for_workers(self, formats: Iterable[InputFormat]) -> None:
+        """Load the models of the given formats once, to share them with workers.
+
+        The pipelines are initialized in the current process, which can then fork
+        worker processes, e.g. with the `fork` start method of `multiprocessing`.
+        The workers reuse the cached pipelines of the converter, and the model
+        weights stay in memory pages shared copy-on-write with the parent process,
+        since inference only reads them.
+
+        Workers started with the `spawn` or `forkserver` start methods do not
+        inherit the loaded models. No conversion should run in the parent process
+        before forking, since the inference thread pools do not survive a fork.
+
+        To keep the shared pages from being copied by the garbage collector, all
+        the objects alive in the process are frozen with `gc.freeze()`: they are
+        never collected again, including unreachable cycles. Call
+        `end_preload_for_workers` in the parent once the workers are forked, so
+        that a long-lived parent process collects them again.
+
+        Args:
+            formats: The input formats whose pipelines are initialized.
+
+        Raises:
+            ConversionError: If no pipeline could be initialized for a format.
+        """
+        for fmt in formats:
+            self.initialize_pipeline(fmt)
+        # The garbage collector writes to the objects it tracks, which would copy
+        # their memory pages in each worker. The objects allocated so far, the
+        # models included, are moved to the permanent generation. No collection
+        # is run before, since the objects of the workers would then be allocated
+        # in the freed memory, copying the pages shared with the parent.
+        gc.freeze()
+
+    def end_preload_for_workers(self) -> None:
+        """Undo the garbage collector freeze of `preload_for_workers`.
+
+        To be called in the parent process once the workers are forked. The objects
+        of the parent are collected again, while the workers keep their frozen copy.
+        """
+        gc.unfreeze()
+
+    def warm_up(
+        self, formats: Iterable[InputFormat], num_pages: int = 1
+    ) -> WarmUpReport:
+        """Load the models of the given formats and run a synthetic conversion.
+
+        Besides the model loading, the first inferences pay one-off costs, e.g. the
+        weight transfer to the accelerator and the kernel compilation. A synthetic
+        document with text, a table and a picture is converted for each format, so
+        that the layout, OCR, table structure and enrichment models enabled in the
+        options have run once before the first request. The formats without models
+        and without synthetic documents are only initialized.
+
+        The stage times are collected by enabling
+        `settings.debug.profile_pipeline_timings` during the warm-up, and restoring
+        it afterwards. Since this setting is global, the warm-up must not run while
+        other conversions are in progress, which would record their timings too.
+
+        Args:
+            formats: The input formats whose pipelines are warmed up.
+            num_pages: The number of pages of the synthetic PDF documents.
+
+        Returns:
+            The load time, the conversion time and the time of each model and stage,
+            per format. A model is missing from the stage times if the synthetic
+            document has no element for it.
+
+        Raises:
+            ConversionError: If a pipeline could not be initialized or the synthetic
+                conversion failed.
+        """
+        report = WarmUpReport()
+        profile_timings = settings.debug.profile_pipeline_timings
+        settings.debug.profile_pipeline_timings = True
+        try:
+            for fmt in formats:
+                start = time.monotonic()
+                self.initialize_pipeline(fmt)
+                report.load_time[fmt] = time.monotonic() - start
+
+                source = synthetic_document(fmt, num_pages=num_pages)
+                if source is None:
+                    continue
+                start = time.monotonic()
+                conv_res = self.convert(source)
+                report.conversion_time[fmt] = time.monotonic() - start
+                report.stage_times[fmt] = {
+                    key: float(item.total()) for key, item in conv_res.timings.items()
+                }
+                _log.info(
+                    f"Warmed up the {fmt.value} pipeline in "
+                    f"{report.load_time[fmt] + report.conversion_time[fmt]:.2f} sec."
+                )
+        finally:
+            settings.debug.profile_pipeline_timings = profile_timings
+
+        return report
+
+    def cancel(self) -> None:
+        """Cancel all the conversions in progress on this converter.
+
+        The cancellation is cooperative: the pipelines stop at their next check,
+        between pages, batches or stages, and the documents not yet started are
+        not converted. To cancel a single conversion, pass a `CancellationToken`
+        to `convert` or `convert_all` and cancel it instead.
+        """
+        with self._active_tokens_lock:
+            for token in self._active_tokens:
+                token.cancel()
+
+    @validate_call(config=ConfigDict(strict=True, arbitrary_types_allowed=True))
     def convert(
         self,
         source: Union[Path, str, DocumentStream],  # TODO review naming
@@ -289,6 +425,7 @@ class DocumentConverter:
         max_num_pages: int = sys.maxsize,
         max_file_size: int = sys.maxsize,
         page_range: PageRange = DEFAULT_PAGE_RANGE,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ConversionResult:
         """Convert one document fetched from a file path, URL, or DocumentStream.
 
@@ -306,6 +443,8 @@ class DocumentConverter:
                 Documents exceeding this number will not be converted.
             max_file_size: Maximum file size to convert.
             page_range: Range of pages to convert.
+            cancel_token: Optional token to cancel the conversion from another
+                thread.
 
         Returns:
             The conversion result, which contains a `DoclingDocument` in the `document`
@@ -313,6 +452,8 @@ class DocumentConverter:
 
         Raises:
             ConversionError: An error occurred during conversion.
+            ConversionCancelled: The conversion was cancelled and
+                `raises_on_error` is True.
         """
         all_res = self.convert_all(
             source=[source],
@@ -321,10 +462,11 @@ class DocumentConverter:
             max_file_size=max_file_size,
             headers=headers,
             page_range=page_range,
+            cancel_token=cancel_token,
         )
         return next(all_res)
 
-    @validate_call(config=ConfigDict(strict=True))
+    @validate_call(config=ConfigDict(strict=True, arbitrary_types_allowed=True))
     def convert_all(
         self,
         source: Iterable[Union[Path, str, DocumentStream]],  # TODO review naming
@@ -333,6 +475,7 @@ class DocumentConverter:
         max_num_pages: int = sys.maxsize,
         max_file_size: int = sys.maxsize,
         page_range: PageRange = DEFAULT_PAGE_RANGE,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> Iterator[ConversionResult]:
         """Convert multiple documents from file paths, URLs, or DocumentStreams.
 
@@ -346,6 +489,9 @@ class DocumentConverter:
             max_file_size: Maximum number of pages accepted per document. Documents
                 exceeding this number will be skipped.
             page_range: Range of pages to convert in each document.
+            cancel_token: Optional token to cancel the conversions from another
+                thread. After the cancellation, the document in progress fails and
+                the remaining documents are not converted.
 
         Yields:
             The conversion results, each containing a `DoclingDocument` in the
@@ -353,6 +499,8 @@ class DocumentConverter:
 
         Raises:
             ConversionError: An error occurred during conversion.
+            ConversionCancelled: The conversions were cancelled and
+                `raises_on_error` is True.
         """
         limits = DocumentLimits(
             max_num_pages=max_num_pages,
@@ -362,26 +510,37 @@ class DocumentConverter:
         conv_input = _DocumentConversionInput(
             path_or_stream_iterator=source, limits=limits, headers=headers
         )
-        conv_res_iter = self._convert(conv_input, raises_on_error=raises_on_error)
+        token = cancel_token if cancel_token is not None else CancellationToken()
+        conv_res_iter = self._convert(
+            conv_input, raises_on_error=raises_on_error, cancel_token=token
+        )
 
         had_result = False
-        for conv_res in conv_res_iter:
-            had_result = True
-            if raises_on_error and conv_res.status not in {
-                ConversionStatus.SUCCESS,
-                ConversionStatus.PARTIAL_SUCCESS,
-            }:
-                error_details = ""
-                if conv_res.errors:
-                    error_messages = [err.error_message for err in conv_res.errors]
-                    error_details = f" Errors: {'; '.join(error_messages)}"
-                raise ConversionError(
-                    f"Conversion failed for: {conv_res.input.file} with status: "
-                    f"{conv_res.status}.{error_details}"
-                )
-            else:
-                yield conv_res
+        with self._active_tokens_lock:
+            self._active_tokens.add(token)
+        try:
+            for conv_res in conv_res_iter:
+                had_result = True
+                if raises_on_error and conv_res.status not in {
+                    ConversionStatus.SUCCESS,
+                    ConversionStatus.PARTIAL_SUCCESS,
+                }:
+                    error_details = ""
+                    if conv_res.errors:
+                        error_messages = [err.error_message for err in conv_res.errors]
+                        error_details = f" Errors: {'; '.join(error_messages)}"
+                    raise ConversionError(
+                        f"Conversion failed for: {conv_res.input.file} with status: "
+                        f"{conv_res.status}.{error_details}"
+                    )
+                else:
+                    yield conv_res
+        finally:
+            with self._active_tokens_lock:
+                self._active_tokens.discard(token)
 
+        if raises_on_error:
+            token.raise_if_cancelled()
         if not had_result and raises_on_error:
             raise ConversionError(
                 "Conversion failed because the provided file has no recognizable "
@@ -438,7 +597,10 @@ class DocumentConverter:
             raise ValueError(f"format {format} is not supported in `convert_string`")
 
     def _convert(
-        self, conv_input: _DocumentConversionInput, raises_on_error: bool
+        self,
+        conv_input: _DocumentConversionInput,
+        raises_on_error: bool,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> Iterator[ConversionResult]:
         start_time = time.monotonic()
 
@@ -446,9 +608,14 @@ class DocumentConverter:
             conv_input.docs(self.format_to_options),
             settings.perf.doc_batch_size,  # pass format_options
         ):
+            if cancel_token is not None and cancel_token.cancelled:
+                _log.info("Conversion cancelled, skipping the remaining documents.")
+                return
             _log.info("Going to convert document batch...")
             process_func = partial(
-                self._process_document, raises_on_error=raises_on_error
+                self._process_document,
+                raises_on_error=raises_on_error,
+                cancel_token=cancel_token,
             )
 
             if (
@@ -505,13 +672,19 @@ class DocumentConverter:
             return self.initialized_pipelines[cache_key]
 
     def _process_document(
-        self, in_doc: InputDocument, raises_on_error: bool
+        self,
+        in_doc: InputDocument,
+        raises_on_error: bool,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ConversionResult:
+        start_time = time.monotonic()
         valid = (
             self.allowed_formats is not None and in_doc.format in self.allowed_formats
         )
         if valid:
-            conv_res = self._execute_pipeline(in_doc, raises_on_error=raises_on_error)
+            conv_res = self._execute_pipeline(
+                in_doc, raises_on_error=raises_on_error, cancel_token=cancel_token
+            )
         else:
             error_message = f"File format not allowed: {in_doc.file}"
             if raises_on_error:
@@ -526,15 +699,21 @@ class DocumentConverter:
                     input=in_doc, status=ConversionStatus.SKIPPED, errors=[error_item]
                 )
 
+        conv_res.conversion_time = time.monotonic() - start_time
         return conv_res
 
     def _execute_pipeline(
-        self, in_doc: InputDocument, raises_on_error: bool
+        self,
+        in_doc: InputDocument,
+        raises_on_error: bool,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ConversionResult:
         if in_doc.valid:
             pipeline = self._get_pipeline(in_doc.format)
             if pipeline is not None:
-                conv_res = pipeline.execute(in_doc, raises_on_error=raises_on_error)
+                conv_res = pipeline.execute(
+                    in_doc, raises_on_error=raises_on_error, cancel_token=cancel_token
+                )
             else:
                 if raises_on_error:
                     raise ConversionError(
@@ -302,6 +302,7 @@ class ThreadedLayoutVlmPipeline(BasePipeline):
             for st in ctx.stages:
                 st.stop()
             ctx.output_queue.close()
+            conv_res.stage_metrics = {st.name: st.metrics() for st in ctx.stages}
 
         self._integrate_results(conv_res, proc)
         return conv_res
@@ -9,7 +9,7 @@ import numpy as np
 from docling_core.types.doc import DocItemLabel
 from PIL import Image
 
-from docling.datamodel.accelerator_options import AcceleratorOptions
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
 from docling.datamodel.base_models import BoundingBox, Cluster, LayoutPrediction, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.layout_model_specs import DOCLING_LAYOUT_V2, LayoutModelConfig
@@ -85,6 +85,51 @@ class LayoutModel(BaseLayoutModel):
             device=device,
             num_threads=accelerator_options.num_threads,
         )
+        if options.dynamic_quantization:
+            from docling.models.utils.quantization import warn_unvalidated_accuracy
+
+            warn_unvalidated_accuracy("layout")
+        if options.inference_engine == "onnxruntime":
+            self._use_onnx_runtime(
+                artifacts_path, device, accelerator_options.num_threads
+            )
+        elif options.dynamic_quantization:
+            self._quantize(device)
+
+    def _quantize(self, device: str) -> None:
+        if device != AcceleratorDevice.CPU.value:
+            _log.warning(
+                "The dynamic quantization of the layout model only runs on CPU, "
+                f"using the model in float on {device}."
+            )
+            return
+
+        from docling.models.utils.quantization import quantize_linear_layers
+
+        quantize_linear_layers(self.layout_predictor._model)
+
+    def _use_onnx_runtime(
+        self, artifacts_path: Path, device: str, num_threads: int
+    ) -> None:
+        if device != AcceleratorDevice.CPU.value:
+            _log.warning(
+                "The onnxruntime inference engine of the layout model only runs on "
+                f"CPU, using PyTorch on {device}."
+            )
+            return
+
+        from docling.models.utils.onnx_runtime import load_onnx_object_detection
+
+        predictor = self.layout_predictor
+        image_size = predictor._image_processor.size
+        predictor._model = load_onnx_object_detection(
+            predictor._model,
+            image_size=(image_size["height"], image_size["width"]),
+            name=f"layout-{self.options.model_spec.name}",
+            weights_path=artifacts_path / "model.safetensors",
+            num_threads=num_threads,
+            quantize=self.options.dynamic_quantization,
+        )
 
     @classmethod
     def get_options_type(cls) -> type[LayoutOptions]:
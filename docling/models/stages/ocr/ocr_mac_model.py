@@ -68,7 +68,7 @@ class OcrMacModel(BaseOcrModel):
             if not page._backend.is_valid():
                 yield page
             else:
-                with TimeRecorder(conv_res, "ocr"):
+                with TimeRecorder(conv_res, "ocr", page_no=page.page_no):
                     ocr_rects = self.get_ocr_rects(page)
 
                     all_ocr_cells = []
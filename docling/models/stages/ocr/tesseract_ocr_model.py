@@ -132,7 +132,7 @@ class TesseractOcrModel(BaseOcrModel):
             if not page._backend.is_valid():
                 yield page
             else:
-                with TimeRecorder(conv_res, "ocr"):
+                with TimeRecorder(conv_res, "ocr", page_no=page.page_no):
                     assert self.reader is not None
                     assert self.osd_reader is not None
                     assert self._tesserocr_languages is not None
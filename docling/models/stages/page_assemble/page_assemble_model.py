@@ -72,7 +72,7 @@ class PageAssembleModel(BasePageModel):
             if not page._backend.is_valid():
                 yield page
             else:
-                with TimeRecorder(conv_res, "page_assemble"):
+                with TimeRecorder(conv_res, "page_assemble", page_no=page.page_no):
                     assert page.predictions.layout is not None
 
                     # assembles some JSON output page by page.
@@ -0,0 +1,225 @@
+import re
+import statistics
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from docling_core.types.doc import BoundingBox, DocItemLabel
+from docling_core.types.doc.page import TextCell, TextDirection
+
+from docling.datamodel.base_models import Cluster, LayoutPrediction, Page
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import LayoutOptions, PageClassifierOptions
+from docling.models.base_model import BasePageModel
+from docling.utils.layout_postprocessor import LayoutPostprocessor
+from docling.utils.profiling import TimeRecorder
+
+# bullets and enumerations at the start of a list item
+_LIST_MARKER_RE = re.compile(r"^(?:[•·▪◦●‣∙\-–*]|\(?\d{1,3}[.)]|\(?[a-zA-Z][.)])$")  # noqa: RUF001
+# monospace and math fonts, whose code and formulas need the layout model
+_CODE_OR_MATH_FONT_RE = re.compile(
+    r"mono|courier|consola|menlo|math|symbol|cmtt|cmmi|cmsy|cmex", re.IGNORECASE
+)
+# height of the top and bottom margins, relative to the page height
+_MARGIN_RATIO = 0.12
+
+
+@dataclass
+class _TextLine:
+    cells: list[TextCell]
+    bbox: BoundingBox
+    boxes: list[BoundingBox] = field(default_factory=list)
+
+    @property
+    def height(self) -> float:
+        return self.bbox.height
+
+    @property
+    def starts_list_item(self) -> bool:
+        return len(self.cells) > 1 and bool(
+            _LIST_MARKER_RE.match(self.cells[0].text.strip())
+        )
+
+    @property
+    def text_left(self) -> float:
+        """Left of the text, after the list marker."""
+        return self.boxes[1].l if self.starts_list_item else self.bbox.l
+
+
+class PageClassifierModel(BasePageModel):
+    """Route the simple born-digital pages to a heuristic layout.
+
+    The pages with a single column of programmatic text get their layout clusters
+    from the geometry of their text lines, and the later stages skip OCR and the
+    layout model for them. The other pages are left untouched.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        options: PageClassifierOptions,
+        layout_options: LayoutOptions,
+    ):
+        self.enabled = enabled
+        self.options = options
+        self.layout_options = layout_options
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            assert page._backend is not None
+            if self.enabled and page._backend.is_valid():
+                with TimeRecorder(conv_res, "page_classifier", page_no=page.page_no):
+                    lines = self.get_simple_page_lines(conv_res, page)
+                    if lines is not None:
+                        page.predictions.layout = self.predict_layout(page, lines)
+            yield page
+
+    def get_simple_page_lines(
+        self, conv_res: ConversionResult, page: Page
+    ) -> Optional[list[_TextLine]]:
+        """Get the text lines of a page, if it is simple.
+
+        Returns:
+            The text lines from top to bottom, or None if the page needs the full
+            pipeline.
+        """
+        assert page._backend is not None
+        assert page.size is not None
+        if page.parsed_page is None:
+            return None
+        if len(page.parsed_page.lines) > self.options.max_vector_lines:
+            return None
+        if any(True for _ in page._backend.get_bitmap_rects()):
+            return None
+        parse_score = conv_res.confidence.pages[page.page_no].parse_score
+        if np.isnan(parse_score) or parse_score < self.options.min_parse_score:
+            return None
+
+        cells = [cell for cell in page.cells if cell.text.strip()]
+        if len(cells) < self.options.min_cells:
+            return None
+        if any(
+            cell.text_direction != TextDirection.LEFT_TO_RIGHT
+            or cell.from_ocr
+            or (
+                _CODE_OR_MATH_FONT_RE.search(getattr(cell, "font_name", None) or "")
+                # bullets are often drawn with a symbol font
+                and not _LIST_MARKER_RE.match(cell.text.strip())
+            )
+            for cell in cells
+        ):
+            return None
+
+        # group the cells overlapping vertically in text lines
+        boxes = [
+            cell.rect.to_bounding_box().to_top_left_origin(page.size.height)
+            for cell in cells
+        ]
+        lines: list[_TextLine] = []
+        for cell, box in sorted(zip(cells, boxes), key=lambda cb: cb[1].t):
+            line = lines[-1] if lines else None
+            if line is not None and line.bbox.y_overlap_with(box) > 0.5 * min(
+                line.height, box.height
+            ):
+                line.cells.append(cell)
+                line.boxes.append(box)
+                line.bbox = BoundingBox.enclosing_bbox([line.bbox, box])
+            else:
+                lines.append(_TextLine(cells=[cell], bbox=box, boxes=[box]))
+
+        # a wide gap inside a line reveals columns or a table
+        for line in lines:
+            order = sorted(range(len(line.cells)), key=lambda i: line.boxes[i].l)
+            line.cells = [line.cells[i] for i in order]
+            line.boxes = [line.boxes[i] for i in order]
+            max_gap = self.options.max_line_gap_ratio * line.height
+            for i in range(1, len(line.boxes)):
+                if i == 1 and line.starts_list_item:
+                    continue
+                if line.boxes[i].l - line.boxes[i - 1].r > max_gap:
+                    return None
+
+        return lines
+
+    def predict_layout(self, page: Page, lines: list[_TextLine]) -> LayoutPrediction:
+        """Build the layout of a simple page from its text lines.
+
+        The lines are grouped in paragraphs at the vertical gaps, the first-line
+        indents and the list markers. The short paragraphs in a font different from
+        the body text are section headers, and the isolated lines in the top and
+        bottom margins are page headers and footers.
+        """
+        assert page.size is not None
+        line_height = statistics.median(line.height for line in lines)
+        gaps = [lines[i].bbox.t - lines[i - 1].bbox.b for i in range(1, len(lines))]
+        max_gap = (statistics.median(gaps) if gaps else 0.0) + 0.5 * line_height
+        column_left = Counter(round(line.bbox.l) for line in lines).most_common(1)[0][0]
+        body_font = self._body_font(lines)
+
+        def is_heading(line: _TextLine) -> bool:
+            return line.height > 1.2 * line_height or all(
+                getattr(cell, "font_name", None) not in (None, body_font)
+                for cell in line.cells
+            )
+
+        blocks: list[tuple[DocItemLabel, list[_TextLine]]] = []
+        for line in lines:
+            if blocks:
+                label, block = blocks[-1]
+                prev = block[-1]
+                indent = line.bbox.l - column_left
+                new_block = (
+                    line.bbox.t - prev.bbox.b > max_gap
+                    or line.starts_list_item
+                    or is_heading(line) != is_heading(prev)
+                    # back to the column after a list item
+                    or (
+                        label == DocItemLabel.LIST_ITEM
+                        and line.bbox.l < block[0].text_left - 0.5 * line_height
+                    )
+                    # first-line indent of a paragraph
+                    or (
+                        label == DocItemLabel.TEXT
+                        and indent > 0.5 * line_height
+                        and abs(prev.bbox.l - column_left) < 0.5 * line_height
+                    )
+                )
+                if not new_block:
+                    block.append(line)
+                    continue
+            if line.starts_list_item:
+                blocks.append((DocItemLabel.LIST_ITEM, [line]))
+            else:
+                blocks.append((DocItemLabel.TEXT, [line]))
+
+        clusters: list[Cluster] = []
+        margin = _MARGIN_RATIO * page.size.height
+        for ix, (label, block) in enumerate(blocks):
+            bbox = BoundingBox.enclosing_bbox([line.bbox for line in block])
+            if label == DocItemLabel.TEXT and len(block) <= 2 and is_heading(block[0]):
+                label = DocItemLabel.SECTION_HEADER
+            elif label == DocItemLabel.TEXT and len(block) == 1 and len(blocks) > 1:
+                if ix == 0 and bbox.b < margin:
+                    label = DocItemLabel.PAGE_HEADER
+                elif ix == len(blocks) - 1 and bbox.t > page.size.height - margin:
+                    label = DocItemLabel.PAGE_FOOTER
+            clusters.append(
+                Cluster(id=ix, label=label, bbox=bbox, confidence=1.0, cells=[])
+            )
+
+        processed_clusters, _ = LayoutPostprocessor(
+            page, clusters, self.layout_options
+        ).postprocess()
+        return LayoutPrediction(clusters=processed_clusters)
+
+    @staticmethod
+    def _body_font(lines: list[_TextLine]) -> Optional[str]:
+        fonts: Counter[Optional[str]] = Counter()
+        for line in lines:
+            for cell in line.cells:
+                fonts[getattr(cell, "font_name", None)] += len(cell.text)
+        return fonts.most_common(1)[0][0]
@@ -42,7 +42,7 @@ class PagePreprocessingModel(BasePageModel):
             if not page._backend.is_valid():
                 yield page
             else:
-                with TimeRecorder(conv_res, "page_parse"):
+                with TimeRecorder(conv_res, "page_parse", page_no=page.page_no):
                     page = self._populate_page_images(page)
                     if not self.options.skip_cell_extraction:
                         page = self._parse_page_cells(conv_res, page)
@@ -1,4 +1,6 @@
 import copy
+import glob
+import logging
 import warnings
 from collections.abc import Iterable, Sequence
 from pathlib import Path
@@ -25,6 +27,8 @@ from docling.models.utils.hf_model_download import download_hf_model
 from docling.utils.accelerator_utils import decide_device
 from docling.utils.profiling import TimeRecorder
 
+_log = logging.getLogger(__name__)
+
 
 class TableStructureModel(BaseTableStructureModel):
     _model_repo_folder = "docling-project--docling-models"
@@ -87,6 +91,58 @@ class TableStructureModel(BaseTableStructureModel):
                 self.tm_config, device, accelerator_options.num_threads
             )
             self.scale = 2.0  # Scale up table input images to 144 dpi
+            if self.options.dynamic_quantization:
+                from docling.models.utils.quantization import (
+                    warn_unvalidated_accuracy,
+                )
+
+                warn_unvalidated_accuracy("table structure")
+            if self.options.inference_engine == "onnxruntime":
+                self._use_onnx_runtime(
+                    artifacts_path, device, accelerator_options.num_threads
+                )
+            if self.options.dynamic_quantization:
+                self._quantize(device)
+
+    def _quantize(self, device: str) -> None:
+        # The image encoder is convolutional, only the linear layers of the
+        # structure decoder and of the bbox decoder are quantized.
+        if device != AcceleratorDevice.CPU.value:
+            _log.warning(
+                "The dynamic quantization of the table structure model only runs on "
+                f"CPU, using the model in float on {device}."
+            )
+            return
+
+        from docling.models.utils.quantization import quantize_linear_layers
+
+        quantize_linear_layers(self.tf_predictor._model)
+
+    def _use_onnx_runtime(
+        self, artifacts_path: Path, device: str, num_threads: int
+    ) -> None:
+        # Only the image encoder runs with ONNX Runtime, the autoregressive decoding
+        # of the table structure stays in PyTorch.
+        if device != AcceleratorDevice.CPU.value:
+            _log.warning(
+                "The onnxruntime inference engine of the table structure model only "
+                f"runs on CPU, using PyTorch on {device}."
+            )
+            return
+
+        from docling.models.utils.onnx_runtime import load_onnx_encoder
+
+        model = self.tf_predictor._model
+        image_size = self.tm_config["dataset"]["resized_image"]
+        # the weights file loaded by TFPredictor
+        weights_path = Path(glob.glob(f"{artifacts_path}/tableformer_*.safetensors")[0])
+        model._encoder = load_onnx_encoder(
+            model._encoder,
+            image_size=(image_size, image_size),
+            name=f"tableformer-{self.mode.value}-encoder",
+            weights_path=weights_path,
+            num_threads=num_threads,
+        )
 
     @classmethod
     def get_options_type(cls) -> type[TableStructureOptions]:
@@ -189,7 +245,7 @@ class TableStructureModel(BaseTableStructureModel):
                 predictions.append(existing_prediction)
                 continue
 
-            with TimeRecorder(conv_res, "table_structure"):
+            with TimeRecorder(conv_res, "table_structure", page_no=page.page_no):
                 assert page.predictions.layout is not None
                 assert page.size is not None
 
@@ -4,8 +4,6 @@ import sys
 from abc import abstractmethod
 from typing import List
 
-from transformers import StoppingCriteria
-
 _log = logging.getLogger(__name__)
 
 
@@ -116,42 +114,13 @@ class DocTagsRepetitionStopper(GenerationStopper):
         return run_repetitive(run)
 
 
-class HFStoppingCriteriaWrapper(StoppingCriteria):
-    """
-    Adapts any GenerationStopper to HuggingFace Transformers.
-    Decodes exactly min(seq_len, stopper.lookback_tokens()) tokens from the end.
-    """
+def __getattr__(name: str):
+    # the HuggingFace adapter lives with the transformers model, to avoid importing
+    # transformers together with the pipeline options
+    if name == "HFStoppingCriteriaWrapper":
+        from docling.models.vlm_pipeline_models.hf_transformers_model import (
+            HFStoppingCriteriaWrapper,
+        )
 
-    def __init__(
-        self,
-        tokenizer,
-        stopper: GenerationStopper,
-        *,
-        skip_special_tokens: bool = False,
-    ):
-        self.tokenizer = tokenizer
-        self.stopper = stopper
-        self.skip_special_tokens = skip_special_tokens
-
-    def __call__(self, input_ids, scores, **kwargs) -> bool:
-        lb = max(1, int(self.stopper.lookback_tokens()))
-        for seq in input_ids:  # (batch, seq_len)
-            window = seq[-lb:]  # slicing handles lb > len(seq)
-            try:
-                text = self.tokenizer.decode(
-                    window, skip_special_tokens=self.skip_special_tokens
-                )
-            except Exception as e:
-                _log.info(f"Decoding failed for stopping check: {e}")
-                continue
-
-            try:
-                if self.stopper.should_stop(text):
-                    _log.info(
-                        "HF wrapper: stopping due to TextStopper.should_stop==True"
-                    )
-                    return True
-            except Exception as e:
-                _log.info(f"Error in TextStopper.should_stop: {e}")
-                continue
-        return False
+        return HFStoppingCriteriaWrapper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,266 @@
+"""Inference of the PyTorch models with ONNX Runtime on CPU.
+
+The modules are exported to ONNX on first use and the graphs are cached under
+`settings.cache_dir`, keyed by the weights file they were exported from.
+"""
+
+import inspect
+import logging
+import os
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import torch
+
+from docling.datamodel.settings import settings
+from docling.utils.utils import create_hash
+
+_log = logging.getLogger(__name__)
+
+_ONNX_OPSET = 17
+
+
+def get_onnx_cache_path(name: str, weights_path: Path, variant: str = "") -> Path:
+    """Get the path of the cached ONNX graph of a model.
+
+    Args:
+        name: The name of the model.
+        weights_path: The weights file of the model. A new graph is exported when
+            the file changes.
+        variant: Additional key of the graph, e.g. the exported submodule.
+
+    Returns:
+        The path of the graph under `settings.cache_dir`.
+    """
+    stat = weights_path.stat()
+    key = create_hash(
+        f"{weights_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}:{variant}:"
+        f"{torch.__version__}:{_ONNX_OPSET}"
+    )
+    return settings.cache_dir / "onnx" / f"{name}-{key[:16]}.onnx"
+
+
+def export_onnx(
+    module: torch.nn.Module,
+    example_inputs: tuple[torch.Tensor, ...],
+    path: Path,
+    input_names: Sequence[str],
+    output_names: Sequence[str],
+) -> None:
+    """Export a module to ONNX, with a dynamic batch dimension.
+
+    The graph is written atomically, so that concurrent processes exporting the same
+    model do not read a partial file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    # the TorchScript exporter handles the control flow of the models, the dynamo
+    # exporter became the default in recent torch versions
+    kwargs: dict[str, Any] = (
+        {"dynamo": False}
+        if "dynamo" in inspect.signature(torch.onnx.export).parameters
+        else {}
+    )
+    module.eval()
+    try:
+        with torch.no_grad():
+            torch.onnx.export(
+                module,
+                example_inputs,
+                str(tmp_path),
+                input_names=list(input_names),
+                output_names=list(output_names),
+                dynamic_axes={
+                    name: {0: "batch"} for name in [*input_names, *output_names]
+                },
+                opset_version=_ONNX_OPSET,
+                **kwargs,
+            )
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class OnnxRuntimeModule(torch.nn.Module):
+    """Module running an ONNX graph with the CPU execution provider of ONNX Runtime.
+
+    The inputs are given positionally or by name, the outputs are returned as a
+    tuple of tensors in the order of the graph outputs.
+    """
+
+    def __init__(self, path: Path, num_threads: int = 4) -> None:
+        super().__init__()
+        try:
+            import onnxruntime
+        except ImportError:
+            raise ImportError(
+                "ONNX Runtime is not installed. Please install it via `pip install onnxruntime onnx` "
+                "to use the onnxruntime inference engine."
+            )
+
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.intra_op_num_threads = num_threads
+        self._session = onnxruntime.InferenceSession(
+            str(path), sess_options=sess_options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = [inp.name for inp in self._session.get_inputs()]
+
+    def forward(
+        self, *args: torch.Tensor, **kwargs: torch.Tensor
+    ) -> tuple[torch.Tensor, ...]:
+        feeds = dict(zip(self._input_names, args))
+        feeds.update({k: v for k, v in kwargs.items() if k in self._input_names})
+        outputs = self._session.run(
+            None, {k: v.detach().cpu().numpy() for k, v in feeds.items()}
+        )
+        return tuple(torch.from_numpy(out) for out in outputs)
+
+
+def load_onnx_module(
+    module: torch.nn.Module,
+    example_inputs: tuple[torch.Tensor, ...],
+    name: str,
+    weights_path: Path,
+    input_names: Sequence[str],
+    output_names: Sequence[str],
+    num_threads: int = 4,
+    variant: str = "",
+    quantize: bool = False,
+) -> OnnxRuntimeModule:
+    """Get an ONNX Runtime replacement of a module, exporting it if not cached.
+
+    Args:
+        module: The module to export, returning a tuple of tensors.
+        example_inputs: Inputs used to trace the module.
+        name: The name of the model, used in the cache file name.
+        weights_path: The weights file of the model, which keys the cache.
+        input_names: The names of the graph inputs.
+        output_names: The names of the graph outputs.
+        num_threads: The number of intra-op threads of ONNX Runtime.
+        variant: Additional key of the cached graph.
+        quantize: Whether to run the graph with int8 linear layers.
+
+    Returns:
+        The module running the exported graph.
+    """
+    path = get_onnx_cache_path(name, weights_path, variant=variant)
+    if not path.exists():
+        _log.info(f"Exporting the {name} model to ONNX in {path}")
+        export_onnx(module, example_inputs, path, input_names, output_names)
+    if quantize:
+        from docling.models.utils.quantization import quantize_onnx_graph
+
+        path = quantize_onnx_graph(path)
+    return OnnxRuntimeModule(path, num_threads=num_threads)
+
+
+class _DetectionOutputs(torch.nn.Module):
+    """Object detection model returning its logits and boxes as a tuple."""
+
+    def __init__(self, model: torch.nn.Module) -> None:
+        super().__init__()
+        self.model = model
+
+    def forward(self, pixel_values: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
+        outputs = self.model(pixel_values=pixel_values)
+        return outputs.logits, outputs.pred_boxes
+
+
+class OnnxObjectDetectionModule(torch.nn.Module):
+    """ONNX Runtime replacement of a transformers object detection model.
+
+    Only the `logits` and `pred_boxes` outputs used by the post-processing of the
+    image processors are provided.
+    """
+
+    def __init__(self, runtime: OnnxRuntimeModule) -> None:
+        super().__init__()
+        self.runtime = runtime
+
+    def forward(self, pixel_values: torch.Tensor, **kwargs: Any) -> SimpleNamespace:
+        logits, pred_boxes = self.runtime(pixel_values=pixel_values)
+        return SimpleNamespace(logits=logits, pred_boxes=pred_boxes)
+
+
+def load_onnx_object_detection(
+    model: torch.nn.Module,
+    image_size: tuple[int, int],
+    name: str,
+    weights_path: Path,
+    num_threads: int = 4,
+    quantize: bool = False,
+) -> OnnxObjectDetectionModule:
+    """Get an ONNX Runtime replacement of a transformers object detection model.
+
+    Args:
+        model: The object detection model, e.g. RT-DETR.
+        image_size: The (height, width) of the preprocessed images.
+        name: The name of the model, used in the cache file name.
+        weights_path: The weights file of the model, which keys the cache.
+        num_threads: The number of intra-op threads of ONNX Runtime.
+        quantize: Whether to run the graph with int8 linear layers.
+
+    Returns:
+        The module running the exported graph.
+    """
+    runtime = load_onnx_module(
+        _DetectionOutputs(model),
+        (torch.zeros(1, 3, *image_size),),
+        name=name,
+        weights_path=weights_path,
+        input_names=["pixel_values"],
+        output_names=["logits", "pred_boxes"],
+        num_threads=num_threads,
+        variant=f"{image_size[0]}x{image_size[1]}",
+        quantize=quantize,
+    )
+    return OnnxObjectDetectionModule(runtime)
+
+
+class OnnxEncoderModule(torch.nn.Module):
+    """ONNX Runtime replacement of an image encoder returning a single tensor."""
+
+    def __init__(self, runtime: OnnxRuntimeModule) -> None:
+        super().__init__()
+        self.runtime = runtime
+
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        return self.runtime(images)[0]
+
+
+def load_onnx_encoder(
+    encoder: torch.nn.Module,
+    image_size: tuple[int, int],
+    name: str,
+    weights_path: Path,
+    num_threads: int = 4,
+    quantize: bool = False,
+) -> OnnxEncoderModule:
+    """Get an ONNX Runtime replacement of an image encoder.
+
+    Args:
+        encoder: The image encoder, taking a batch of images.
+        image_size: The (height, width) of the preprocessed images.
+        name: The name of the model, used in the cache file name.
+        weights_path: The weights file of the model, which keys the cache.
+        num_threads: The number of intra-op threads of ONNX Runtime.
+        quantize: Whether to run the graph with int8 linear layers.
+
+    Returns:
+        The module running the exported graph.
+    """
+    runtime = load_onnx_module(
+        encoder,
+        (torch.zeros(1, 3, *image_size),),
+        name=name,
+        weights_path=weights_path,
+        input_names=["images"],
+        output_names=["features"],
+        num_threads=num_threads,
+        variant=f"{image_size[0]}x{image_size[1]}",
+        quantize=quantize,
+    )
+    return OnnxEncoderModule(runtime)
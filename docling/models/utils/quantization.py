@@ -0,0 +1,90 @@
+"""Dynamic int8 quantization of the models for CPU inference.
+
+The weights of the linear layers are quantized to int8 ahead of time and the
+activations are quantized on the fly, which needs no calibration data.
+"""
+
+import logging
+import os
+import threading
+import warnings
+from pathlib import Path
+
+import torch
+
+_log = logging.getLogger(__name__)
+
+# the linear layers of the exported graphs, the convolutions are kept in float
+_ONNX_QUANTIZED_OPS = ["MatMul", "Gemm"]
+
+
+def warn_unvalidated_accuracy(model_name: str) -> None:
+    """Warn that the accuracy of a quantized model is not validated yet."""
+    warnings.warn(
+        f"The dynamic quantization of the {model_name} model is experimental, its "
+        "accuracy against the float model is not validated yet. Measure it on your "
+        "documents with docs/examples/quantized_layout_accuracy.py.",
+        UserWarning,
+        stacklevel=3,
+    )
+
+
+def quantize_linear_layers(module: torch.nn.Module) -> torch.nn.Module:
+    """Quantize the linear layers of a PyTorch module to int8, in place.
+
+    Args:
+        module: The module to quantize, on CPU.
+
+    Returns:
+        The quantized module.
+    """
+    from torch.ao.quantization import quantize_dynamic
+
+    with warnings.catch_warnings():
+        # torch.ao.quantization and the quantized tensors are deprecated in favour
+        # of torchao, which is not a dependency
+        warnings.simplefilter("ignore")
+        return quantize_dynamic(
+            module.eval(), {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+
+
+def get_quantized_onnx_path(path: Path) -> Path:
+    """Get the path of the quantized version of a cached ONNX graph."""
+    return path.with_name(f"{path.stem}-int8{path.suffix}")
+
+
+def quantize_onnx_graph(path: Path) -> Path:
+    """Quantize the linear layers of an ONNX graph to int8, if not cached.
+
+    Args:
+        path: The ONNX graph in float.
+
+    Returns:
+        The path of the quantized graph, next to the original one.
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        raise ImportError(
+            "ONNX Runtime is not installed. Please install it via `pip install onnxruntime onnx` "
+            "to quantize the exported models."
+        )
+
+    quantized_path = get_quantized_onnx_path(path)
+    if not quantized_path.exists():
+        _log.info(f"Quantizing the ONNX graph {path} to {quantized_path}")
+        tmp_path = quantized_path.with_name(
+            f"{quantized_path.name}.{os.getpid()}-{threading.get_ident()}.tmp"
+        )
+        try:
+            quantize_dynamic(
+                path,
+                tmp_path,
+                op_types_to_quantize=_ONNX_QUANTIZED_OPS,
+                weight_type=QuantType.QInt8,
+            )
+            os.replace(tmp_path, quantized_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    return quantized_path
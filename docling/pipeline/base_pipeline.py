@@ -27,6 +27,7 @@ from docling.datamodel.pipeline_options import (
     PipelineOptions,
 )
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelled
 from docling.models.base_model import GenericEnrichmentModel
 from docling.models.factories import get_picture_description_factory
 from docling.models.picture_description_base_model import PictureDescriptionBaseModel
@@ -34,6 +35,7 @@ from docling.models.stages.picture_classifier.document_picture_classifier import
     DocumentPictureClassifier,
     DocumentPictureClassifierOptions,
 )
+from docling.utils.cancellation import CancellationToken
 from docling.utils.profiling import ProfilingScope, TimeRecorder
 from docling.utils.utils import chunkify
 
@@ -59,14 +61,22 @@ class BasePipeline(ABC):
                 "When defined, it must point to a folder containing all models required by the pipeline."
             )
 
-    def execute(self, in_doc: InputDocument, raises_on_error: bool) -> ConversionResult:
+    def execute(
+        self,
+        in_doc: InputDocument,
+        raises_on_error: bool,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ConversionResult:
         conv_res = ConversionResult(input=in_doc)
+        if cancel_token is not None:
+            conv_res._cancel_token = cancel_token
 
         _log.info(f"Processing document {in_doc.file.name}")
         try:
             with TimeRecorder(
                 conv_res, "pipeline_total", scope=ProfilingScope.DOCUMENT
             ):
+                conv_res._cancel_token.raise_if_cancelled()
                 # These steps are building and assembling the structure of the
                 # output DoclingDocument.
                 conv_res = self._build_document(conv_res)
@@ -83,6 +93,8 @@ class BasePipeline(ABC):
                     error_message=str(e),
                 )
                 conv_res.errors.append(error_item)
+            elif isinstance(e, ConversionCancelled):
+                raise
             else:
                 raise RuntimeError(f"Pipeline {self.__class__.__name__} failed") from e
         finally:
@@ -114,10 +126,16 @@ class BasePipeline(ABC):
                     _prepare_elements(conv_res, model),
                     model.elements_batch_size,
                 ):
-                    for element in model(
-                        doc=conv_res.document, element_batch=element_batch
-                    ):  # Must exhaust!
-                        pass
+                    conv_res._cancel_token.raise_if_cancelled()
+                    with TimeRecorder(
+                        conv_res,
+                        f"enrich_{type(model).__name__}",
+                        scope=ProfilingScope.DOCUMENT,
+                    ):
+                        for element in model(
+                            doc=conv_res.document, element_batch=element_batch
+                        ):  # Must exhaust!
+                            pass
 
         return conv_res
 
@@ -224,6 +242,7 @@ class PaginatedPipeline(ConvertPipeline):  # TODO this is a bad name.
                 for page_batch in chunkify(
                     conv_res.pages, settings.perf.page_batch_size
                 ):
+                    conv_res._cancel_token.raise_if_cancelled()
                     start_batch_time = time.monotonic()
 
                     # 1. Initialise the page resources
@@ -17,29 +17,42 @@ from __future__ import annotations
 
 import itertools
 import logging
+import os
+import shutil
 import threading
 import time
 import warnings
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
+from pydantic import BaseModel, ValidationError
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
 from docling.datamodel.base_models import (
     AssembledUnit,
+    ContainerElement,
     ConversionStatus,
     DoclingComponentType,
     ErrorItem,
+    FigureElement,
     Page,
+    PageConfidenceScores,
+    Table,
+    TextElement,
 )
 from docling.datamodel.document import ConversionResult
-from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions
+from docling.datamodel.pipeline_options import (
+    LayoutOptions,
+    ThreadedPdfPipelineOptions,
+)
 from docling.datamodel.settings import settings
+from docling.exceptions import ConversionCancelled
 from docling.models.factories import (
     get_layout_factory,
     get_ocr_factory,
@@ -53,6 +66,9 @@ from docling.models.stages.page_assemble.page_assemble_model import (
     PageAssembleModel,
     PageAssembleOptions,
 )
+from docling.models.stages.page_classifier.page_classifier_model import (
+    PageClassifierModel,
+)
 from docling.models.stages.page_preprocessing.page_preprocessing_model import (
     PagePreprocessingModel,
     PagePreprocessingOptions,
@@ -62,8 +78,13 @@ from docling.models.stages.reading_order.readingorder_model import (
     ReadingOrderOptions,
 )
 from docling.pipeline.base_pipeline import ConvertPipeline
-from docling.utils.profiling import ProfilingScope, TimeRecorder
-from docling.utils.utils import chunkify
+from docling.utils.profiling import (
+    ProfilingScope,
+    QueueMetrics,
+    StageMetrics,
+    TimeRecorder,
+)
+from docling.utils.utils import chunkify, create_hash
 
 _log = logging.getLogger(__name__)
 
@@ -82,6 +103,8 @@ class ThreadedItem:
     conv_res: ConversionResult
     error: Optional[Exception] = None
     is_failed: bool = False
+    # processing time of the page in the stages so far, in seconds
+    elapsed: float = 0.0
 
 
 @dataclass
@@ -109,10 +132,182 @@ class ProcessingResult:
         return self.success_count == 0 and self.failure_count > 0
 
 
+# Rough size of a parsed cell with its text and geometry, for the memory estimate
+_CELL_BYTES = 512
+
+
+def _estimate_page_bytes(page: Page) -> int:
+    """Estimate the bytes held by a page, from its images and parsed cells."""
+    nbytes = 0
+    for image in page._image_cache.values():
+        nbytes += image.width * image.height * len(image.getbands())
+    if page.parsed_page is not None:
+        num_cells = (
+            len(page.parsed_page.char_cells)
+            + len(page.parsed_page.word_cells)
+            + len(page.parsed_page.textline_cells)
+        )
+        nbytes += num_cells * _CELL_BYTES
+    return nbytes
+
+
+class PageMemoryBudget:
+    """Estimated bytes held by the pages in flight, with an optional limit.
+
+    The budget is soft: a page is admitted while the pages in flight are below the
+    limit, and at least one page is always admitted. The pages are keyed by run and
+    page number, so that one budget is shared by the concurrent runs of a pipeline.
+    The peak of the bytes in flight is tracked for the whole budget and per run.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self.max_bytes = max_bytes
+        self.high_water_mark = 0
+        self._held: dict[tuple[int, int], int] = {}
+        self._total = 0
+        self._run_totals: dict[int, int] = {}
+        self._run_peaks: dict[int, int] = {}
+        self._cond = threading.Condition()
+
+    def wait_for_room(
+        self, should_wait: Callable[[], bool], poll_interval: float
+    ) -> None:
+        """Block until a page can be admitted, or *should_wait* returns False."""
+        if self.max_bytes is None:
+            return
+        with self._cond:
+            while self._held and self._total >= self.max_bytes and should_wait():
+                self._cond.wait(poll_interval)
+
+    def reserve(self, run_id: int, page_no: int, nbytes: int) -> None:
+        with self._cond:
+            delta = nbytes - self._held.get((run_id, page_no), 0)
+            self._held[(run_id, page_no)] = nbytes
+            self._total += delta
+            self.high_water_mark = max(self.high_water_mark, self._total)
+            run_total = self._run_totals.get(run_id, 0) + delta
+            self._run_totals[run_id] = run_total
+            self._run_peaks[run_id] = max(self._run_peaks.get(run_id, 0), run_total)
+
+    def release(self, run_id: int, page_no: int) -> None:
+        with self._cond:
+            nbytes = self._held.pop((run_id, page_no), None)
+            if nbytes is not None:
+                self._total -= nbytes
+                self._run_totals[run_id] -= nbytes
+                self._cond.notify_all()
+
+    def run_high_water_mark(self, run_id: int) -> int:
+        """Peak of the bytes held by the pages of a run, until the run is released."""
+        with self._cond:
+            return self._run_peaks.get(run_id, 0)
+
+    def release_run(self, run_id: int) -> None:
+        """Release the pages of a run, e.g. the failed ones which were not assembled."""
+        with self._cond:
+            keys = [key for key in self._held if key[0] == run_id]
+            for key in keys:
+                self._total -= self._held.pop(key)
+            self._run_totals.pop(run_id, None)
+            self._run_peaks.pop(run_id, None)
+            if keys:
+                self._cond.notify_all()
+
+
+_PAGE_ELEMENT_TYPES = {
+    cls.__name__: cls for cls in (TextElement, Table, FigureElement, ContainerElement)
+}
+
+
+class _PageCheckpoint(BaseModel):
+    page: Page
+    confidence: PageConfidenceScores = PageConfidenceScores()
+    # The classes of the assembled elements, since the PageElement union cannot
+    # tell a ContainerElement from a FigureElement in JSON
+    element_types: dict[str, list[str]] = {}
+
+    @classmethod
+    def from_page(cls, page: Page, confidence: PageConfidenceScores) -> _PageCheckpoint:
+        element_types: dict[str, list[str]] = {}
+        if page.assembled is not None:
+            for name in ("elements", "body", "headers"):
+                element_types[name] = [
+                    type(el).__name__ for el in getattr(page.assembled, name)
+                ]
+        return cls(page=page, confidence=confidence, element_types=element_types)
+
+    def to_page(self) -> Page:
+        assembled = self.page.assembled
+        if assembled is not None:
+            for name, types in self.element_types.items():
+                elements = getattr(assembled, name)
+                setattr(
+                    assembled,
+                    name,
+                    [
+                        _PAGE_ELEMENT_TYPES[el_type].model_validate(
+                            el, from_attributes=True
+                        )
+                        for el_type, el in zip(types, elements)
+                    ],
+                )
+        return self.page
+
+
+class PageCheckpointStore:
+    """On-disk store of the completed pages of a document, one JSON file per page."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _page_path(self, page_no: int) -> Path:
+        return self.directory / f"page_{page_no:06d}.json"
+
+    def load(self, page_no: int) -> Optional[tuple[Page, PageConfidenceScores]]:
+        """Load a checkpointed page and its confidence scores, if any."""
+        try:
+            data = self._page_path(page_no).read_bytes()
+            checkpoint = _PageCheckpoint.model_validate_json(data)
+            return checkpoint.to_page(), checkpoint.confidence
+        except FileNotFoundError:
+            return None
+        except (OSError, ValidationError, KeyError) as exc:
+            _log.warning("Ignoring invalid checkpoint of page %d: %s", page_no, exc)
+            return None
+
+    def save(self, page: Page, confidence: PageConfidenceScores) -> None:
+        path = self._page_path(page.page_no)
+        checkpoint = _PageCheckpoint.from_page(page, confidence)
+        try:
+            # a page is either fully written or missing, even after a crash
+            with NamedTemporaryFile(dir=self.directory, delete=False) as tmp:
+                tmp.write(checkpoint.model_dump_json().encode())
+            os.replace(tmp.name, path)
+        except OSError as exc:
+            _log.warning("Could not checkpoint page %d: %s", page.page_no, exc)
+
+    def remove(self) -> None:
+        """Delete the checkpoints of the document, once it is fully converted."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
 class ThreadedQueue:
     """Bounded queue with blocking put/ get_batch and explicit *close()* semantics."""
 
-    __slots__ = ("_closed", "_items", "_lock", "_max", "_not_empty", "_not_full")
+    __slots__ = (
+        "_closed",
+        "_created_at",
+        "_depth_area",
+        "_ended_at",
+        "_items",
+        "_last_change",
+        "_lock",
+        "_max",
+        "_max_depth",
+        "_not_empty",
+        "_not_full",
+    )
 
     def __init__(self, max_size: int) -> None:
         self._max: int = max_size
@@ -121,6 +316,21 @@ class ThreadedQueue:
         self._not_full = threading.Condition(self._lock)
         self._not_empty = threading.Condition(self._lock)
         self._closed = False
+        # occupancy statistics, updated under the lock
+        self._created_at = self._last_change = time.monotonic()
+        self._ended_at: Optional[float] = None  # closed and drained
+        self._depth_area = 0.0  # integral of the depth over time
+        self._max_depth = 0
+
+    def _record_depth(self) -> None:
+        """Account for the depth since the last change. Must hold the lock."""
+        if self._ended_at is not None:
+            return
+        now = time.monotonic()
+        self._depth_area += len(self._items) * (now - self._last_change)
+        self._last_change = now
+        if self._closed and not self._items:
+            self._ended_at = now
 
     # ---------------------------------------------------------------- put()
     def put(self, item: ThreadedItem, timeout: Optional[float] | None = None) -> bool:
@@ -139,7 +349,9 @@ class ThreadedQueue:
                     self._not_full.wait()
             if self._closed:
                 return False
+            self._record_depth()
             self._items.append(item)
+            self._max_depth = max(self._max_depth, len(self._items))
             self._not_empty.notify()
             return True
 
@@ -159,9 +371,13 @@ class ThreadedQueue:
                 else:
                     self._not_empty.wait()
             batch: List[ThreadedItem] = []
+            if self._items:
+                self._record_depth()
             while self._items and len(batch) < size:
                 batch.append(self._items.popleft())
             if batch:
+                if self._closed:
+                    self._record_depth()
                 self._not_full.notify_all()
             return batch
 
@@ -169,9 +385,26 @@ class ThreadedQueue:
     def close(self) -> None:
         with self._lock:
             self._closed = True
+            self._record_depth()
             self._not_empty.notify_all()
             self._not_full.notify_all()
 
+    # --------------------------------------------------------------- metrics()
+    def metrics(self) -> QueueMetrics:
+        """Occupancy of the queue from its creation until it was closed and drained."""
+        with self._lock:
+            if self._ended_at is not None:
+                end, area = self._ended_at, self._depth_area
+            else:
+                end = time.monotonic()
+                area = self._depth_area + len(self._items) * (end - self._last_change)
+            duration = end - self._created_at
+            return QueueMetrics(
+                max_size=self._max,
+                max_depth=self._max_depth,
+                mean_depth=area / duration if duration > 0 else 0.0,
+            )
+
     # -------------------------------------------------------------- property
     @property
     def closed(self) -> bool:
@@ -191,6 +424,8 @@ class ThreadedPipelineStage:
         queue_max_size: int,
         postprocess: Optional[Callable[[ThreadedItem], None]] = None,
         timed_out_run_ids: Optional[set[int]] = None,
+        page_timeout: Optional[float] = None,
+        skip: Optional[Callable[[ThreadedItem], bool]] = None,
     ) -> None:
         self.name = name
         self.model = model
@@ -204,6 +439,11 @@ class ThreadedPipelineStage:
         self._timed_out_run_ids = (
             timed_out_run_ids if timed_out_run_ids is not None else set()
         )
+        self._page_timeout = page_timeout
+        # items passed through without running the model
+        self._skip = skip
+        # only updated by the worker thread
+        self._metrics = StageMetrics(batch_size=batch_size)
 
     # ---------------------------------------------------------------- wiring
     def add_output_queue(self, q: ThreadedQueue) -> None:
@@ -234,14 +474,112 @@ class ThreadedPipelineStage:
                     self.name,
                 )
 
+    # --------------------------------------------------------------- metrics()
+    def metrics(self) -> StageMetrics:
+        """Utilization of the stage, including the occupancy of its input queue."""
+        return self._metrics.model_copy(
+            update={"input_queue": self.input_queue.metrics()}
+        )
+
+    # ------------------------------------------------------- admission hook
+    def _wait_for_admission(self) -> None:
+        """Block until the stage can take a new batch. No-op by default."""
+
+    # ------------------------------------------------------ budget checks
+    def _fail_expired(self, items: Sequence[ThreadedItem]) -> None:
+        """Mark the items of cancelled runs or over the page timeout as failed."""
+        for it in items:
+            if it.is_failed:
+                continue
+            if it.conv_res._cancel_token.cancelled:
+                it.is_failed = True
+                it.error = ConversionCancelled("conversion cancelled")
+            elif self._page_timeout is not None and it.elapsed > self._page_timeout:
+                it.is_failed = True
+                it.error = RuntimeError(
+                    f"page timeout exceeded ({it.elapsed:.3f}s > {self._page_timeout:.3f}s)"
+                )
+
+    def _iter_pages(
+        self, items: Sequence[ThreadedItem], fed: list[ThreadedItem]
+    ) -> Iterable[Page]:
+        """Hand the pages of *items* to the model, timing each of them.
+
+        Models consume the pages lazily, so the cancellation and the page timeout
+        are checked right before a page is handed over, and the time until the
+        model asks for the next page is charged to that page only. The items handed
+        over are appended to *fed*.
+        """
+        for it in items:
+            it.conv_res._cancel_token.raise_if_cancelled()
+            self._fail_expired([it])
+            if it.is_failed:
+                continue
+            assert it.payload is not None
+            fed.append(it)
+            start = time.monotonic()
+            yield it.payload
+            it.elapsed += time.monotonic() - start
+
+    def _run_model(
+        self, conv_res: ConversionResult, items: Sequence[ThreadedItem]
+    ) -> list[ThreadedItem]:
+        """Run the model on the pages of *items*, with the per-page time budget.
+
+        Returns:
+            The items of the processed pages, and the items failed before being
+            handed to the model.
+        """
+        fed: list[ThreadedItem] = []
+        elapsed_before = sum(it.elapsed for it in items)
+        start = time.monotonic()
+        processed_pages = list(self.model(conv_res, self._iter_pages(items, fed)))
+        batch_time = time.monotonic() - start
+        if len(processed_pages) != len(fed):  # strict mismatch guard
+            raise RuntimeError(f"Model {self.name} returned wrong number of pages")
+
+        # the time not spent on a single page, e.g. the inference of a batch
+        # collected upfront, is shared by the pages of the batch
+        if fed:
+            shared_time = batch_time - (
+                sum(it.elapsed for it in items) - elapsed_before
+            )
+            for it in fed:
+                it.elapsed += max(shared_time, 0.0) / len(fed)
+
+        result = [it for it in items if it.is_failed]
+        for it, page in zip(fed, processed_pages):
+            result.append(
+                ThreadedItem(
+                    payload=page,
+                    run_id=it.run_id,
+                    page_no=it.page_no,
+                    conv_res=it.conv_res,
+                    elapsed=it.elapsed,
+                )
+            )
+        return result
+
     # ------------------------------------------------------------------ _run
     def _run(self) -> None:
+        metrics = self._metrics
         try:
             while self._running:
+                start = time.monotonic()
+                self._wait_for_admission()
+                admitted = time.monotonic()
+                metrics.throttled_time += admitted - start
                 batch = self.input_queue.get_batch(self.batch_size, self.batch_timeout)
+                got_batch = time.monotonic()
+                metrics.idle_time += got_batch - admitted
                 if not batch and self.input_queue.closed:
                     break
                 processed = self._process_batch(batch)
+                metrics.process_time += time.monotonic() - got_batch
+                if batch:
+                    metrics.batches += 1
+                    metrics.items += len(batch)
+                    metrics.max_batch_size = max(metrics.max_batch_size, len(batch))
                 self._emit(processed)
         except Exception:  # pragma: no cover - top-level guard
             _log.exception("Fatal error in stage %s", self.name)
@@ -268,6 +606,15 @@ class ThreadedPipelineStage:
                 result.extend(items)
                 continue
 
+            self._fail_expired(items)
+            if self._skip is not None:
+                kept: list[ThreadedItem] = []
+                for it in items:
+                    if not it.is_failed and self._skip(it):
+                        result.append(it)
+                    else:
+                        kept.append(it)
+                items = kept
             good: list[ThreadedItem] = [i for i in items if not i.is_failed]
             if not good:
                 result.extend(items)
@@ -285,21 +632,8 @@ class ThreadedPipelineStage:
                     result.extend(items)
                     continue
 
-                pages: List[Page] = [payload for _, payload in pages_with_payloads]
-                processed_pages = list(self.model(good[0].conv_res, pages))  # type: ignore[arg-type]
-                if len(processed_pages) != len(pages):  # strict mismatch guard
-                    raise RuntimeError(
-                        f"Model {self.name} returned wrong number of pages"
-                    )
-                for idx, page in enumerate(processed_pages):
-                    result.append(
-                        ThreadedItem(
-                            payload=page,
-                            run_id=rid,
-                            page_no=good[idx].page_no,
-                            conv_res=good[idx].conv_res,
-                        )
-                    )
+                # the failed items are passed through
+                result.extend(self._run_model(good[0].conv_res, items))
             except Exception as exc:
                 _log.error(
                     "Stage %s failed for run %d: %s", self.name, rid, exc, exc_info=True
@@ -316,7 +650,10 @@ class ThreadedPipelineStage:
             if self._postprocess is not None:
                 self._postprocess(item)
             for q in self._outputs:
-                if not q.put(item):
+                start = time.monotonic()
+                ok = q.put(item)
+                self._metrics.blocked_time += time.monotonic() - start
+                if not ok:
                     _log.error("Output queue closed while emitting from %s", self.name)
 
 
@@ -330,6 +667,7 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
         queue_max_size: int,
         model: Any,
         timed_out_run_ids: Optional[set[int]] = None,
+        memory_budget: Optional[PageMemoryBudget] = None,
     ) -> None:
         super().__init__(
             name="preprocess",
@@ -339,6 +677,28 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
             queue_max_size=queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
         )
+        self._memory_budget = memory_budget
+        # the runs whose pages were reserved in the budget by this stage
+        self._run_ids: set[int] = set()
+
+    def metrics(self) -> StageMetrics:
+        metrics = super().metrics()
+        if self._memory_budget is not None:
+            metrics.memory_high_water = max(
+                (
+                    self._memory_budget.run_high_water_mark(run_id)
+                    for run_id in self._run_ids
+                ),
+                default=0,
+            )
+        return metrics
+
+    def _wait_for_admission(self) -> None:
+        # pages are rendered and parsed here, so their admission is throttled
+        if self._memory_budget is not None:
+            self._memory_budget.wait_for_room(
+                lambda: self._running, poll_interval=self.batch_timeout
+            )
 
     def _process_batch(self, batch: Sequence[ThreadedItem]) -> list[ThreadedItem]:
         groups: dict[int, list[ThreadedItem]] = defaultdict(list)
@@ -357,17 +717,18 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
                 result.extend(items)
                 continue
 
+            self._fail_expired(items)
             good = [i for i in items if not i.is_failed]
             if not good:
                 result.extend(items)
                 continue
             try:
-                pages_with_payloads: list[tuple[ThreadedItem, Page]] = []
                 for it in good:
                     page = it.payload
                     if page is None:
                         raise RuntimeError("Page payload is None")
                     if page._backend is None:
+                        start = time.monotonic()
                         backend = it.conv_res.input._backend
                         assert isinstance(backend, PdfDocumentBackend), (
                             "Threaded pipeline only supports PdfDocumentBackend."
@@ -376,25 +737,18 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
                         page._backend = page_backend
                         if page_backend.is_valid():
                             page.size = page_backend.get_size()
-                    pages_with_payloads.append((it, page))
-
-                pages = [payload for _, payload in pages_with_payloads]
-                processed_pages = list(
-                    self.model(good[0].conv_res, pages)  # type: ignore[arg-type]
-                )
-                if len(processed_pages) != len(pages):
-                    raise RuntimeError(
-                        "PagePreprocessingModel returned unexpected number of pages"
-                    )
-                for idx, processed_page in enumerate(processed_pages):
-                    result.append(
-                        ThreadedItem(
-                            payload=processed_page,
-                            run_id=rid,
-                            page_no=good[idx].page_no,
-                            conv_res=good[idx].conv_res,
-                        )
-                    )
+                        it.elapsed += time.monotonic() - start
+
+                # the failed items are passed through
+                processed = self._run_model(good[0].conv_res, items)
+                if self._memory_budget is not None:
+                    self._run_ids.add(rid)
+                    for it in processed:
+                        if not it.is_failed and it.payload is not None:
+                            self._memory_budget.reserve(
+                                rid, it.page_no, _estimate_page_bytes(it.payload)
+                            )
+                result.extend(processed)
             except Exception as exc:
                 page_numbers = [it.page_no for it in good]
                 _log.error(
@@ -411,6 +765,11 @@ class PreprocessThreadedStage(ThreadedPipelineStage):
         return result
 
 
+def _has_layout(item: ThreadedItem) -> bool:
+    """Whether the layout of the page was already predicted, by the page classifier."""
+    return item.payload is not None and item.payload.predictions.layout is not None
+
+
 @dataclass
 class RunContext:
     """Wiring for a single *execute* call."""
@@ -426,6 +785,21 @@ class RunContext:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+# Pipeline options which do not change the page results, hence the checkpoints
+_CHECKPOINT_NEUTRAL_OPTIONS = {
+    "document_timeout",
+    "page_timeout",
+    "accelerator_options",
+    "ocr_batch_size",
+    "layout_batch_size",
+    "table_batch_size",
+    "batch_polling_interval_seconds",
+    "queue_max_size",
+    "memory_budget_mb",
+    "checkpoint_dir",
+}
+
+
 class StandardPdfPipeline(ConvertPipeline):
     """High-performance PDF pipeline with multi-threaded stages."""
 
@@ -433,6 +807,13 @@ class StandardPdfPipeline(ConvertPipeline):
         super().__init__(pipeline_options)
         self.pipeline_options: ThreadedPdfPipelineOptions = pipeline_options
         self._run_seq = itertools.count(1)  # deterministic, monotonic run ids
+        # shared by the concurrent runs, the bytes in flight are tracked even
+        # without a budget, to report them
+        self._memory_budget = PageMemoryBudget(
+            max_bytes=int(pipeline_options.memory_budget_mb * 1024**2)
+            if pipeline_options.memory_budget_mb is not None
+            else None
+        )
 
         # initialise heavy models once
         self._init_models()
@@ -453,6 +834,18 @@ class StandardPdfPipeline(ConvertPipeline):
                 images_scale=self.pipeline_options.images_scale
             )
         )
+        self.page_classifier_model = PageClassifierModel(
+            enabled=self.pipeline_options.do_page_classification
+            # full-page OCR replaces the text of all the pages
+            and not (
+                self.pipeline_options.do_ocr
+                and self.pipeline_options.ocr_options.force_full_page_ocr
+            ),
+            options=self.pipeline_options.page_classifier_options,
+            layout_options=self.pipeline_options.layout_options
+            if isinstance(self.pipeline_options.layout_options, LayoutOptions)
+            else LayoutOptions(),
+        )
         self.ocr_model = self._make_ocr_model(art_path)
         layout_factory = get_layout_factory(
             allow_external_plugins=self.pipeline_options.allow_external_plugins
@@ -523,11 +916,49 @@ class StandardPdfPipeline(ConvertPipeline):
         if not self.pipeline_options.generate_parsed_pages:
             page.parsed_page = None
 
+    def _get_checkpoint_store(
+        self, conv_res: ConversionResult
+    ) -> Optional[PageCheckpointStore]:
+        checkpoint_dir = self.pipeline_options.checkpoint_dir
+        if checkpoint_dir is None:
+            return None
+        try:
+            options_json = self.pipeline_options.model_dump_json(
+                exclude=_CHECKPOINT_NEUTRAL_OPTIONS
+            )
+        except Exception as exc:
+            _log.warning(
+                "Checkpointing disabled, cannot serialize the options: %s", exc
+            )
+            return None
+        key = f"{conv_res.input.document_hash}-{create_hash(options_json)[:16]}"
+        return PageCheckpointStore(checkpoint_dir / key)
+
+    def _restore_page(
+        self,
+        conv_res: ConversionResult,
+        page: Page,
+        confidence: PageConfidenceScores,
+    ) -> Page:
+        """Reload the resources of a checkpointed page needed after the threaded stages."""
+        conv_res.confidence.pages[page.page_no] = confidence
+        if self.keep_images or self.keep_backend:
+            backend = conv_res.input._backend
+            assert isinstance(backend, PdfDocumentBackend)
+            page._backend = backend.load_page(page.page_no)
+            if self.keep_images:
+                page.get_image(scale=1.0)
+                page._default_image_scale = self.pipeline_options.images_scale
+                page.get_image(scale=self.pipeline_options.images_scale)
+        return page
+
     # ────────────────────────────────────────────────────────────────────────
     # Build - thread pipeline
     # ────────────────────────────────────────────────────────────────────────
 
-    def _create_run_ctx(self) -> RunContext:
+    def _create_run_ctx(
+        self, checkpoint: Optional[PageCheckpointStore] = None
+    ) -> RunContext:
         opts = self.pipeline_options
         timed_out_run_ids: set[int] = set()
         preprocess = PreprocessThreadedStage(
@@ -535,7 +966,37 @@ class StandardPdfPipeline(ConvertPipeline):
             queue_max_size=opts.queue_max_size,
             model=self.preprocessing_model,
             timed_out_run_ids=timed_out_run_ids,
+            memory_budget=self._memory_budget,
         )
+
+        def release_page(item: ThreadedItem) -> None:
+            self._release_page_resources(item)
+            self._memory_budget.release(item.run_id, item.page_no)
+            if (
+                checkpoint is not None
+                and item.payload is not None
+                and not item.is_failed
+                and item.error is None
+            ):
+                checkpoint.save(
+                    item.payload, item.conv_res.confidence.pages[item.page_no]
+                )
+
+        # the simple pages get their layout from the page classifier, and skip OCR
+        # and the layout model
+        page_classifier: Optional[ThreadedPipelineStage] = None
+        skip_simple_pages: Optional[Callable[[ThreadedItem], bool]] = None
+        if self.page_classifier_model.enabled:
+            page_classifier = ThreadedPipelineStage(
+                name="page_classifier",
+                model=self.page_classifier_model,
+                batch_size=1,
+                batch_timeout=opts.batch_polling_interval_seconds,
+                queue_max_size=opts.queue_max_size,
+                timed_out_run_ids=timed_out_run_ids,
+                page_timeout=opts.page_timeout,
+            )
+            skip_simple_pages = _has_layout
         ocr = ThreadedPipelineStage(
             name="ocr",
             model=self.ocr_model,
@@ -543,6 +1004,8 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            page_timeout=opts.page_timeout,
+            skip=skip_simple_pages,
         )
         layout = ThreadedPipelineStage(
             name="layout",
@@ -551,6 +1014,8 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            page_timeout=opts.page_timeout,
+            skip=skip_simple_pages,
         )
         table = ThreadedPipelineStage(
             name="table",
@@ -559,6 +1024,7 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
             timed_out_run_ids=timed_out_run_ids,
+            page_timeout=opts.page_timeout,
         )
         assemble = ThreadedPipelineStage(
             name="assemble",
@@ -566,19 +1032,26 @@ class StandardPdfPipeline(ConvertPipeline):
             batch_size=1,
             batch_timeout=opts.batch_polling_interval_seconds,
             queue_max_size=opts.queue_max_size,
-            postprocess=self._release_page_resources,
+            postprocess=release_page,
             timed_out_run_ids=timed_out_run_ids,
+            page_timeout=opts.page_timeout,
         )
 
         # wire stages
         output_q = ThreadedQueue(opts.queue_max_size)
-        preprocess.add_output_queue(ocr.input_queue)
+        if page_classifier is not None:
+            preprocess.add_output_queue(page_classifier.input_queue)
+            page_classifier.add_output_queue(ocr.input_queue)
+        else:
+            preprocess.add_output_queue(ocr.input_queue)
         ocr.add_output_queue(layout.input_queue)
         layout.add_output_queue(table.input_queue)
         table.add_output_queue(assemble.input_queue)
         assemble.add_output_queue(output_q)
 
         stages = [preprocess, ocr, layout, table, assemble]
+        if page_classifier is not None:
+            stages.insert(1, page_classifier)
         return RunContext(
             stages=stages,
             first_stage=preprocess,
@@ -612,11 +1085,30 @@ class StandardPdfPipeline(ConvertPipeline):
             return conv_res
 
         total_pages: int = len(pages)
-        ctx: RunContext = self._create_run_ctx()
+        proc = ProcessingResult(total_expected=total_pages)
+
+        # Pages completed by a previous run are restored instead of being processed
+        checkpoint = self._get_checkpoint_store(conv_res)
+        if checkpoint is not None:
+            pages_to_process: list[Page] = []
+            for page in pages:
+                restored = checkpoint.load(page.page_no)
+                if restored is None:
+                    pages_to_process.append(page)
+                else:
+                    proc.pages.append(self._restore_page(conv_res, *restored))
+            if proc.pages:
+                _log.info(
+                    f"Restored {len(proc.pages)} of {total_pages} pages "
+                    f"from {checkpoint.directory}"
+                )
+            pages = pages_to_process
+        num_to_process: int = len(pages)
+
+        ctx: RunContext = self._create_run_ctx(checkpoint=checkpoint)
         for st in ctx.stages:
             st.start()
 
-        proc = ProcessingResult(total_expected=total_pages)
         fed_idx: int = 0  # number of pages successfully queued
         batch_size: int = 32  # drain chunk
         start_time = time.monotonic()
@@ -624,6 +1116,9 @@ class StandardPdfPipeline(ConvertPipeline):
         input_queue_closed = False
         try:
             while proc.success_count + proc.failure_count < total_pages:
+                # Stop the stages and fail the conversion if it was cancelled
+                conv_res._cancel_token.raise_if_cancelled()
+
                 # Check timeout
                 if (
                     self.pipeline_options.document_timeout is not None
@@ -645,7 +1140,7 @@ class StandardPdfPipeline(ConvertPipeline):
 
                 # 1) feed - try to enqueue until the first queue is full
                 if not input_queue_closed:
-                    while fed_idx < total_pages:
+                    while fed_idx < num_to_process:
                         ok = ctx.first_stage.input_queue.put(
                             ThreadedItem(
                                 payload=pages[fed_idx],
@@ -657,7 +1152,7 @@ class StandardPdfPipeline(ConvertPipeline):
                         )
                         if ok:
                             fed_idx += 1
-                            if fed_idx == total_pages:
+                            if fed_idx == num_to_process:
                                 ctx.first_stage.input_queue.close()
                                 input_queue_closed = True
                         else:  # queue full - switch to draining
@@ -699,8 +1194,14 @@ class StandardPdfPipeline(ConvertPipeline):
             for st in ctx.stages:
                 st.stop()
             ctx.output_queue.close()
+            # the metrics report the memory of the run, released just after
+            conv_res.stage_metrics = {st.name: st.metrics() for st in ctx.stages}
+            self._memory_budget.release_run(run_id)
 
         self._integrate_results(conv_res, proc, timeout_exceeded=timeout_exceeded)
+        # the checkpoints are kept to resume after a timeout or a page failure
+        if checkpoint is not None and conv_res.status == ConversionStatus.SUCCESS:
+            checkpoint.remove()
         return conv_res
 
     # ---------------------------------------------------- integrate_results()
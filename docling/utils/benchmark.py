@@ -0,0 +1,203 @@
+"""Reproducible throughput benchmark of the conversion pipelines.
+
+The benchmark converts a fixed set of inputs, made of synthetic documents generated
+on the fly and of the fixtures bundled with the repository tests, and reports the
+throughput, the latency percentiles of each pipeline stage, the peak memory and the
+model load time. The report is a pydantic model, so that runs of different
+versions can be saved as JSON and compared.
+"""
+
+import logging
+import platform
+import sys
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from pydantic import BaseModel
+
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    DocumentStream,
+    InputFormat,
+)
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter, FormatOption
+from docling.utils.synthetic import synthetic_fixtures
+
+_log = logging.getLogger(__name__)
+
+# Inputs of the repository tests, relative to tests/data, used as bundled fixtures
+BUNDLED_FIXTURES = [
+    "pdf/2305.03393v1-pg9.pdf",
+    "pdf/multi_page.pdf",
+    "pdf/redp5110_sampled.pdf",
+    "docx/word_sample.docx",
+    "docx/word_tables.docx",
+    "pptx/powerpoint_sample.pptx",
+    "xlsx/xlsx_01.xlsx",
+    "html/wiki_duck.html",
+    "md/wiki.md",
+    "csv/csv-comma.csv",
+]
+
+
+class StageLatency(BaseModel):
+    """Latency percentiles of a pipeline stage, in seconds."""
+
+    count: int
+    total: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class DocumentBenchmark(BaseModel):
+    """Outcome of the conversion of one benchmark input."""
+
+    name: str
+    format: Optional[InputFormat] = None
+    status: ConversionStatus
+    pages: int = 0
+    elapsed: float
+
+
+class BenchmarkReport(BaseModel):
+    """Results of a benchmark run."""
+
+    docling_version: str
+    python_version: str = platform.python_version()
+    platform: str = platform.platform()
+    repeat: int
+    documents: list[DocumentBenchmark] = []
+    num_pages: int = 0
+    total_time: float = 0.0
+    pages_per_second: float = 0.0
+    documents_per_second: float = 0.0
+    # time to initialize the pipelines, including the model loading, per format
+    model_load_time: dict[InputFormat, float] = {}
+    stages: dict[str, StageLatency] = {}
+    # peak resident set size of the process, unavailable on Windows
+    peak_rss_mb: Optional[float] = None
+
+
+def bundled_fixtures(data_dir: Union[str, Path]) -> list[Path]:
+    """Get the bundled fixtures available in the test data directory.
+
+    The fixtures are shipped with the repository, not with the package.
+
+    Args:
+        data_dir: The tests/data directory of a docling checkout.
+
+    Returns:
+        The paths of the available fixtures.
+    """
+    paths = [Path(data_dir) / name for name in BUNDLED_FIXTURES]
+    missing = [path for path in paths if not path.exists()]
+    if missing:
+        _log.warning(f"Skipping {len(missing)} missing fixtures in {data_dir}")
+
+    return [path for path in paths if path.exists()]
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of the current process, in MB."""
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # in bytes on macOS, in kilobytes elsewhere
+    return max_rss / 1024**2 if sys.platform == "darwin" else max_rss / 1024
+
+
+def run_benchmark(
+    sources: Iterable[Union[Path, DocumentStream]],
+    format_options: Optional[Mapping[InputFormat, FormatOption]] = None,
+    repeat: int = 1,
+) -> BenchmarkReport:
+    """Convert the benchmark inputs and measure the performance of the pipelines.
+
+    The pipelines of all the input formats are initialized before the conversions,
+    so that the model loading is reported separately from the throughput. The
+    pipeline timings are recorded during the run.
+
+    Args:
+        sources: The inputs to convert.
+        format_options: The format options of the converter, to select and
+            configure the pipelines.
+        repeat: The number of times each input is converted.
+
+    Returns:
+        The benchmark report.
+    """
+    from docling.datamodel.document import DoclingVersion, _DocumentConversionInput
+
+    sources = list(sources)
+    converter = DocumentConverter(
+        format_options=dict(format_options) if format_options is not None else None
+    )
+    report = BenchmarkReport(
+        docling_version=DoclingVersion().docling_version, repeat=repeat
+    )
+
+    # the formats are detected with the same logic as the conversion
+    conv_input = _DocumentConversionInput(path_or_stream_iterator=sources)
+    formats = {conv_input._guess_format(source) for source in sources}
+    for fmt in sorted(f for f in formats if f in converter.format_to_options):
+        start = time.monotonic()
+        converter.initialize_pipeline(fmt)
+        report.model_load_time[fmt] = time.monotonic() - start
+
+    stage_times: dict[str, list[float]] = {}
+    profile_timings = settings.debug.profile_pipeline_timings
+    settings.debug.profile_pipeline_timings = True
+    try:
+        run_start = time.monotonic()
+        for _ in range(repeat):
+            for source in sources:
+                if isinstance(source, DocumentStream):
+                    source.stream.seek(0)
+                name = source.name
+                start = time.monotonic()
+                conv_res = converter.convert(source, raises_on_error=False)
+                report.documents.append(
+                    DocumentBenchmark(
+                        name=name,
+                        format=conv_res.input.format,
+                        status=conv_res.status,
+                        pages=len(conv_res.pages),
+                        elapsed=time.monotonic() - start,
+                    )
+                )
+                for key, item in conv_res.timings.items():
+                    stage_times.setdefault(key, []).extend(item.times)
+        report.total_time = time.monotonic() - run_start
+    finally:
+        settings.debug.profile_pipeline_timings = profile_timings
+
+    report.num_pages = sum(doc.pages for doc in report.documents)
+    if report.total_time > 0:
+        report.pages_per_second = report.num_pages / report.total_time
+        report.documents_per_second = len(report.documents) / report.total_time
+    for key, times in stage_times.items():
+        if not times:
+            continue
+        p50, p90, p99 = np.percentile(times, [50, 90, 99])
+        report.stages[key] = StageLatency(
+            count=len(times),
+            total=float(np.sum(times)),
+            mean=float(np.mean(times)),
+            p50=float(p50),
+            p90=float(p90),
+            p99=float(p99),
+            max=float(np.max(times)),
+        )
+    report.peak_rss_mb = get_peak_rss_mb()
+
+    return report
@@ -0,0 +1,28 @@
+import threading
+
+from docling.exceptions import ConversionCancelled
+
+
+class CancellationToken:
+    """Cooperative cancellation of running conversions.
+
+    The token is checked by the pipelines between pages, batches and stages. A
+    model call already in progress is not interrupted, the conversion stops at the
+    next check.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request the cancellation of the conversions using this token."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise `ConversionCancelled` if the cancellation was requested."""
+        if self._event.is_set():
+            raise ConversionCancelled("The conversion was cancelled.")
@@ -0,0 +1,113 @@
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+
+from docling.datamodel.base_models import ConversionStatus
+
+if TYPE_CHECKING:
+    from docling.datamodel.document import ConversionResult
+
+_log = logging.getLogger(__name__)
+
+
+class ManifestEntry(BaseModel):
+    """The record of the conversion of one input file."""
+
+    input: str
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    document_hash: Optional[str] = None
+    status: ConversionStatus
+    timestamp: datetime
+    elapsed: Optional[float] = None
+    timings: dict[str, float] = {}
+
+
+class ConversionManifest:
+    """Record of a batch conversion, stored as JSON lines.
+
+    Each conversion appends one entry with the input path, its size and
+    modification time, the document hash, the status and the timings. The
+    manifest is reloaded when it already exists, so that the inputs which were
+    converted successfully and did not change since can be skipped on a re-run.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._entries: dict[str, ManifestEntry] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as fr:
+                for line_no, line in enumerate(fr, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = ManifestEntry.model_validate_json(line)
+                    except ValidationError:
+                        # e.g. the last line of an interrupted run
+                        _log.warning(f"Skipping invalid line {line_no} of {self.path}")
+                        continue
+                    # the last entry of an input wins
+                    self._entries[entry.input] = entry
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return str(Path(path).resolve())
+
+    def get(self, path: Union[str, Path]) -> Optional[ManifestEntry]:
+        """Get the last recorded entry of an input file."""
+        return self._entries.get(self._key(path))
+
+    def is_converted(self, path: Union[str, Path]) -> bool:
+        """Check if an input file was converted successfully and did not change."""
+        entry = self.get(path)
+        if entry is None or entry.status != ConversionStatus.SUCCESS:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+
+        return entry.size == stat.st_size and entry.mtime == stat.st_mtime
+
+    def record(
+        self, conv_res: "ConversionResult", elapsed: Optional[float] = None
+    ) -> ManifestEntry:
+        """Append the outcome of a conversion to the manifest.
+
+        Args:
+            conv_res: The conversion result.
+            elapsed: The wall-clock time spent on the document, in seconds.
+                Defaults to the conversion time of the result.
+
+        Returns:
+            The recorded entry.
+        """
+        input_path = Path(conv_res.input.file)
+        entry = ManifestEntry(
+            input=self._key(input_path),
+            document_hash=conv_res.input.document_hash,
+            status=conv_res.status,
+            timestamp=datetime.now(timezone.utc),
+            elapsed=elapsed if elapsed is not None else conv_res.conversion_time,
+            timings={key: item.total() for key, item in conv_res.timings.items()},
+        )
+        try:
+            stat = os.stat(input_path)
+            entry.size = stat.st_size
+            entry.mtime = stat.st_mtime
+        except OSError:
+            pass
+
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as fw:
+                fw.write(entry.model_dump_json() + "\n")
+            self._entries[entry.input] = entry
+
+        return entry
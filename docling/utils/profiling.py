@@ -1,7 +1,9 @@
+import threading
 import time
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import numpy as np
 from pydantic import BaseModel
@@ -17,11 +19,19 @@ class ProfilingScope(str, Enum):
     DOCUMENT = "document"
 
 
+class ProfilingFormat(str, Enum):
+    JSON = "json"
+    CHROME_TRACE = "chrome_trace"
+    PROMETHEUS = "prometheus"
+
+
 class ProfilingItem(BaseModel):
     scope: ProfilingScope
     count: int = 0
     times: List[float] = []
     start_timestamps: List[datetime] = []
+    thread_ids: List[int] = []
+    page_nos: List[Optional[int]] = []
 
     def total(self) -> float:
         return np.sum(self.times)  # type: ignore
@@ -39,27 +49,177 @@ class ProfilingItem(BaseModel):
         return np.percentile(self.times, perc)  # type: ignore
 
 
+class QueueMetrics(BaseModel):
+    """Occupancy of a bounded queue between pipeline stages."""
+
+    max_size: int
+    max_depth: int = 0
+    mean_depth: float = 0.0
+
+
+class StageMetrics(BaseModel):
+    """Utilization of a threaded pipeline stage during one run.
+
+    The time of the stage worker is split between waiting for input items
+    (`idle_time`), running the model (`process_time`), waiting for room in the
+    downstream queues (`blocked_time`) and waiting for the memory budget
+    (`throttled_time`).
+    """
+
+    batch_size: int
+    batches: int = 0
+    items: int = 0
+    max_batch_size: int = 0
+    process_time: float = 0.0
+    idle_time: float = 0.0
+    blocked_time: float = 0.0
+    # waiting for the memory budget before admitting new items
+    throttled_time: float = 0.0
+    # high-water mark of the estimated bytes held by the pages in flight
+    memory_high_water: Optional[int] = None
+    input_queue: Optional[QueueMetrics] = None
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    @property
+    def utilization(self) -> float:
+        total = (
+            self.process_time + self.idle_time + self.blocked_time + self.throttled_time
+        )
+        return self.process_time / total if total > 0 else 0.0
+
+
 class TimeRecorder:
     def __init__(
         self,
         conv_res: "ConversionResult",
         key: str,
         scope: ProfilingScope = ProfilingScope.PAGE,
+        page_no: Optional[int] = None,
     ):
-        if settings.debug.profile_pipeline_timings:
+        # read once, so that a span is fully recorded or skipped even if the
+        # setting changes in the meantime
+        self.enabled = settings.debug.profile_pipeline_timings
+        if self.enabled:
             if key not in conv_res.timings.keys():
                 conv_res.timings[key] = ProfilingItem(scope=scope)
             self.conv_res = conv_res
             self.key = key
+            self.page_no = page_no
 
     def __enter__(self):
-        if settings.debug.profile_pipeline_timings:
+        if self.enabled:
             self.start = time.monotonic()
-            self.conv_res.timings[self.key].start_timestamps.append(datetime.utcnow())
+            self.start_timestamp = datetime.utcnow()
         return self
 
     def __exit__(self, *args):
-        if settings.debug.profile_pipeline_timings:
+        if self.enabled:
             elapsed = time.monotonic() - self.start
-            self.conv_res.timings[self.key].times.append(elapsed)
-            self.conv_res.timings[self.key].count += 1
+            # all the fields of a span are appended together, so that they stay
+            # aligned when the same stage is recorded from several threads
+            item = self.conv_res.timings[self.key]
+            item.start_timestamps.append(self.start_timestamp)
+            item.times.append(elapsed)
+            item.thread_ids.append(threading.get_ident())
+            item.page_nos.append(self.page_no)
+            item.count += 1
+
+
+def to_chrome_trace(
+    timings: Mapping[str, ProfilingItem],
+    process_name: Optional[str] = None,
+    pid: int = 0,
+) -> dict[str, Any]:
+    """Convert the profiling timings to the Chrome trace-event format.
+
+    Each recorded span becomes a complete event on the thread which recorded it,
+    with the page number in its arguments for the page-level stages. The result can
+    be saved as JSON and opened in chrome://tracing or Perfetto.
+
+    Args:
+        timings: The profiling timings, e.g. `ConversionResult.timings`.
+        process_name: The name of the process in the trace, e.g. the document name.
+        pid: The process id of the events, to merge the traces of several documents.
+
+    Returns:
+        The trace, in the JSON object format.
+    """
+    events: list[dict[str, Any]] = []
+    if process_name is not None:
+        events.append(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": 0,
+                "args": {"name": process_name},
+            }
+        )
+
+    starts = [ts for item in timings.values() for ts in item.start_timestamps]
+    if starts:
+        origin = min(starts)
+        for key, item in timings.items():
+            for i, (start, elapsed) in enumerate(
+                zip(item.start_timestamps, item.times)
+            ):
+                event: dict[str, Any] = {
+                    "name": key,
+                    "cat": item.scope.value,
+                    "ph": "X",
+                    "ts": (start - origin).total_seconds() * 1e6,
+                    "dur": elapsed * 1e6,
+                    "pid": pid,
+                    # spans recorded before the thread ids were tracked
+                    "tid": item.thread_ids[i] if i < len(item.thread_ids) else 0,
+                }
+                if i < len(item.page_nos) and item.page_nos[i] is not None:
+                    event["args"] = {"page_no": item.page_nos[i]}
+                events.append(event)
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus(
+    timings: Mapping[str, ProfilingItem],
+    labels: Optional[Mapping[str, str]] = None,
+    quantiles: tuple[float, ...] = (0.5, 0.9, 0.99),
+) -> str:
+    """Convert the profiling timings to a Prometheus text-format snapshot.
+
+    The stage durations are exported as the summary metric
+    `docling_stage_duration_seconds`, with the `stage` and `scope` labels.
+
+    Args:
+        timings: The profiling timings, e.g. `ConversionResult.timings`.
+        labels: Additional labels of all the samples, e.g. the document name.
+        quantiles: The quantiles of the summary, between 0 and 1.
+
+    Returns:
+        The snapshot in the Prometheus text exposition format.
+    """
+    name = "docling_stage_duration_seconds"
+    lines = [
+        f"# HELP {name} Time spent in the conversion stages.",
+        f"# TYPE {name} summary",
+    ]
+    for key, item in timings.items():
+        sample_labels = {**(labels or {}), "stage": key, "scope": item.scope.value}
+        label_str = ",".join(
+            f'{k}="{_escape_label(str(v))}"' for k, v in sample_labels.items()
+        )
+        if item.times:
+            for q in quantiles:
+                value = float(np.quantile(item.times, q))
+                lines.append(f'{name}{{{label_str},quantile="{q}"}} {value}')
+        lines.append(f"{name}_sum{{{label_str}}} {float(np.sum(item.times))}")
+        lines.append(f"{name}_count{{{label_str}}} {len(item.times)}")
+
+    return "\n".join(lines) + "\n"
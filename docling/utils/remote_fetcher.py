@@ -0,0 +1,161 @@
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Iterable, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from docling.utils.utils import create_hash
+
+_log = logging.getLogger(__name__)
+
+
+class RemoteFetcher:
+    """Fetch remote resources concurrently, with an optional on-disk cache.
+
+    Each worker thread keeps its own `requests.Session`, so that connections to the
+    same host are reused across requests. Fetched bytes can be stored in a
+    content-addressed cache directory: the bytes are saved under the hash of their
+    content, and each URL points to the content hash. Resources shared by many
+    documents, like CDN assets, are then downloaded and stored only once.
+
+    The cache has no size limit and nothing is ever evicted from it. It is meant to
+    be cleared by the caller, e.g. by deleting the directory between batches.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        timeout: Optional[float] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._futures: dict[str, Future[bytes]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        if self.cache_dir is not None:
+            (self.cache_dir / "urls").mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / "blobs").mkdir(parents=True, exist_ok=True)
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """Start fetching the given URLs in the background.
+
+        Args:
+            urls: The URLs to fetch. Duplicated or already requested URLs are fetched
+                only once.
+        """
+        for url in urls:
+            if url in self._futures:
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="docling-fetch",
+                )
+            self._futures[url] = self._executor.submit(self._fetch, url)
+
+    def fetch(self, url: str) -> bytes:
+        """Get the content of a URL.
+
+        The result of a previous `prefetch` call is used if available.
+
+        Args:
+            url: The URL to fetch.
+
+        Returns:
+            The content of the resource.
+
+        Raises:
+            requests.RequestException: The resource could not be fetched.
+        """
+        future = self._futures.get(url)
+        if future is not None:
+            return future.result()
+
+        return self._fetch(url)
+
+    def close(self) -> None:
+        """Stop the worker threads and close the HTTP sessions."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._futures.clear()
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+    def _get_session(self) -> requests.Session:
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+
+        return session
+
+    def _fetch(self, url: str) -> bytes:
+        content = self._read_cache(url)
+        if content is not None:
+            _log.debug(f"Loaded {url} from the cache")
+            return content
+
+        response = self._get_session().get(url, timeout=self.timeout)
+        response.raise_for_status()
+        content = response.content
+        self._write_cache(url, content)
+
+        return content
+
+    def _read_cache(self, url: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+
+        url_file = self.cache_dir / "urls" / create_hash(url)
+        try:
+            content_hash = url_file.read_text().strip()
+            return (self.cache_dir / "blobs" / content_hash).read_bytes()
+        except OSError:
+            return None
+
+    def _write_cache(self, url: str, content: bytes) -> None:
+        if self.cache_dir is None:
+            return
+
+        content_hash = hashlib.sha256(content, usedforsecurity=False).hexdigest()
+        try:
+            blob_file = self.cache_dir / "blobs" / content_hash
+            if not blob_file.exists():
+                self._write_atomic(blob_file, content)
+            self._write_atomic(
+                self.cache_dir / "urls" / create_hash(url), content_hash.encode()
+            )
+        except OSError as e:
+            _log.warning(f"Could not cache the content of {url}: {e}")
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        # concurrent writers only ever see complete files
+        tmp = NamedTemporaryFile(dir=path.parent, delete=False)
+        try:
+            with tmp:
+                tmp.write(data)
+            os.replace(tmp.name, path)
+        finally:
+            # left over only if the write or the rename failed
+            Path(tmp.name).unlink(missing_ok=True)
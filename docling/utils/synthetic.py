@@ -0,0 +1,165 @@
+"""Synthetic documents, generated on the fly for benchmarks and warm-ups."""
+
+from io import BytesIO
+from typing import Optional, Union
+
+from PIL import Image, ImageDraw, ImageFont
+
+from docling.datamodel.base_models import DocumentStream, InputFormat
+
+_SENTENCE = "The quick brown fox jumps over the lazy dog. "
+
+
+def synthetic_fixtures(size: int = 50) -> list[DocumentStream]:
+    """Generate deterministic synthetic documents of the declarative formats.
+
+    Args:
+        size: The number of sections of the Markdown and HTML documents, and the
+            number of rows of the CSV document.
+
+    Returns:
+        The synthetic documents.
+    """
+    sentence = _SENTENCE * 8
+
+    md_lines = ["# Synthetic document", ""]
+    html_lines = ["<html><body><h1>Synthetic document</h1>"]
+    for i in range(size):
+        md_lines += [f"## Section {i}", "", sentence, "", f"- item {i}.1", ""]
+        html_lines += [f"<h2>Section {i}</h2>", f"<p>{sentence}</p>"]
+        if i % 10 == 0:
+            md_lines += ["| a | b | c |", "|---|---|---|"]
+            md_lines += [f"| {i} | {j} | {i * j} |" for j in range(5)]
+            md_lines += [""]
+            html_lines += ["<table><tr><th>a</th><th>b</th></tr>"]
+            html_lines += [f"<tr><td>{i}</td><td>{j}</td></tr>" for j in range(5)]
+            html_lines += ["</table>"]
+    html_lines += ["</body></html>"]
+    csv_lines = ["id,name,value"] + [f"{i},name {i},{i * 0.5}" for i in range(size)]
+
+    return [
+        DocumentStream(
+            name="synthetic.md", stream=BytesIO("\n".join(md_lines).encode())
+        ),
+        DocumentStream(
+            name="synthetic.html", stream=BytesIO("\n".join(html_lines).encode())
+        ),
+        DocumentStream(
+            name="synthetic.csv", stream=BytesIO("\n".join(csv_lines).encode())
+        ),
+    ]
+
+
+def _load_font(size: int) -> Union[ImageFont.ImageFont, ImageFont.FreeTypeFont]:
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:  # Pillow < 10.1 has no scalable default font
+        return ImageFont.load_default()
+
+
+def synthetic_page_image(page_no: int = 0) -> Image.Image:
+    """Render a scanned-like page with a title, paragraphs, a table and a picture.
+
+    The page exercises the layout, OCR and table structure models. It is rendered at
+    144 dpi on an A4 page.
+
+    Args:
+        page_no: The page number, printed in the title.
+
+    Returns:
+        The page image.
+    """
+    width, height = 1190, 1684
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    title_font = _load_font(44)
+    font = _load_font(24)
+    margin = 120
+
+    y = margin
+    draw.text(
+        (margin, y), f"Synthetic page {page_no + 1}", fill="black", font=title_font
+    )
+    y += 100
+    for _ in range(2):
+        for _ in range(6):
+            draw.text((margin, y), _SENTENCE * 2, fill="black", font=font)
+            y += 36
+        y += 30
+
+    # a ruled table with a header row
+    cols, rows, cell_w, cell_h = 4, 6, 220, 48
+    for row in range(rows + 1):
+        draw.line(
+            [(margin, y + row * cell_h), (margin + cols * cell_w, y + row * cell_h)],
+            fill="black",
+            width=2,
+        )
+    for col in range(cols + 1):
+        draw.line(
+            [(margin + col * cell_w, y), (margin + col * cell_w, y + rows * cell_h)],
+            fill="black",
+            width=2,
+        )
+    for row in range(rows):
+        for col in range(cols):
+            text = (
+                f"Column {col + 1}" if row == 0 else f"{(row * 7 + col * 3) % 97}.{col}"
+            )
+            draw.text(
+                (margin + col * cell_w + 16, y + row * cell_h + 10),
+                text,
+                fill="black",
+                font=font,
+            )
+    y += rows * cell_h + 80
+
+    # a picture made of filled shapes
+    draw.rectangle([margin, y, margin + 420, y + 300], fill=(70, 130, 180))
+    draw.ellipse([margin + 60, y + 40, margin + 260, y + 240], fill=(250, 200, 60))
+    draw.polygon(
+        [(margin + 300, y + 260), (margin + 400, y + 60), (margin + 410, y + 280)],
+        fill=(200, 60, 60),
+    )
+    draw.text(
+        (margin, y + 320), "Figure 1: A synthetic picture.", fill="black", font=font
+    )
+
+    return image
+
+
+def synthetic_document(
+    fmt: InputFormat, num_pages: int = 1
+) -> Optional[DocumentStream]:
+    """Generate a synthetic document of the given format.
+
+    Args:
+        fmt: The input format of the document.
+        num_pages: The number of pages of the PDF and TIFF documents.
+
+    Returns:
+        The synthetic document, or None if the format is not supported.
+    """
+    buff = BytesIO()
+    if fmt == InputFormat.PDF:
+        pages = [synthetic_page_image(i) for i in range(num_pages)]
+        pages[0].save(
+            buff, format="PDF", resolution=144, save_all=True, append_images=pages[1:]
+        )
+        name = "synthetic.pdf"
+    elif fmt == InputFormat.IMAGE:
+        synthetic_page_image().save(buff, format="PNG")
+        name = "synthetic.png"
+    else:
+        names = {
+            InputFormat.MD: "synthetic.md",
+            InputFormat.HTML: "synthetic.html",
+            InputFormat.CSV: "synthetic.csv",
+        }
+        return next(
+            (doc for doc in synthetic_fixtures(size=10) if doc.name == names.get(fmt)),
+            None,
+        )
+
+    buff.seek(0)
+    return DocumentStream(name=name, stream=buff)
@@ -0,0 +1,165 @@
+# %% [markdown]
+# Measure the accuracy delta and the speedup of the dynamic int8 quantization of
+# the layout and table structure models on CPU.
+#
+# What this example does
+# - Converts the bundled test PDFs with the models in float and with
+#   `dynamic_quantization=True`, in PyTorch and with ONNX Runtime.
+# - Matches the layout clusters of each quantized run to the float run (same label,
+#   IoU >= 0.5) and compares the grid shapes of the predicted tables.
+# - Prints the agreement and the time spent in the layout and table stages.
+#
+# Prerequisites
+# - Install `tabulate` for pretty printing (`pip install tabulate`).
+# - For the ONNX Runtime rows, install `onnxruntime` and `onnx`.
+#
+# How to run
+# - From the repo root: `python docs/examples/quantized_layout_accuracy.py`.
+#
+# Notes
+# - The accuracy delta of the quantized models on the reference documents is not
+#   published yet, so `dynamic_quantization` is experimental. Run this example on
+#   documents representative of your workload before enabling it.
+# - The quantized ONNX graphs are exported once and cached under the docling cache
+#   directory, the first run includes the export time.
+
+# %%
+
+from pathlib import Path
+
+from tabulate import tabulate
+
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import (
+    LayoutOptions,
+    PdfPipelineOptions,
+    TableStructureOptions,
+)
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter, PdfFormatOption
+
+settings.debug.profile_pipeline_timings = True
+
+data_folder = Path(__file__).parent / "../../tests/data/pdf"
+input_paths = sorted(data_folder.glob("*.pdf"))
+
+
+def convert_all(inference_engine: str, quantize: bool) -> list[ConversionResult]:
+    pipeline_options = PdfPipelineOptions(
+        do_ocr=False,
+        accelerator_options=AcceleratorOptions(device=AcceleratorDevice.CPU),
+        layout_options=LayoutOptions(
+            inference_engine=inference_engine, dynamic_quantization=quantize
+        ),
+        table_structure_options=TableStructureOptions(
+            inference_engine=inference_engine, dynamic_quantization=quantize
+        ),
+    )
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+    return list(converter.convert_all(input_paths, raises_on_error=False))
+
+
+def stage_time(results: list[ConversionResult], key: str) -> float:
+    return sum(res.timings[key].total() for res in results if key in res.timings)
+
+
+def compare(
+    baseline: list[ConversionResult], results: list[ConversionResult]
+) -> tuple[float, float, float]:
+    """Get the recall and precision of the layout clusters and the table agreement."""
+    matched = num_baseline = num_results = 0
+    same_tables = num_tables = 0
+    for base_res, res in zip(baseline, results):
+        for base_page, page in zip(base_res.pages, res.pages):
+            base_pred, pred = base_page.predictions, page.predictions
+            if base_pred.layout is None or pred.layout is None:
+                continue
+            clusters = list(pred.layout.clusters)
+            num_baseline += len(base_pred.layout.clusters)
+            num_results += len(clusters)
+            for base_cluster in base_pred.layout.clusters:
+                for cluster in clusters:
+                    if (
+                        cluster.label == base_cluster.label
+                        and cluster.bbox.intersection_over_union(base_cluster.bbox)
+                        >= 0.5
+                    ):
+                        matched += 1
+                        clusters.remove(cluster)
+                        break
+
+            if base_pred.tablestructure is None or pred.tablestructure is None:
+                continue
+            for table_id, base_table in base_pred.tablestructure.table_map.items():
+                num_tables += 1
+                table = pred.tablestructure.table_map.get(table_id)
+                if table is not None and (table.num_rows, table.num_cols) == (
+                    base_table.num_rows,
+                    base_table.num_cols,
+                ):
+                    same_tables += 1
+
+    return (
+        matched / num_baseline if num_baseline else 1.0,
+        matched / num_results if num_results else 1.0,
+        same_tables / num_tables if num_tables else 1.0,
+    )
+
+
+def main():
+    baseline = convert_all("torch", quantize=False)
+    rows = [
+        [
+            "torch",
+            "float",
+            1.0,
+            1.0,
+            1.0,
+            stage_time(baseline, "layout"),
+            stage_time(baseline, "table_structure"),
+        ]
+    ]
+    for inference_engine in ["torch", "onnxruntime"]:
+        for quantize in [False, True]:
+            if inference_engine == "torch" and not quantize:
+                continue
+            try:
+                results = convert_all(inference_engine, quantize=quantize)
+            except ImportError as exc:
+                print(f"Skipping {inference_engine}: {exc}")
+                break
+            rows.append(
+                [
+                    inference_engine,
+                    "int8" if quantize else "float",
+                    *compare(baseline, results),
+                    stage_time(results, "layout"),
+                    stage_time(results, "table_structure"),
+                ]
+            )
+
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "engine",
+                "weights",
+                "layout recall",
+                "layout precision",
+                "same table grid",
+                "layout time [s]",
+                "table time [s]",
+            ],
+            floatfmt=".3f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
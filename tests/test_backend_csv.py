@@ -1,10 +1,13 @@
+import warnings
+from io import BytesIO
 from pathlib import Path
 
 from pytest import warns
 
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.backend_options import CsvBackendOptions
+from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.document import ConversionResult, DoclingDocument
-from docling.document_converter import DocumentConverter
+from docling.document_converter import CsvFormatOption, DocumentConverter
 
 from .test_data_gen_flag import GEN_TEST_DATA
 from .verify_utils import verify_document, verify_export
@@ -85,3 +88,52 @@ def test_e2e_invalid_csv_conversions():
     print(f"converting {csv_inconsistent_header}")
     with warns(UserWarning, match="Inconsistent column lengths"):
         converter.convert(csv_inconsistent_header)
+
+
+def test_e2e_csv_streaming():
+    converter = get_converter()
+    stream_converter = DocumentConverter(
+        allowed_formats=[InputFormat.CSV],
+        format_options={
+            InputFormat.CSV: CsvFormatOption(
+                backend_options=CsvBackendOptions(streaming=True)
+            )
+        },
+    )
+
+    for csv_path in get_csv_paths():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            doc = converter.convert(csv_path).document
+            stream_doc = stream_converter.convert(csv_path).document
+            buf = BytesIO(csv_path.read_bytes())
+            stream_doc_io = stream_converter.convert(
+                DocumentStream(name=csv_path.name, stream=buf)
+            ).document
+
+        assert stream_doc.export_to_dict() == doc.export_to_dict()
+        assert stream_doc_io.export_to_markdown() == doc.export_to_markdown()
+
+
+def test_csv_max_cells_per_table():
+    content = "a,b,c\n" + "".join(f"{i},{i + 1},{i + 2}\n" for i in range(10))
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.CSV],
+        format_options={
+            InputFormat.CSV: CsvFormatOption(
+                backend_options=CsvBackendOptions(
+                    streaming=True, max_cells_per_table=12
+                )
+            )
+        },
+    )
+    stream = DocumentStream(name="numbers.csv", stream=BytesIO(content.encode()))
+    doc = converter.convert(stream).document
+
+    # the header and at most 3 rows per table
+    assert [table.data.num_rows for table in doc.tables] == [4, 4, 4, 2]
+    for table in doc.tables:
+        assert [cell.text for cell in table.data.grid[0]] == ["a", "b", "c"]
+        assert all(cell.column_header for cell in table.data.grid[0])
+    rows = [row[0].text for table in doc.tables for row in table.data.grid[1:]]
+    assert rows == [str(i) for i in range(10)]
@@ -1,3 +1,5 @@
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from io import BytesIO
 from pathlib import Path, PurePath
 from unittest.mock import Mock, mock_open, patch
@@ -10,7 +12,7 @@ from pydantic import AnyUrl, ValidationError
 
 from docling.backend.html_backend import HTMLDocumentBackend
 from docling.datamodel.backend_options import HTMLBackendOptions
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.document import (
     ConversionResult,
     DoclingDocument,
@@ -18,6 +20,7 @@ from docling.datamodel.document import (
     SectionHeaderItem,
 )
 from docling.document_converter import DocumentConverter, HTMLFormatOption
+from docling.utils.remote_fetcher import RemoteFetcher
 
 from .test_data_gen_flag import GEN_TEST_DATA
 from .verify_utils import verify_document, verify_export
@@ -186,6 +189,11 @@ def test_unicode_characters():
     assert doc.texts[0].text == "Hello World!"
 
 
+def test_clean_unicode():
+    text = "\u201cquoted\u201d \u2013 it\u2019s\u00a0a\u200btest\u2026"
+    assert HTMLDocumentBackend._clean_unicode(text) == '"quoted" - it\'s atest...'
+
+
 def test_extract_parent_hyperlinks():
     html_path = Path("./tests/data/html/hyperlink_04.html")
     in_doc = InputDocument(
@@ -250,6 +258,26 @@ def test_e2e_html_conversions(html_paths):
         assert verify_document(doc, str(gt_path) + ".json", GENERATE)
 
 
+def test_e2e_html_conversions_lxml(html_paths):
+    """Test that the lxml parser yields the same documents as html.parser."""
+    converter = get_converter()
+    lxml_converter = DocumentConverter(
+        allowed_formats=[InputFormat.HTML],
+        format_options={
+            InputFormat.HTML: HTMLFormatOption(
+                backend_options=HTMLBackendOptions(parser="lxml")
+            )
+        },
+    )
+
+    for html_path in html_paths:
+        doc = converter.convert(html_path).document
+        lxml_doc = lxml_converter.convert(html_path).document
+        assert lxml_doc.export_to_dict() == doc.export_to_dict(), (
+            f"lxml parser mismatch on {html_path}"
+        )
+
+
 @patch("docling.backend.html_backend.requests.get")
 @patch("docling.backend.html_backend.open", new_callable=mock_open)
 def test_e2e_html_conversion_with_images(mock_local, mock_remote):
@@ -559,3 +587,87 @@ def test_fix_invalid_paragraph_structure(html, expected):
     soup = BeautifulSoup(html, "html.parser")
     HTMLDocumentBackend._fix_invalid_paragraph_structure(soup)
     assert str(soup) == expected
+
+
+@pytest.fixture
+def image_server():
+    """Serve the HTML test data through a local HTTP server, counting requests."""
+    requested: list[str] = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory="tests/data/html", **kwargs)
+
+        def do_GET(self):
+            requested.append(self.path)
+            super().do_GET()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requested
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_remote_images_concurrently(image_server, tmp_path):
+    base_url, requested = image_server
+    num_images = 8
+    raw_html = (
+        "<html><body><h1>Images</h1>"
+        + "".join(
+            f'<img src="example_image_01.png?id={i % 4}">' for i in range(num_images)
+        )
+        + "</body></html>"
+    ).encode()
+
+    backend_options = HTMLBackendOptions(
+        enable_remote_fetch=True,
+        fetch_images=True,
+        source_uri=f"{base_url}/example_01.html",
+        fetch_workers=4,
+        fetch_timeout=10,
+        fetch_cache_dir=tmp_path / "cache",
+    )
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.HTML],
+        format_options={
+            InputFormat.HTML: HTMLFormatOption(backend_options=backend_options)
+        },
+    )
+
+    def _convert() -> DoclingDocument:
+        stream = DocumentStream(name="images.html", stream=BytesIO(raw_html))
+        doc = converter.convert(stream).document
+        assert len(doc.pictures) == num_images
+        assert all(pic.image is not None for pic in doc.pictures)
+        return doc
+
+    # each distinct URL is fetched once
+    doc = _convert()
+    assert sorted(requested) == [f"/example_image_01.png?id={i}" for i in range(4)]
+    # the same content is stored once in the cache
+    assert len(list((tmp_path / "cache" / "blobs").iterdir())) == 1
+    assert len(list((tmp_path / "cache" / "urls").iterdir())) == 4
+
+    # a new conversion is served from the cache
+    requested.clear()
+    assert _convert() == doc
+    assert requested == []
+
+
+def test_fetch_cache_write_failure(tmp_path, monkeypatch):
+    fetcher = RemoteFetcher(cache_dir=tmp_path)
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    # the temporary files of a failed write are removed
+    monkeypatch.setattr("docling.utils.remote_fetcher.os.replace", fail)
+    fetcher._write_cache("http://example.com/image.png", b"image")
+    assert list((tmp_path / "blobs").iterdir()) == []
+    assert list((tmp_path / "urls").iterdir()) == []
+    assert fetcher._read_cache("http://example.com/image.png") is None
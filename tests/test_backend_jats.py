@@ -4,9 +4,10 @@ from pathlib import Path
 
 from docling_core.types.doc import DoclingDocument
 
+from docling.datamodel.backend_options import JatsBackendOptions
 from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.document import ConversionResult
-from docling.document_converter import DocumentConverter
+from docling.document_converter import DocumentConverter, XMLJatsFormatOption
 
 from .test_data_gen_flag import GEN_TEST_DATA
 from .verify_utils import verify_document, verify_export
@@ -20,14 +21,21 @@ def get_jats_paths():
     return xml_files
 
 
-def get_converter():
-    converter = DocumentConverter(allowed_formats=[InputFormat.XML_JATS])
+def get_converter(iterparse=False):
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.XML_JATS],
+        format_options={
+            InputFormat.XML_JATS: XMLJatsFormatOption(
+                backend_options=JatsBackendOptions(iterparse=iterparse)
+            )
+        },
+    )
     return converter
 
 
-def test_e2e_jats_conversions(use_stream=False):
+def test_e2e_jats_conversions(use_stream=False, iterparse=False):
     jats_paths = get_jats_paths()
-    converter = get_converter()
+    converter = get_converter(iterparse=iterparse)
 
     for jats_path in jats_paths:
         gt_path = (
@@ -60,3 +68,8 @@ def test_e2e_jats_conversions_stream():
 
 def test_e2e_jats_conversions_no_stream():
     test_e2e_jats_conversions(use_stream=False)
+
+
+def test_e2e_jats_conversions_iterparse():
+    test_e2e_jats_conversions(use_stream=True, iterparse=True)
+    test_e2e_jats_conversions(use_stream=False, iterparse=True)
@@ -3,8 +3,10 @@ from io import BytesIO
 from pathlib import Path
 
 import pytest
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet.cell_range import CellRange
 
+from docling.backend import msexcel_backend
 from docling.backend.msexcel_backend import MsExcelDocumentBackend
 from docling.datamodel.backend_options import MsExcelBackendOptions
 from docling.datamodel.base_models import InputFormat
@@ -312,3 +314,86 @@ def test_bytesio_stream():
     assert doc.pages.get(2).size.as_tuple() == (9.0, 18.0)
     assert doc.pages.get(3).size.as_tuple() == (13.0, 36.0)
     assert doc.pages.get(4).size.as_tuple() == (0.0, 0.0)
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_read_only_mode(documents, monkeypatch, streaming: bool) -> None:
+    """Test that the read-only mode yields the same tables as the default mode.
+
+    Images are not available in read-only mode, so only the tables are compared,
+    including the merged cells of xlsx_01. Without the openpyxl internals to stream
+    the worksheets, the backend falls back to the default mode.
+
+    Args:
+        documents: The paths and converted documents.
+        monkeypatch: The pytest monkeypatch fixture.
+        streaming: Whether the openpyxl internals are available.
+    """
+    if not streaming:
+        monkeypatch.setattr(msexcel_backend, "WorkSheetParser", None)
+    options = MsExcelBackendOptions(read_only=True)
+    format_options = {InputFormat.XLSX: ExcelFormatOption(backend_options=options)}
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.XLSX], format_options=format_options
+    )
+
+    for path in get_excel_paths():
+        conv_result: ConversionResult = converter.convert(path)
+        doc: DoclingDocument = conv_result.document
+        gt_path = path.parent.parent / "groundtruth" / "docling_v2" / path.name
+        ref_doc = next(item for gt, item in documents if gt == gt_path)
+
+        assert len(doc.pages) == len(ref_doc.pages)
+        assert len(doc.pictures) == (0 if streaming else len(ref_doc.pictures))
+        assert len(doc.tables) == len(ref_doc.tables)
+        for table, ref_table in zip(doc.tables, ref_doc.tables):
+            assert table.data == ref_table.data
+            assert table.prov == ref_table.prov
+
+
+def test_merged_cells_index():
+    """Test the table spans of a worksheet with many merged cell ranges."""
+    wb = Workbook()
+    ws = wb.active
+    num_rows = 200
+    for row in range(1, num_rows + 1):
+        ws.cell(row=row, column=1, value=f"label {row}")
+        ws.cell(row=row, column=2, value=row)
+        ws.merge_cells(start_row=row, start_column=2, end_row=row, end_column=3)
+
+    buf = BytesIO()
+    wb.save(buf)
+    buf.seek(0)
+
+    in_doc = InputDocument(
+        path_or_stream=buf,
+        format=InputFormat.XLSX,
+        filename="merged.xlsx",
+        backend=MsExcelDocumentBackend,
+    )
+    backend = MsExcelDocumentBackend(in_doc=in_doc, path_or_stream=buf)
+    merged_cells = backend._index_merged_cells(list(ws.merged_cells.ranges))
+    assert str(merged_cells.get(10, 3)) == "B10:C10"
+    assert str(merged_cells.get(200, 2)) == "B200:C200"
+    assert merged_cells.get(10, 1) is None
+    assert merged_cells.get(num_rows + 1, 2) is None
+
+    # a whole-row and a whole-column merge are looked up by their bounds
+    banners = backend._index_merged_cells(
+        [CellRange("A1:XFD1"), CellRange("A2:A1048576")]
+    )
+    assert str(banners.get(1, 16384)) == "A1:XFD1"
+    assert str(banners.get(1048576, 1)) == "A2:A1048576"
+    assert banners.get(5, 2) is None
+
+    doc = backend.convert()
+    assert len(doc.tables) == 1
+    table = doc.tables[0]
+    assert table.data.num_rows == num_rows
+    assert table.data.num_cols == 3
+    assert len(table.data.table_cells) == 2 * num_rows
+    assert all(
+        cell.col_span == 2
+        for cell in table.data.table_cells
+        if cell.start_col_offset_idx == 1
+    )
@@ -2,11 +2,14 @@ import logging
 import os
 from pathlib import Path
 
+import pypdfium2
 import pytest
 from docling_core.types.doc import GroupItem
+from docx import Document
 
 from docling.backend.docx.drawingml.utils import get_libreoffice_cmd
 from docling.backend.msword_backend import MsWordDocumentBackend
+from docling.datamodel.backend_options import MsWordBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import (
     ConversionResult,
@@ -252,3 +255,57 @@ def test_handle_pictures(documents):
     assert doc.pictures[2].parent == doc.pictures[3].parent
     assert isinstance(doc.pictures[4].parent.resolve(doc), SectionHeaderItem)
     assert doc.pictures[4].parent == doc.pictures[5].parent
+
+
+def test_numbering_formats():
+    path = Path("./tests/data/docx/unit_test_lists.docx")
+    in_doc = InputDocument(
+        path_or_stream=path,
+        format=InputFormat.DOCX,
+        backend=MsWordDocumentBackend,
+        filename=path.name,
+    )
+    backend = MsWordDocumentBackend(in_doc=in_doc, path_or_stream=path)
+
+    assert backend.numbering_formats[(1, 0)] == "bullet"
+    assert backend.numbering_formats[(2, 1)] == "lowerLetter"
+    assert not backend._is_numbered_list(1, 0)
+    assert backend._is_numbered_list(2, 0)
+    assert backend._is_numbered_list(2, 2)
+    assert not backend._is_numbered_list(99, 0)
+
+
+def test_batch_drawingml():
+    """Test that the DrawingML elements are rendered with one converter call."""
+    calls: list[int] = []
+
+    def fake_converter(input_path, output_path):
+        # one blank PDF page per paragraph of the DrawingML document
+        num_pages = len(Document(str(input_path)).paragraphs)
+        calls.append(num_pages)
+        pdf = pypdfium2.PdfDocument.new()
+        for _ in range(num_pages):
+            pdf.new_page(100, 100)
+        pdf.save(str(output_path))
+
+    path = Path("./tests/data/docx/drawingml.docx")
+    for batch_drawingml, expected_calls in ((False, [1, 1]), (True, [2])):
+        calls.clear()
+        in_doc = InputDocument(
+            path_or_stream=path,
+            format=InputFormat.DOCX,
+            backend=MsWordDocumentBackend,
+            filename=path.name,
+        )
+        backend = MsWordDocumentBackend(
+            in_doc=in_doc,
+            path_or_stream=path,
+            options=MsWordBackendOptions(batch_drawingml=batch_drawingml),
+        )
+        backend.docx_to_pdf_converter = fake_converter
+        backend.docx_to_pdf_converter_init = True
+        doc = backend.convert()
+
+        assert calls == expected_calls
+        assert len(doc.pictures) == 2
+        assert all(pic.image is not None for pic in doc.pictures)
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -10,8 +11,9 @@ from docling_core.types import DoclingDocument
 from docling_core.types.doc import DocItemLabel, TableData, TextItem
 
 from docling.backend.xml.uspto_backend import PatentUsptoDocumentBackend, XmlTable
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.datamodel.document import InputDocument
+from docling.document_converter import DocumentConverter
 
 from .test_data_gen_flag import GEN_TEST_DATA
 from .verify_utils import CONFID_PREC, COORD_PREC, verify_document
@@ -464,3 +466,22 @@ def test_patent_uspto_grant_aps(patents):
     assert len(doc.tables) == 0
     for item in texts:
         assert "##STR1##" not in item.text
+
+
+def test_patent_uspto_split_bulk(patents):
+    """Test the conversion of a bulk file with several concatenated patents."""
+    file_names = ["ipg07997973.xml", "ipg08672134.xml", "ipgD0701016.xml"]
+    bulk = BytesIO(
+        b"\n".join((DATA_PATH / name).read_bytes().rstrip() for name in file_names)
+    )
+
+    streams = PatentUsptoDocumentBackend.split_bulk(bulk, name="ipg_bulk.xml")
+    converter = DocumentConverter(allowed_formats=[InputFormat.XML_USPTO])
+    results = list(converter.convert_all(streams))
+
+    assert len(results) == len(file_names)
+    for idx, (res, name) in enumerate(zip(results, file_names), start=1):
+        assert res.status == ConversionStatus.SUCCESS
+        assert res.input.file.name == f"ipg_bulk_{idx}.xml"
+        doc = next(doc for path, doc in patents if path.name == name)
+        assert res.document.export_to_markdown() == doc.export_to_markdown()
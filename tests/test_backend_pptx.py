@@ -1,8 +1,9 @@
 from pathlib import Path
 
+from docling.datamodel.backend_options import MsPowerpointBackendOptions
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import ConversionResult, DoclingDocument
-from docling.document_converter import DocumentConverter
+from docling.document_converter import DocumentConverter, PowerpointFormatOption
 
 from .test_data_gen_flag import GEN_TEST_DATA
 from .verify_utils import verify_document, verify_export
@@ -53,3 +54,21 @@ def test_e2e_pptx_conversions():
         assert verify_document(doc, str(gt_path) + ".json", GENERATE), (
             "document document"
         )
+
+
+def test_pptx_picture_workers():
+    converter = get_converter()
+    parallel_converter = DocumentConverter(
+        allowed_formats=[InputFormat.PPTX],
+        format_options={
+            InputFormat.PPTX: PowerpointFormatOption(
+                backend_options=MsPowerpointBackendOptions(picture_workers=4)
+            )
+        },
+    )
+
+    for pptx_path in get_pptx_paths():
+        doc = converter.convert(pptx_path).document
+        parallel_doc = parallel_converter.convert(pptx_path).document
+
+        assert parallel_doc.export_to_dict() == doc.export_to_dict()
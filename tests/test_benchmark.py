@@ -0,0 +1,59 @@
+import json
+
+from typer.testing import CliRunner
+
+from docling.cli.tools import app
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.utils.benchmark import (
+    BUNDLED_FIXTURES,
+    bundled_fixtures,
+    run_benchmark,
+    synthetic_fixtures,
+)
+
+runner = CliRunner()
+
+
+def test_bundled_fixtures():
+    assert len(bundled_fixtures("tests/data")) == len(BUNDLED_FIXTURES)
+
+
+def test_run_benchmark():
+    sources = synthetic_fixtures(size=10)
+    report = run_benchmark(sources, repeat=2)
+
+    assert len(report.documents) == 2 * len(sources)
+    assert all(doc.status == ConversionStatus.SUCCESS for doc in report.documents)
+    assert set(report.model_load_time) == {
+        InputFormat.MD,
+        InputFormat.HTML,
+        InputFormat.CSV,
+    }
+    assert report.documents_per_second > 0
+    assert report.stages["doc_build"].count == 2 * len(sources)
+    assert report.stages["doc_build"].p50 <= report.stages["doc_build"].max
+
+
+def test_cli_bench(tmp_path):
+    output = tmp_path / "bench.json"
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            "tests/data/docx/word_sample.docx",
+            "--fixtures-dir",
+            str(tmp_path),
+            "--synthetic-size",
+            "5",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0
+    report = json.loads(output.read_text())
+    assert [doc["name"] for doc in report["documents"]] == [
+        "word_sample.docx",
+        "synthetic.md",
+        "synthetic.html",
+        "synthetic.csv",
+    ]
@@ -1,8 +1,13 @@
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 from typer.testing import CliRunner
 
-from docling.cli.main import app
+from docling.cli.main import _find_input_files, app
+from docling.datamodel.base_models import InputFormat
+from docling.utils.manifest import ConversionManifest
 
 runner = CliRunner()
 
@@ -17,6 +22,79 @@ def test_cli_version():
     assert result.exit_code == 0
 
 
+def test_cli_startup_imports():
+    """Test that the heavy dependencies are not imported when the CLI starts."""
+    heavy_modules = [
+        "torch",
+        "transformers",
+        "easyocr",
+        "rapidocr",
+        "onnxruntime",
+        "docling.document_converter",
+        "docling.pipeline.vlm_pipeline",
+    ]
+    code = (
+        "import sys\n"
+        "import docling.cli.main\n"
+        f"print(','.join(m for m in {heavy_modules!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "", (
+        f"Modules imported at CLI startup: {result.stdout.strip()}"
+    )
+
+
+def test_find_input_files(tmp_path):
+    for name in [
+        "a.pdf",
+        "b.PDF",
+        "c.txt",
+        "~$temp.docx",
+        "sub/d.docx",
+        "sub/e.Docx",
+        "sub/deeper/f.pdf",
+        "books/g.tar.gz",
+        "drafts/h.pdf",
+    ]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    (tmp_path / "dir.pdf").mkdir()
+
+    def find(**kwargs):
+        paths = _find_input_files(
+            tmp_path,
+            [InputFormat.PDF, InputFormat.DOCX, InputFormat.METS_GBS],
+            **kwargs,
+        )
+        return [path.relative_to(tmp_path).as_posix() for path in paths]
+
+    assert find() == [
+        "a.pdf",
+        "b.PDF",
+        "books/g.tar.gz",
+        "drafts/h.pdf",
+        "sub/d.docx",
+        "sub/e.Docx",
+        "sub/deeper/f.pdf",
+    ]
+    assert find(include=["*.pdf"]) == ["a.pdf", "drafts/h.pdf", "sub/deeper/f.pdf"]
+    assert find(exclude=["drafts", "sub/deeper"]) == [
+        "a.pdf",
+        "b.PDF",
+        "books/g.tar.gz",
+        "sub/d.docx",
+        "sub/e.Docx",
+    ]
+    # the patterns are case-sensitive
+    assert find(include=["sub/*"], exclude=["*.docx"]) == [
+        "sub/e.Docx",
+        "sub/deeper/f.pdf",
+    ]
+
+
 def test_cli_convert(tmp_path):
     source = "./tests/data/pdf/2305.03393v1-pg9.pdf"
     output = tmp_path / "out"
@@ -27,6 +105,57 @@ def test_cli_convert(tmp_path):
     assert converted.exists()
 
 
+def test_cli_export_workers(tmp_path):
+    sources = ["./tests/data/docx/word_sample.docx", "./tests/data/md/wiki.md"]
+    output = tmp_path / "out"
+    output.mkdir()
+    result = runner.invoke(
+        app,
+        [
+            *sources,
+            "--to",
+            "md",
+            "--to",
+            "json",
+            "--export-workers",
+            "2",
+            "--output",
+            str(output),
+        ],
+    )
+    assert result.exit_code == 0
+    for source in sources:
+        assert (output / f"{Path(source).stem}.md").exists()
+        assert (output / f"{Path(source).stem}.json").exists()
+
+
+def test_cli_resume(tmp_path):
+    source = tmp_path / "word_sample.docx"
+    source.write_bytes(Path("./tests/data/docx/word_sample.docx").read_bytes())
+    output = tmp_path / "out"
+    args = [str(source), "--to", "md", "--resume", "--output", str(output)]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    manifest = ConversionManifest(output / "docling_manifest.jsonl")
+    assert manifest.is_converted(source)
+    entry = manifest.get(source)
+    assert entry is not None and entry.elapsed is not None and entry.elapsed > 0
+
+    # the converted input is skipped
+    (output / "word_sample.md").unlink()
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert not (output / "word_sample.md").exists()
+
+    # the modified input is converted again
+    os.utime(source, ns=(0, 0))
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert (output / "word_sample.md").exists()
+    assert len((output / "docling_manifest.jsonl").read_text().splitlines()) == 2
+
+
 def test_cli_audio_auto_detection(tmp_path):
     """Test that CLI automatically detects audio files and sets ASR pipeline."""
     from docling.datamodel.base_models import FormatToExtensions, InputFormat
@@ -0,0 +1,153 @@
+import pytest
+import torch
+from PIL import Image
+
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+from docling.datamodel.pipeline_options import LayoutOptions
+from docling.datamodel.settings import settings
+from docling.models.stages.layout.layout_model import LayoutModel
+
+
+@pytest.fixture
+def layout_artifacts(tmp_path, monkeypatch):
+    """A tiny RT-DETR layout model with random weights, as the default layout model"""
+    from transformers import (
+        RTDetrConfig,
+        RTDetrForObjectDetection,
+        RTDetrImageProcessor,
+        RTDetrResNetConfig,
+    )
+
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    torch.manual_seed(0)
+    config = RTDetrConfig(
+        backbone_config=RTDetrResNetConfig(
+            embedding_size=16,
+            hidden_sizes=[32, 64, 128, 256],
+            depths=[1, 1, 1, 1],
+            out_features=["stage2", "stage3", "stage4"],
+        ),
+        d_model=32,
+        encoder_hidden_dim=32,
+        encoder_in_channels=[64, 128, 256],
+        decoder_in_channels=[32, 32, 32],
+        encoder_ffn_dim=64,
+        decoder_ffn_dim=64,
+        encoder_layers=1,
+        decoder_layers=1,
+        encoder_attention_heads=2,
+        decoder_attention_heads=2,
+        num_queries=20,
+        num_denoising=0,
+        num_labels=17,
+        # distinct scores, so that the same queries are selected in both runtimes
+        initializer_range=0.1,
+    )
+    artifacts_path = tmp_path / "artifacts"
+    model_path = artifacts_path / LayoutOptions().model_spec.model_repo_folder
+    RTDetrForObjectDetection(config).save_pretrained(model_path)
+    RTDetrImageProcessor(size={"height": 320, "width": 320}).save_pretrained(model_path)
+    return artifacts_path
+
+
+def requires_onnx():
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+
+
+def test_layout_onnx_runtime(layout_artifacts):
+    requires_onnx()
+    accelerator_options = AcceleratorOptions(device=AcceleratorDevice.CPU)
+    torch_model = LayoutModel(
+        artifacts_path=layout_artifacts,
+        accelerator_options=accelerator_options,
+        options=LayoutOptions(),
+    )
+    onnx_model = LayoutModel(
+        artifacts_path=layout_artifacts,
+        accelerator_options=accelerator_options,
+        options=LayoutOptions(inference_engine="onnxruntime"),
+    )
+    assert list((settings.cache_dir / "onnx").glob("layout-*.onnx"))
+
+    # the exported graph gives the same outputs as PyTorch, with any batch size
+    pixel_values = torch.rand(3, 3, 320, 320)
+    with torch.inference_mode():
+        expected = torch_model.layout_predictor._model(pixel_values=pixel_values)
+        outputs = onnx_model.layout_predictor._model(pixel_values=pixel_values)
+    assert torch.allclose(outputs.logits, expected.logits, atol=1e-4)
+    assert torch.allclose(outputs.pred_boxes, expected.pred_boxes, atol=1e-4)
+
+    images = [Image.new("RGB", (612, 792), "white")] * 2
+    predictions = onnx_model.layout_predictor.predict_batch(images)
+    assert len(predictions) == 2
+
+
+def test_onnx_encoder_cache(tmp_path, monkeypatch):
+    requires_onnx()
+    pytest.importorskip("torchvision")
+    from docling_ibm_models.tableformer.models.table04_rs.encoder04_rs import (
+        Encoder04,
+    )
+
+    from docling.models.utils import onnx_runtime
+
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    weights_path = tmp_path / "tableformer_fast.safetensors"
+    weights_path.write_bytes(b"weights")
+    encoder = Encoder04(enc_image_size=28, enc_dim=256).eval()
+
+    onnx_encoder = onnx_runtime.load_onnx_encoder(
+        encoder, image_size=(448, 448), name="encoder", weights_path=weights_path
+    )
+    images = torch.rand(2, 3, 448, 448)
+    with torch.inference_mode():
+        assert torch.allclose(onnx_encoder(images), encoder(images), atol=1e-4)
+
+    # the cached graph is reused
+    def fail_export(*args, **kwargs):
+        raise AssertionError("The graph was exported again")
+
+    monkeypatch.setattr(onnx_runtime, "export_onnx", fail_export)
+    onnx_runtime.load_onnx_encoder(
+        encoder, image_size=(448, 448), name="encoder", weights_path=weights_path
+    )
+
+
+@pytest.mark.parametrize("inference_engine", ["torch", "onnxruntime"])
+def test_layout_dynamic_quantization(layout_artifacts, inference_engine):
+    if inference_engine == "onnxruntime":
+        requires_onnx()
+    with pytest.warns(UserWarning, match="not validated"):
+        quantized_model = LayoutModel(
+            artifacts_path=layout_artifacts,
+            accelerator_options=AcceleratorOptions(device=AcceleratorDevice.CPU),
+            options=LayoutOptions(
+                inference_engine=inference_engine, dynamic_quantization=True
+            ),
+        )
+    if inference_engine == "onnxruntime":
+        assert list((settings.cache_dir / "onnx").glob("layout-*-int8.onnx"))
+    else:
+        assert any(
+            isinstance(module, torch.ao.nn.quantized.dynamic.Linear)
+            for module in quantized_model.layout_predictor._model.modules()
+        )
+
+    images = [Image.new("RGB", (612, 792), "white")] * 2
+    predictions = quantized_model.layout_predictor.predict_batch(images)
+    assert len(predictions) == 2
+
+
+def test_quantize_linear_layers():
+    from docling.models.utils.quantization import quantize_linear_layers
+
+    torch.manual_seed(0)
+    layer = torch.nn.TransformerDecoderLayer(64, 4, 128, batch_first=True).eval()
+    tgt, memory = torch.rand(2, 10, 64), torch.rand(2, 30, 64)
+    with torch.inference_mode():
+        expected = layer(tgt, memory)
+        quantize_linear_layers(layer)
+        outputs = layer(tgt, memory)
+    assert isinstance(layer.linear1, torch.ao.nn.quantized.dynamic.Linear)
+    assert torch.allclose(outputs, expected, atol=0.05)
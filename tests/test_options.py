@@ -1,5 +1,8 @@
+import gc
+import multiprocessing
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -14,8 +17,13 @@ from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     TableFormerMode,
 )
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.exceptions import ConversionCancelled
+from docling.models.stages.layout.layout_model import LayoutModel
 from docling.pipeline.legacy_standard_pdf_pipeline import LegacyStandardPdfPipeline
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.cancellation import CancellationToken
 
 
 @pytest.fixture
@@ -149,6 +157,105 @@ def test_document_timeout(test_doc_path):
     )
 
 
+def test_cancellation():
+    sources = [
+        Path("tests/data/docx/word_sample.docx"),
+        Path("tests/data/md/wiki.md"),
+    ]
+
+    token = CancellationToken()
+    token.cancel()
+    converter = DocumentConverter()
+    with pytest.raises(ConversionCancelled):
+        converter.convert(sources[0], cancel_token=token)
+    assert list(converter.convert_all(sources, raises_on_error=False)) != []
+
+    # the documents after the cancellation are not converted
+    results = []
+    for result in converter.convert_all(sources, raises_on_error=False):
+        results.append(result)
+        converter.cancel()
+    assert len(results) == 1
+    assert results[0].status == ConversionStatus.SUCCESS
+
+    # a conversion cancelled during the pipeline fails with an error
+    conv_res = converter.convert(sources[0])
+    pipeline = converter._get_pipeline(InputFormat.DOCX)
+    assert pipeline is not None
+    result = pipeline.execute(conv_res.input, raises_on_error=False, cancel_token=token)
+    assert result.status == ConversionStatus.FAILURE
+    assert result.errors[0].error_message == "The conversion was cancelled."
+
+
+@pytest.fixture
+def unfreeze_gc():
+    # also undoes the freeze if the test fails before ending the preload
+    yield
+    gc.unfreeze()
+
+
+def _convert_in_worker(converter: DocumentConverter, source: Path, conn) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("The worker must not load the models again")
+
+    # loading a pipeline or a model fails in the worker
+    with patch.object(StandardPdfPipeline, "_init_models", fail):
+        with patch.object(LayoutModel, "__init__", fail):
+            conv_res = converter.convert(source)
+    conn.send(conv_res.status)
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork is not available",
+)
+def test_preload_for_workers(unfreeze_gc):
+    pipeline_options = PdfPipelineOptions(do_ocr=False, do_table_structure=False)
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+    try:
+        converter.preload_for_workers([InputFormat.PDF])
+    except Exception as exc:
+        pytest.skip(f"The layout model is not available: {exc}")
+    assert gc.get_freeze_count() > 0
+
+    ctx = multiprocessing.get_context("fork")
+    source = Path("tests/data/pdf/multi_page.pdf")
+    workers = []
+    for _ in range(2):
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        worker = ctx.Process(
+            target=_convert_in_worker, args=(converter, source, send_conn)
+        )
+        worker.start()
+        workers.append((worker, recv_conn))
+
+    # the parent collects its objects again once the workers are forked
+    converter.end_preload_for_workers()
+    assert gc.get_freeze_count() == 0
+
+    for worker, recv_conn in workers:
+        worker.join(timeout=120)
+        # the worker converted the document with the models preloaded by the parent
+        assert worker.exitcode == 0
+        assert recv_conn.recv() == ConversionStatus.SUCCESS
+
+
+def test_warm_up():
+    converter = DocumentConverter()
+    report = converter.warm_up([InputFormat.MD, InputFormat.DOCX])
+
+    assert set(report.load_time) == {InputFormat.MD, InputFormat.DOCX}
+    # there is no synthetic DOCX document, the pipeline is only initialized
+    assert set(report.stage_times) == {InputFormat.MD}
+    assert report.stage_times[InputFormat.MD]["doc_build"] > 0
+    assert report.conversion_time[InputFormat.MD] > 0
+    assert not settings.debug.profile_pipeline_timings
+
+
 def test_ocr_coverage_threshold(test_doc_path):
     pipeline_options = PdfPipelineOptions()
     pipeline_options.do_ocr = True
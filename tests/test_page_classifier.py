@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+from docling_core.types.doc import DocItemLabel
+
+from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import LayoutOptions, PageClassifierOptions
+from docling.models.stages.page_assemble.page_assemble_model import (
+    PageAssembleModel,
+    PageAssembleOptions,
+)
+from docling.models.stages.page_classifier.page_classifier_model import (
+    PageClassifierModel,
+)
+from docling.models.stages.page_preprocessing.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+
+
+def classify_pages(
+    path: Path, options: PageClassifierOptions
+) -> tuple[ConversionResult, list[Page]]:
+    in_doc = InputDocument(
+        path_or_stream=path,
+        format=InputFormat.PDF,
+        backend=DoclingParseV4DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    preprocessing_model = PagePreprocessingModel(
+        options=PagePreprocessingOptions(images_scale=1.0)
+    )
+    classifier = PageClassifierModel(
+        enabled=True, options=options, layout_options=LayoutOptions()
+    )
+
+    pages = []
+    for page_no in range(in_doc.page_count):
+        page = Page(page_no=page_no)
+        page._backend = in_doc._backend.load_page(page_no)
+        page.size = page._backend.get_size()
+        pages.append(page)
+    return conv_res, list(classifier(conv_res, preprocessing_model(conv_res, pages)))
+
+
+def test_simple_pages():
+    conv_res, pages = classify_pages(
+        Path("tests/data/pdf/multi_page.pdf"), PageClassifierOptions()
+    )
+    pages = list(PageAssembleModel(PageAssembleOptions())(conv_res, pages))
+
+    for page in pages:
+        assert page.predictions.layout is not None
+        # all the text of the page is assembled
+        assert page.assembled is not None
+        num_cells = sum(len(el.cluster.cells) for el in page.assembled.elements)
+        assert num_cells == len([c for c in page.cells if c.text.strip()])
+
+    labels = {
+        cluster.label
+        for page in pages
+        for cluster in page.predictions.layout.clusters  # type: ignore[union-attr]
+    }
+    assert labels == {
+        DocItemLabel.SECTION_HEADER,
+        DocItemLabel.TEXT,
+        DocItemLabel.LIST_ITEM,
+    }
+    first_clusters = pages[0].predictions.layout.clusters  # type: ignore[union-attr]
+    assert first_clusters[0].label == DocItemLabel.SECTION_HEADER
+    assert first_clusters[0].cells[0].text == "The Evolution of the Word Processor"
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        # code and formulas
+        "code_and_formula.pdf",
+        # two columns and a table
+        "2305.03393v1-pg9.pdf",
+        # pictures
+        "amt_handbook_sample.pdf",
+    ],
+)
+def test_complex_pages(name):
+    _, pages = classify_pages(Path("tests/data/pdf") / name, PageClassifierOptions())
+    assert all(page.predictions.layout is None for page in pages)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        PageClassifierOptions(min_cells=1000),
+        PageClassifierOptions(min_parse_score=1.1),
+        # the inline bold words of the list items are split cells
+        PageClassifierOptions(max_line_gap_ratio=-1.0),
+    ],
+)
+def test_page_classifier_options(options):
+    _, pages = classify_pages(Path("tests/data/pdf/multi_page.pdf"), options)
+    # the last page is a single paragraph, without split lines
+    assert all(page.predictions.layout is None for page in pages[:-1])
@@ -0,0 +1,76 @@
+import json
+from datetime import datetime, timedelta
+
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter
+from docling.utils.profiling import (
+    ProfilingItem,
+    ProfilingScope,
+    to_chrome_trace,
+    to_prometheus,
+)
+
+
+def get_timings():
+    start = datetime(2025, 1, 1)
+    return {
+        "page_parse": ProfilingItem(
+            scope=ProfilingScope.PAGE,
+            count=2,
+            times=[0.5, 1.5],
+            start_timestamps=[start, start + timedelta(seconds=1)],
+            thread_ids=[1, 2],
+            page_nos=[1, 2],
+        ),
+        "doc_build": ProfilingItem(
+            scope=ProfilingScope.DOCUMENT,
+            count=1,
+            times=[3.0],
+            start_timestamps=[start],
+            thread_ids=[1],
+            page_nos=[None],
+        ),
+    }
+
+
+def test_chrome_trace():
+    trace = to_chrome_trace(get_timings(), process_name="test.pdf")
+    events = trace["traceEvents"]
+
+    assert events[0]["ph"] == "M"
+    assert events[0]["args"] == {"name": "test.pdf"}
+
+    spans = [ev for ev in events if ev["ph"] == "X"]
+    assert [(ev["name"], ev["ts"], ev["dur"], ev["tid"]) for ev in spans] == [
+        ("page_parse", 0.0, 0.5e6, 1),
+        ("page_parse", 1e6, 1.5e6, 2),
+        ("doc_build", 0.0, 3e6, 1),
+    ]
+    assert spans[1]["args"] == {"page_no": 2}
+    assert "args" not in spans[2]
+    json.dumps(trace)
+
+
+def test_prometheus():
+    metrics = to_prometheus(get_timings(), labels={"document": 'a "b".pdf'})
+    lines = metrics.splitlines()
+
+    assert "# TYPE docling_stage_duration_seconds summary" in lines
+    labels = 'document="a \\"b\\".pdf",stage="page_parse",scope="page"'
+    assert f"docling_stage_duration_seconds_sum{{{labels}}} 2.0" in lines
+    assert f"docling_stage_duration_seconds_count{{{labels}}} 2" in lines
+    assert f'docling_stage_duration_seconds{{{labels},quantile="0.5"}} 1.0' in lines
+
+
+def test_recorded_timings(monkeypatch):
+    monkeypatch.setattr(settings.debug, "profile_pipeline_timings", True)
+    conv_res = DocumentConverter().convert("tests/data/docx/word_sample.docx")
+
+    for item in conv_res.timings.values():
+        assert item.count == len(item.times)
+        assert len(item.thread_ids) == len(item.times)
+        assert len(item.page_nos) == len(item.times)
+
+    trace = to_chrome_trace(conv_res.timings)
+    names = {ev["name"] for ev in trace["traceEvents"]}
+    assert "doc_build" in names
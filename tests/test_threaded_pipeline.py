@@ -1,19 +1,48 @@
 import logging
+import threading
 import time
 from pathlib import Path
 from typing import List
 
+import numpy as np
 import pytest
+from docling_core.types.doc import BoundingBox, DocItemLabel, Size
 
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-from docling.datamodel.base_models import ConversionStatus, InputFormat
-from docling.datamodel.document import ConversionResult
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cluster,
+    ContainerElement,
+    ConversionStatus,
+    FigureElement,
+    InputFormat,
+    LayoutPrediction,
+    Page,
+    PageConfidenceScores,
+    Table,
+    TextElement,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
 from docling.datamodel.pipeline_options import (
     PdfPipelineOptions,
     ThreadedPdfPipelineOptions,
 )
 from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.exceptions import ConversionCancelled
+from docling.models.stages.page_preprocessing.page_preprocessing_model import (
+    PagePreprocessingModel,
+    PagePreprocessingOptions,
+)
+from docling.pipeline.standard_pdf_pipeline import (
+    PageCheckpointStore,
+    PageMemoryBudget,
+    PreprocessThreadedStage,
+    StandardPdfPipeline,
+    ThreadedItem,
+    ThreadedPipelineStage,
+    ThreadedQueue,
+    _has_layout,
+)
 from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
 
 
@@ -193,6 +222,366 @@ def test_pypdfium_threaded_pipeline():
     print("All done!")
 
 
+def get_conv_res() -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=Path("tests/data/pdf/multi_page.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    in_doc._backend.unload()
+    return ConversionResult(input=in_doc)
+
+
+def test_threaded_stage_metrics():
+    """Test the queue and utilization metrics of a threaded stage"""
+
+    def model(conv_res, pages):
+        time.sleep(0.01)
+        yield from pages
+
+    conv_res = get_conv_res()
+    stage = ThreadedPipelineStage(
+        name="dummy",
+        model=model,
+        batch_size=4,
+        batch_timeout=0.01,
+        queue_max_size=8,
+    )
+    output_q = ThreadedQueue(2)
+    stage.add_output_queue(output_q)
+
+    for item in make_items(conv_res, 8):
+        assert stage.input_queue.put(item)
+    stage.input_queue.close()
+    stage.start()
+
+    # drain slowly, so that the stage is blocked by the full output queue
+    received = []
+    while len(received) < 8:
+        time.sleep(0.02)
+        received.extend(output_q.get_batch(8, timeout=1.0))
+    stage.stop()
+
+    metrics = stage.metrics()
+    assert metrics.items == 8
+    assert metrics.batches == 2
+    assert metrics.max_batch_size == 4
+    assert metrics.mean_batch_size == 4.0
+    assert metrics.process_time > 0
+    assert metrics.blocked_time > 0
+    assert 0 < metrics.utilization < 1
+    assert metrics.input_queue is not None
+    assert metrics.input_queue.max_size == 8
+    assert metrics.input_queue.max_depth == 8
+    assert 0 < metrics.input_queue.mean_depth <= 8
+
+
+def make_items(conv_res: ConversionResult, n: int) -> List[ThreadedItem]:
+    return [
+        ThreadedItem(
+            payload=Page(page_no=page_no), run_id=1, page_no=page_no, conv_res=conv_res
+        )
+        for page_no in range(n)
+    ]
+
+
+def make_stage(name: str, model, **kwargs) -> ThreadedPipelineStage:
+    kwargs = {"batch_size": 1, "batch_timeout": 0.01, "queue_max_size": 8, **kwargs}
+    return ThreadedPipelineStage(name=name, model=model, **kwargs)
+
+
+def run_stages(stages: List[ThreadedPipelineStage], items: List[ThreadedItem]):
+    for upstream, downstream in zip(stages, stages[1:]):
+        upstream.add_output_queue(downstream.input_queue)
+    output_q = ThreadedQueue(len(items))
+    stages[-1].add_output_queue(output_q)
+    for item in items:
+        assert stages[0].input_queue.put(item)
+    stages[0].input_queue.close()
+    for stage in stages:
+        stage.start()
+
+    received: List[ThreadedItem] = []
+    while len(received) < len(items):
+        received.extend(output_q.get_batch(len(items), timeout=1.0))
+    for stage in stages:
+        stage.stop()
+    return sorted(received, key=lambda itm: itm.page_no)
+
+
+def test_threaded_stage_page_timeout():
+    """Test that a page over the per-page time budget is failed at the next stage"""
+
+    def slow_model(conv_res, pages):
+        for page in pages:
+            if page.page_no == 1:
+                time.sleep(0.2)
+            yield page
+
+    def model(conv_res, pages):
+        yield from pages
+
+    stages = [
+        make_stage("slow", slow_model, page_timeout=0.1),
+        make_stage("next", model, page_timeout=0.1),
+    ]
+    received = run_stages(stages, make_items(get_conv_res(), 3))
+
+    assert [itm.is_failed for itm in received] == [False, True, False]
+    assert "page timeout exceeded" in str(received[1].error)
+    assert received[1].elapsed >= 0.2
+    assert received[0].elapsed < 0.1
+
+
+def test_threaded_stage_batch_page_timeout():
+    """Test that a slow page fails alone, before the next model gets it"""
+
+    def slow_model(conv_res, pages):
+        for page in pages:
+            if page.page_no == 1:
+                time.sleep(0.2)
+            yield page
+
+    processed: List[int] = []
+
+    def model(conv_res, pages):
+        for page in pages:
+            processed.append(page.page_no)
+            yield page
+
+    stages = [
+        make_stage("slow", slow_model, batch_size=3, page_timeout=0.1),
+        make_stage("next", model, batch_size=3, page_timeout=0.1),
+    ]
+    received = run_stages(stages, make_items(get_conv_res(), 3))
+
+    # the pages of the batch are charged their own time only
+    assert [itm.is_failed for itm in received] == [False, True, False]
+    assert "page timeout exceeded" in str(received[1].error)
+    assert received[0].elapsed < 0.1
+    assert received[2].elapsed < 0.1
+    assert sorted(processed) == [0, 2]
+
+
+def test_threaded_stage_skip():
+    """Test that the pages with a layout from the page classifier skip the models"""
+
+    def classifier(conv_res, pages):
+        for page in pages:
+            if page.page_no % 2 == 0:
+                page.predictions.layout = LayoutPrediction()
+            yield page
+
+    processed: List[int] = []
+
+    def model(conv_res, pages):
+        for page in pages:
+            processed.append(page.page_no)
+            yield page
+
+    stages = [
+        make_stage("page_classifier", classifier, batch_size=4),
+        make_stage("layout", model, batch_size=4, skip=_has_layout),
+    ]
+    received = run_stages(stages, make_items(get_conv_res(), 5))
+
+    assert [itm.page_no for itm in received] == [0, 1, 2, 3, 4]
+    assert not any(itm.is_failed for itm in received)
+    assert sorted(processed) == [1, 3]
+
+
+def test_threaded_stage_cancellation():
+    """Test that the pages of a cancelled conversion are failed by the stages"""
+
+    conv_res = get_conv_res()
+
+    def model(conv_res, pages):
+        for page in pages:
+            conv_res._cancel_token.cancel()
+            yield page
+
+    stages = [make_stage("dummy", model, batch_size=4)]
+    received = run_stages(stages, make_items(conv_res, 3))
+
+    # the cancellation is checked between the pages of a batch
+    assert all(itm.is_failed for itm in received)
+    assert all(isinstance(itm.error, ConversionCancelled) for itm in received)
+
+
+def test_page_memory_budget():
+    """Test the admission of the pages under a memory budget"""
+    budget = PageMemoryBudget(max_bytes=100)
+    budget.wait_for_room(lambda: True, poll_interval=0.01)  # nothing in flight
+
+    budget.reserve(1, 0, 80)
+    budget.wait_for_room(lambda: True, poll_interval=0.01)  # below the budget
+    budget.reserve(1, 1, 50)
+    assert budget.high_water_mark == 130
+
+    admitted = threading.Event()
+
+    def admit():
+        budget.wait_for_room(lambda: True, poll_interval=0.01)
+        admitted.set()
+
+    thread = threading.Thread(target=admit)
+    thread.start()
+    assert not admitted.wait(0.1)
+    budget.release(1, 0)
+    assert admitted.wait(1.0)
+    thread.join()
+
+    budget.release(1, 1)
+    budget.release(1, 1)  # released pages are ignored
+    assert budget.high_water_mark == 130
+    assert budget._total == 0
+
+    # the runs share the budget, and the pages left by a run are released with it
+    budget.reserve(1, 0, 60)
+    budget.reserve(2, 0, 60)
+    assert budget._total == 120
+    assert budget.run_high_water_mark(1) == 130
+    assert budget.run_high_water_mark(2) == 60
+    budget.release_run(1)
+    assert budget._total == 60
+    assert budget.high_water_mark == 130
+    # the peak of a released run is dropped
+    assert budget.run_high_water_mark(1) == 0
+    assert budget.run_high_water_mark(2) == 60
+
+
+def test_preprocess_stage_memory_budget():
+    """Test that the preprocess stage reports the memory of the pages in flight"""
+    in_doc = InputDocument(
+        path_or_stream=Path("tests/data/pdf/multi_page.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    budget = PageMemoryBudget(max_bytes=1)
+    stage = PreprocessThreadedStage(
+        batch_timeout=0.01,
+        queue_max_size=10,
+        model=PagePreprocessingModel(
+            options=PagePreprocessingOptions(images_scale=1.0)
+        ),
+        memory_budget=budget,
+    )
+    output_q = ThreadedQueue(10)
+    stage.add_output_queue(output_q)
+    for item in make_items(conv_res, in_doc.page_count):
+        stage.input_queue.put(item)
+    stage.input_queue.close()
+    stage.start()
+
+    # one page is admitted at a time, the next one once it is released
+    received = []
+    while len(received) < in_doc.page_count:
+        batch = output_q.get_batch(10, timeout=1.0)
+        assert len(batch) == 1
+        budget.release(batch[0].run_id, batch[0].page_no)
+        received.extend(batch)
+    stage.stop()
+    in_doc._backend.unload()
+
+    metrics = stage.metrics()
+    assert metrics.items == in_doc.page_count
+    # a rendered letter page is at least 612 x 792 RGB pixels
+    assert metrics.memory_high_water >= 612 * 792 * 3
+
+
+def test_page_checkpoint_store(tmp_path):
+    """Test that the checkpointed pages are restored with their assembled elements"""
+    cluster = Cluster(
+        id=1, label=DocItemLabel.FORM, bbox=BoundingBox(l=0, t=0, r=10, b=10)
+    )
+    common = {"label": DocItemLabel.FORM, "id": 1, "page_no": 3, "cluster": cluster}
+    elements = [
+        ContainerElement(**common),
+        FigureElement(**common),
+        TextElement(text="text", **common),
+        Table(otsl_seq=["fcel", "nl"], table_cells=[], **common),
+    ]
+    page = Page(
+        page_no=3,
+        size=Size(width=10, height=10),
+        assembled=AssembledUnit(elements=elements, body=elements[2:], headers=[]),
+    )
+
+    confidence = PageConfidenceScores(parse_score=0.9, layout_score=0.8)
+
+    store = PageCheckpointStore(tmp_path / "doc")
+    assert store.load(3) is None
+    store.save(page, confidence)
+    loaded = store.load(3)
+
+    assert loaded is not None
+    restored, restored_confidence = loaded
+    assert restored_confidence.parse_score == 0.9
+    assert restored_confidence.layout_score == 0.8
+    assert np.isnan(restored_confidence.table_score)
+    assert restored.size == page.size
+    assert restored.assembled == page.assembled
+    assert [type(el) for el in restored.assembled.elements] == [
+        ContainerElement,
+        FigureElement,
+        TextElement,
+        Table,
+    ]
+
+    # a truncated checkpoint is ignored
+    store._page_path(3).write_text("{")
+    assert store.load(3) is None
+
+    store.remove()
+    assert not store.directory.exists()
+
+
+def test_checkpoint_resume(tmp_path, monkeypatch):
+    """Test that a conversion resumed from the checkpoints matches the full one"""
+    source = Path("tests/data/pdf/multi_page.pdf")
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=StandardPdfPipeline,
+                pipeline_options=ThreadedPdfPipelineOptions(
+                    do_ocr=False, checkpoint_dir=tmp_path
+                ),
+            )
+        }
+    )
+    try:
+        converter.initialize_pipeline(InputFormat.PDF)
+    except Exception as exc:
+        pytest.skip(f"The layout and table models are not available: {exc}")
+
+    # the checkpoints of an interrupted run are kept
+    with monkeypatch.context() as m:
+        m.setattr(PageCheckpointStore, "remove", lambda self: None)
+        full = converter.convert(source)
+    assert full.status == ConversionStatus.SUCCESS
+    checkpoints = sorted(tmp_path.glob("*/page_*.json"))
+    assert len(checkpoints) == len(full.pages)
+
+    # the first page is processed again, the others are restored
+    checkpoints[0].unlink()
+    resumed = converter.convert(source)
+
+    assert resumed.status == ConversionStatus.SUCCESS
+    # the scores are compared in JSON, where NaN is null
+    assert {
+        page_no: scores.model_dump_json()
+        for page_no, scores in resumed.confidence.pages.items()
+    } == {
+        page_no: scores.model_dump_json()
+        for page_no, scores in full.confidence.pages.items()
+    }
+    assert resumed.document.export_to_markdown() == full.document.export_to_markdown()
+
+    # the checkpoints are deleted once the document is fully converted
+    assert list(tmp_path.iterdir()) == []
+
+
 if __name__ == "__main__":
     # Run basic performance test
     test_pipeline_comparison()